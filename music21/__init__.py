@@ -92,6 +92,43 @@ __all__ = ['base',
 #from music21.analysis import *
 
 
+#------------------------------------------------------------------------------
+# the __all__ names are not imported here, so that "import music21" and 
+# "from music21 import note" load only the modules they need. Instead, the 
+# music21 package is replaced by a module that imports each name on first 
+# attribute access, so that music21.stream, for example, remains available 
+# after "import music21". "from music21 import *" imports all names.
+
+import sys as _sys
+import types as _types
+
+# in order for sax parsing in musicxml to properly handle unicode strings 
+# w/ unicode chars, the default encoding must be utf-8; this is done here, 
+# once, as reloading sys after import (such as when musicxml is first 
+# imported) replaces sys.stdout 
+# http://stackoverflow.com/questions/857597/setting-the-encoding-for-sax-parser-in-python
+if _sys.getdefaultencoding() != 'utf-8':
+    reload(_sys)
+    _sys.setdefaultencoding('utf-8')
+
+class _LazyPackage(_types.ModuleType):
+    '''The music21 package, importing submodules and subpackages named in __all__ on first access.
+    '''
+    def __getattr__(self, name):
+        if name not in self.__all__:
+            raise AttributeError("'module' object has no attribute '%s'" % name)
+        __import__('music21.' + name)
+        return _sys.modules['music21.' + name]
+
+# the replacement is made before importing base, so that all modules that 
+# import music21 get it; names defined below are copied to it at the end
+_lazyPackage = _LazyPackage(__name__, __doc__)
+_lazyPackage.__dict__.update(_sys.modules[__name__].__dict__)
+# keep the original package, as functions defined here use its namespace, 
+# which python 2 clears when a module is deleted
+_lazyPackage._package = _sys.modules[__name__]
+_sys.modules[__name__] = _lazyPackage
+
 #-------------------------------------------------------------------------------
 # base Music21Object -- all objects should inherit from this!
 
@@ -100,15 +137,17 @@ from base import *
 
 #-------------------------------------------------------------------------------
 # place the parse function directly in the music21 namespace
-# this cannot go in music21/base.py
+# this cannot go in music21/base.py; converter is imported when first called, 
+# as it imports nearly all other modules
 
-import converter
-parse = converter.parse
+def parse(value, *args, **keywords):
+    '''Parse a file path, URL, or string of music data into a Stream: see :func:`~music21.converter.parse`.
+    '''
+    from music21 import converter
+    return converter.parse(value, *args, **keywords)
 
 
-#------------------------------------------------------------------------------
-# this bring all of the __all__ names into the music21 package namespace
-from music21 import *
+_lazyPackage.__dict__.update(_lazyPackage._package.__dict__)
 
 #------------------------------------------------------------------------------
 # eof
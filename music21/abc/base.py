@@ -23,6 +23,7 @@ Low level ABC conversion is facilitated by the objects in this module and :func:
 import music21
 import unittest
 import re, codecs
+import os
 
 try:
     import StringIO # python 2 
@@ -60,6 +61,9 @@ ABC_BARS = [
 # store a mapping of ABC representation to pitch values
 _pitchTranslationCache = {}
 
+# store reference number indices of ABC files, keyed by file path
+_referenceNumberIndexCache = {}
+
 
 #-------------------------------------------------------------------------------
 # note inclusion of w: for lyrics
@@ -67,6 +71,44 @@ reMetadataTag = re.compile('[A-Zw]:')
 rePitchName = re.compile('[a-gA-Gz]')
 reChordSymbol = re.compile('"[^"]*"') # non greedy
 reChord = re.compile('[.*?]') # non greedy
+reDurationChars = re.compile('[\\d/]', re.UNICODE)
+
+# a note event: a pitch alpha, or ornaments and accidentals that may precede
+# a pitch alpha, followed by register modifiers and rhythm numbers
+# H is fermata, L is accent, T is trill; S might be a segno
+_reNoteSrc = (r"(?:(?![uvHLTS])%(alpha)s[\d,/']*|"
+              r"[~^=_.uvHLTS][~^=_.uvHLTS\d,/']*"
+              r"(?:(?![~wuvhHLTSN])%(alpha)s[\d,/']*)?)")
+# groups are tried in order, as in ABCHandler.tokenize(); 
+# metadata is a capital alpha or w (lyric defs) followed by ':', but not 
+# by '|', which would be a repeat bar
+_reTokenizeSrc = (r"(?P<comment>%%[^\n]*\n?)|"
+    r"(?P<metadata>%(metadataAlpha)s:(?=[^|])[^\n]*\n?)|"
+    r"(?P<bar>:\|[12]|\|\]|\|\||\[\||\[[12]|\|[12]|:\||\|:|::|\||:)|"
+    r"(?P<tuplet>\(\d)|"
+    r"(?P<brokenRhythm>[<>](?:[<>](?=[\s\S]))*)|"
+    r"(?P<chordSymbol>\"[^\"]*\"?)|"
+    r"(?P<chord>\[[^\]]*\]?)|"
+    r"(?P<note>%(note)s)|"
+    r"(?P<space>\s+)")
+
+reTokenize = re.compile(_reTokenizeSrc % {'metadataAlpha': '[A-Zw]', 
+    'note': _reNoteSrc % {'alpha': '[a-zA-Z]'}})
+# for unicode strings, non-ascii alphas may be metadata (if upper case) or 
+# notes; case is tested when tokenizing
+reTokenizeUnicode = re.compile(_reTokenizeSrc % {
+    'metadataAlpha': '(?:[A-Zw]|[^\\x00-\\x7f])', 
+    'note': _reNoteSrc % {'alpha': '[^\\W\\d_]'}}, re.UNICODE)
+reNoteUnicode = re.compile(_reNoteSrc % {'alpha': '[^\\W\\d_]'}, re.UNICODE)
+
+# note event strings that are not supported, or that result from encoding 
+# errors, and are not made into ABCNote objects
+_noteStrSkip = set(['w', 'u', 'v', 'v.', 'h', 'H', 'vk', 'k', 
+    'uk', 'U', '~',
+    '.', '=', 'V', 'v.', 'S', 's', 'i', 'I', 'ui', 'u.', 'K', 'Q', 'Hy', 'Hx', 
+    'r', 'm', 'M', 'n', 'N', 'o', 
+    'l', 'L', 'R',
+    'y', 'T', 't', 'x', 'Z'])
 
 
 #-------------------------------------------------------------------------------
@@ -924,6 +966,8 @@ class ABCNote(ABCToken):
         # set with parse() based on all other contextual 
         self.pitchName = None # if None, a rest or chord
         self.quarterLength = None
+        # if split from chord symbols when tokenized, the remaining string
+        self._nonChordSymStr = None
 
 
     def __repr__(self):
@@ -1118,12 +1162,7 @@ class ABCNote(ABCToken):
         if activeDefaultQuarterLength == None:
             raise ABCTokenException('cannot calculate quarter length without a default quarter length')
 
-        numStr = []
-        for c in strSrc:
-            if c.isdigit() or c in '/':
-                numStr.append(c)
-        numStr = ''.join(numStr)
-        numStr = numStr.strip()
+        numStr = ''.join(reDurationChars.findall(strSrc))
 
         #environLocal.pd(['numStr', numStr])
 
@@ -1193,7 +1232,11 @@ class ABCNote(ABCToken):
     def parse(self, forceDefaultQuarterLength=None, 
                     forceKeySignature=None):
         #environLocal.pd(['parse', self.src])
-        self.chordSymbols, nonChordSymStr = self._splitChordSymbols(self.src)        
+        if self._nonChordSymStr is not None:
+            nonChordSymStr = self._nonChordSymStr
+        else:
+            self.chordSymbols, nonChordSymStr = self._splitChordSymbols(
+                                                self.src)
         # get pitch name form remaining string
         # rests will have a pitch name of None
 
@@ -1389,178 +1432,55 @@ class ABCHandler(object):
 
         This may be called separately from process(), in the case 
         that pre/post parse processing is not needed. 
+
+        All token types are matched with a single compiled expression; 
+        chord symbols are split from note events as they are tokenized. 
+
+        >>> from music21 import *
+        >>> ah = abc.ABCHandler()
+        >>> ah.tokenize('L:1/8\\n"Am"A2 [ce]|:(3Bcd>e % end\\n')
+        >>> ah._tokens
+        [<ABCMetadata 'L:1/8'>, <ABCNote '"Am"A2'>, <ABCChord '[ce]'>, <ABCBar '|:'>, <ABCTuplet '(3'>, <ABCNote 'B'>, <ABCNote 'c'>, <ABCNote 'd'>, <ABCBrokenRhythmMarker '>'>, <ABCNote 'e'>]
+        >>> ah._tokens[1].chordSymbols
+        ['"Am"']
         '''
-        i = 0
-        collect = []
+        if isinstance(strSrc, unicode):
+            match = reTokenizeUnicode.match
+        else:
+            match = reTokenize.match
+        tokens = self._tokens
         lastIndex = len(strSrc) - 1
 
+        i = 0
         activeChordSymbol = '' # accumulate, then prepend
-        while True:    
-            if i > lastIndex:
-                break
-
-            q = self._getLinearContext(strSrc, i)
-            cPrev, c, cNext, cNextNext = q
-            #cPrevNotSpace, cPrev, c, cNext, cNextNotSpace, cNextNext = q
-            
-            # comment lines, also encoding defs
-            if c == '%':
-                j = self._getNextLineBreak(strSrc, i)
-                #environLocal.printDebug(['got comment:', repr(strSrc[i:j+1])])
-                i = j+1 # skip \n char
-                continue
-
-            # metadata: capatal alpha, with next char as ':'
-            # or w: (lyric defs)
-            # some meta data might have bar symbols, for example
-            # need to not misinterpret repeat bars as meta
-            # e.g. dAG FED:|2 dAG FGA| this is incorrect, but can avoid by
-            # looking for a leading pipe
-            if (((c.isalpha() and c.isupper()) or c in 'w')
-                and cNext != None and cNext == ':' and 
-                cNextNext != None and cNextNext not in '|'):
-                # collect until end of line; add one to get line break
-                j = self._getNextLineBreak(strSrc, i) + 1
-                collect = strSrc[i:j].strip()
-                #environLocal.printDebug(['got metadata:', repr(''.join(collect))])
-                self._tokens.append(ABCMetadata(collect))
-                i = j
+        chordSymbols = []
+        while i <= lastIndex:
+            m = match(strSrc, i)
+            if m is None: # no action: normal continuation of 1 char
+                i += 1
                 continue
-            
-            # get bars: if not a space and not alphanemeric
-            if (not c.isspace() and not c.isalnum()
-                and c not in ['~', '(']):
-                matchBars = False
-                for barIndex in range(len(ABC_BARS)):
-                    # first of bars tuple is symbol to match
-                    # three possible sizes of bar indications: 3, 2, 1
-                    barTokenArchetype = ABC_BARS[barIndex][0]
-                    if len(barTokenArchetype) == 3:
-                        if cNextNext is not None and (c + cNext + cNextNext == barTokenArchetype):
-                            j = i + 3
-                            matchBars = True 
-                            break
-                    elif cNext is not None and (len(barTokenArchetype) == 2):
-                        if c + cNext == barTokenArchetype:
-                            j = i + 2
-                            matchBars = True 
-                            break
-                    elif len(barTokenArchetype) == 1:
-                        if c == barTokenArchetype:
-                            j = i + 1
-                            matchBars = True 
-                            break
-                if matchBars:
-                    collect = strSrc[i:j]
-                    # filter and replace with 2 tokens if necessary
-                    for tokenSub in self._barlineTokenFilter(collect):
-                        self._tokens.append(tokenSub)
-                    #environLocal.printDebug(['got bars:', repr(collect)])  
-#                     if collect == '::':
-#                         # create a start and and an end
-#                         self._tokens.append(ABCBar(':|'))
-#                         self._tokens.append(ABCBar('|:'))
-#                     else:
-#                         self._tokens.append(ABCBar(collect))
+            kind = m.lastgroup
+            j = m.end()
+            if kind == 'metadata':
+                c = strSrc[i]
+                if c == 'w' or c.isupper():
+                    tokens.append(ABCMetadata(strSrc[i:j].strip()))
                     i = j
                     continue
-                    
-            # get tuplet indicators: (2, (3
-            # TODO: extended tuplets look like this: (p:q:r or (3::
-            if (c == '(' and cNext != None and cNext.isdigit()):
-                j = i + 2 # always two characters
-                collect = strSrc[i:j]
-                #environLocal.printDebug(['got tuplet start:', repr(collect)])
-                self._tokens.append(ABCTuplet(collect))
-                i = j
-                continue
-
-            # get broken rhythm modifiers: < or >, >>, up to <<<
-            if c in '<>':
-                j = i + 1
-                while (j < lastIndex and strSrc[j] in '<>'):
-                    j += 1
-                collect = strSrc[i:j]
-                #environLocal.printDebug(['got bidrectional rhythm mod:', repr(collect)])
-                self._tokens.append(ABCBrokenRhythmMarker(collect))
-                i = j
-                continue
-
-            # get chord symbols / guitar chords; collected and joined with
-            # chord or notes
-            if (c == '"'):
-                j = i + 1
-                while (j < lastIndex and strSrc[j] not in '"'):
-                    j += 1
-                j += 1 # need character that caused break
-                # there may be more than one chord symbol: need to accumulate
-                activeChordSymbol += strSrc[i:j]
-                #environLocal.printDebug(['got chord symbol:', repr(activeChordSymbol)])
-                i = j
-                continue
-
-            # get chords
-            if (c == '['):
-                j = i + 1
-                while (j < lastIndex and strSrc[j] not in ']'):
-                    j += 1
-                j += 1 # need character that caused break
-                # prepend chord symbol
-                if activeChordSymbol != '':
-                    collect = activeChordSymbol+strSrc[i:j]
-                    activeChordSymbol = '' # reset
-                else:
-                    collect = strSrc[i:j]
-
-                #environLocal.printDebug(['got chord:', repr(collect)])
-                self._tokens.append(ABCChord(collect))
-
-                i = j
-                continue
+                # a non-ascii alpha that is not upper case
+                m = reNoteUnicode.match(strSrc, i)
+                if m is None:
+                    i += 1
+                    continue
+                kind = 'note'
+                j = m.end()
 
-            # get the start of a note event: alpha, or 
-            # ~ tunr/ornament, accidentals ^, =, - as well as ^^
-            if (c.isalpha() or c in '~^=_.'):
-                # condition where we start with an alpha that is not an alpha
-                # that comes before a pitch indication
-                # H is fermata, L is accent, T is trill
-                # not sure what S is, but josquin/laPlusDesPlus.abc
-                # uses it before pitches; might be a segno
-                foundPitchAlpha = c.isalpha() and c not in 'uvHLTS'
-                j = i + 1
-
-                while True:
-                    if j > lastIndex:
-                        break    
-                    # if we have not found pitch alpha
-                    # ornaments may precede note names
-                    # accidentals (^=_) staccato (.), up/down bow (u, v)
-                    elif (foundPitchAlpha == False and 
-                        strSrc[j] in '~=^_.uvHLTS'):
-                        j += 1
-                        continue                    
-                    # only allow one pitch alpha to be a continue condition
-                    elif (foundPitchAlpha == False and strSrc[j].isalpha() 
-                        and strSrc[j] not in '~wuvhHLTSN'):
-                        foundPitchAlpha = True
-                        j += 1
-                        continue                    
-                    # continue conditions after alpha: 
-                    # , register modifiaciton (, ') or number, rhythm indication
-                    # number, /, 
-                    elif strSrc[j].isdigit() or strSrc[j] in ',/\'':
-                        j += 1
-                        continue    
-                    else: # space, all else: break
-                        break
+            if kind == 'note':
                 # prepend chord symbol
                 if activeChordSymbol != '':
-                    collect = activeChordSymbol+strSrc[i:j]
-                    activeChordSymbol = '' # reset
+                    collect = activeChordSymbol + strSrc[i:j]
                 else:
                     collect = strSrc[i:j]
-                #environLocal.printDebug(['got note event:', repr(collect)])
-
                 # NOTE: skipping a number of articulations and other markers
                 # not yet supported
                 # some collections here are not yet supported; others may be 
@@ -1568,31 +1488,59 @@ class ABCHandler(object):
                 # v is up bow; might be: "^Segno"v which also should be dropped
                 # H is fermata
                 # . dot may be staccato, but should be attached to pitch
-                if collect in ['w', 'u', 'v', 'v.', 'h', 'H', 'vk', 'k', 
-                    'uk', 'U', '~',
-                    '.', '=', 'V', 'v.', 'S', 's', 'i', 'I', 'ui', 'u.', 'K', 'Q', 'Hy', 'Hx', 
-                    'r', 'm', 'M', 'n', 'N', 'o', 
-                    'l', 'L', 'R',
-                    'y', 'T', 't', 'x', 'Z']:
+                if collect in _noteStrSkip:
                     pass
                 # these are bad chords, or other problematic notations like
                 # "D.C."x
                 elif collect.startswith('"') and (collect[-1] in 
-                    ['u', 'v', 'k', 'K', 'Q', '.',    'y', 'T', 'w', 'h', 'x'] or collect.endswith('v.')):
+                    ['u', 'v', 'k', 'K', 'Q', '.', 'y', 'T', 'w', 'h', 'x'] 
+                    or collect.endswith('v.')):
                     pass
-                elif collect.startswith('x') or collect.startswith('H') or collect.startswith('Z'):
+                elif collect[0] in 'xHZ':
                     pass
                 # not sure what =20 refers to
-                elif len(collect) > 1 and collect.startswith("=") and collect[1].isdigit():
+                elif (len(collect) > 1 and collect[0] == '=' and 
+                    collect[1].isdigit()):
                     pass    
                 # only let valid collect strings be parsed
                 else:    
-                    self._tokens.append(ABCNote(collect))
-                i = j
-                continue
-            # look for white space: can be used to determine beam groups
-            # no action: normal continuation of 1 char
-            i += 1
+                    an = ABCNote(collect)
+                    # a chord symbol is always closed if a note follows
+                    if chordSymbols:
+                        an.chordSymbols = chordSymbols
+                    an._nonChordSymStr = strSrc[i:j]
+                    tokens.append(an)
+                if activeChordSymbol != '':
+                    activeChordSymbol = '' # reset
+                    chordSymbols = []
+
+            elif kind == 'bar':
+                # filter and replace with 2 tokens if necessary
+                tokens.extend(self._barlineTokenFilter(strSrc[i:j]))
+            # get tuplet indicators: (2, (3
+            # TODO: extended tuplets look like this: (p:q:r or (3::
+            elif kind == 'tuplet':
+                tokens.append(ABCTuplet(strSrc[i:j]))
+            # get broken rhythm modifiers: < or >, >>, up to <<<
+            elif kind == 'brokenRhythm':
+                tokens.append(ABCBrokenRhythmMarker(strSrc[i:j]))
+            # get chord symbols / guitar chords; collected and joined with
+            # chord or notes
+            elif kind == 'chordSymbol':
+                # there may be more than one chord symbol: need to accumulate
+                activeChordSymbol += strSrc[i:j]
+                chordSymbols.append(strSrc[i:j])
+            elif kind == 'chord':
+                # prepend chord symbol
+                if activeChordSymbol != '':
+                    collect = activeChordSymbol + strSrc[i:j]
+                    activeChordSymbol = '' # reset
+                    chordSymbols = []
+                else:
+                    collect = strSrc[i:j]
+                tokens.append(ABCChord(collect))
+            # comments, including encoding defs, and white space are skipped
+            i = j
 
     
     def tokenProcess(self):
@@ -1612,18 +1560,18 @@ class ABCHandler(object):
         lastDefaultQL = None
         lastKeySignature = None
         lastTimeSignatureObj = None # an m21 object
+        # meter tokens are only made into objects if a tuplet needs them
+        lastMeterToken = None 
         lastTupletToken = None # a token obj; keeps count of usage
 
-        for i in range(len(self._tokens)):
-            # get context of tokens
-            q = self._getLinearContext(self._tokens, i)
-            tPrev, t, tNext, tNextNext = q
-            #tPrevNotSpace, tPrev, t, tNext, tNextNotSpace, tNextNext = q
+        tokens = self._tokens
+        for i, t in enumerate(tokens):
+            # context of tokens is only needed for broken rhythms and errors
             #environLocal.printDebug(['tokenProcess: calling parse()', t])
             
             if isinstance(t, ABCMetadata):
                 if t.isMeter():
-                    lastTimeSignatureObj = t.getTimeSignatureObject()
+                    lastMeterToken = t
                 # restart matching conditions; match meter twice ok
                 if t.isMeter() or t.isDefaultNoteLength():
                     lastDefaultQL = t.getDefaultQuarterLength()
@@ -1633,6 +1581,7 @@ class ABCHandler(object):
                 continue
             # broken rhythms need to be applied to previous and next notes
             if isinstance(t, ABCBrokenRhythmMarker):
+                tPrev, t, tNext, tNextNext = self._getLinearContext(tokens, i)
                 if (isinstance(tPrev, ABCNote) and 
                 isinstance(tNext, ABCNote)):
                     #environLocal.printDebug(['tokenProcess: got broken rhythm marker', t.src])       
@@ -1643,6 +1592,9 @@ class ABCHandler(object):
 
             # need to update tuplets with currently active meter
             if isinstance(t, ABCTuplet):
+                if lastMeterToken is not None:
+                    lastTimeSignatureObj = lastMeterToken.getTimeSignatureObject()
+                    lastMeterToken = None
                 t.updateRatio(lastTimeSignatureObj)
                 # set number of notes that will be altered
                 # might need to do this with ql values, or look ahead to nxt 
@@ -1653,6 +1605,8 @@ class ABCHandler(object):
             # ABCChord inherits ABCNote, thus getting note is enough for both
             if isinstance(t, (ABCNote, ABCChord)):
                 if lastDefaultQL == None:
+                    tPrev, t, tNext, tNextNext = self._getLinearContext(
+                                                 tokens, i)
                     raise ABCHandlerException('no active default note length provided for note processing. tPrev: %s, t: %s, tNext: %s' % (tPrev, t, tNext))
                 t.activeDefaultQuarterLength = lastDefaultQL
                 t.activeKeySignature = lastKeySignature
@@ -2235,6 +2189,39 @@ def mergeLeadingMetaData(barHandlers):
     return mergedHandlers
 
 #-------------------------------------------------------------------------------
+def buildReferenceNumberIndex(strSrc):
+    '''Given the encoded (byte string) contents of an ABC file, return a list of (reference number, start, end) tuples, in file order, giving the byte offsets of the text of each work. A work begins with its X: line and ends before the next X: line, or at the end of the data. Numbers are returned as integers when possible, otherwise as strings.
+
+    >>> from music21 import *
+    >>> abcStr = 'T:header\\nX:5\\nK:G\\nGAB\\nX: 6\\nK:D\\nDEF'
+    >>> abc.buildReferenceNumberIndex(abcStr)
+    [(5, 9, 21), (6, 21, 33)]
+    >>> abcStr[21:33]
+    'X: 6\\nK:D\\nDEF'
+    '''
+    post = []
+    start = None
+    number = None
+    pos = 0
+    end = len(strSrc)
+    while pos < end:
+        lineEnd = strSrc.find('\n', pos)
+        if lineEnd == -1:
+            lineEnd = end
+        line = strSrc[pos:lineEnd].strip()
+        if line.startswith('X:'):
+            if start is not None:
+                post.append((number, start, pos))
+            number = line[2:].replace(' ', '')
+            if number.isdigit():
+                number = int(number)
+            start = pos
+        pos = lineEnd + 1
+    if start is not None:
+        post.append((number, start, end))
+    return post
+
+
 class ABCFile(object):
     '''
     ABC File access
@@ -2242,7 +2229,8 @@ class ABCFile(object):
     '''
     
     def __init__(self): 
-        pass
+        self.file = None
+        self.filename = None
 
     def open(self, filename): 
         '''Open a file for reading
@@ -2270,10 +2258,93 @@ class ABCFile(object):
     def read(self, number=None): 
         '''Read a file. Note that this calls readstring, which processes all tokens. 
 
-        If `number` is given, a work number will be extracted if possible. 
+        If `number` is given, a work number will be extracted if possible. If the file was opened from a file path, the work is found with the reference number index (see :meth:`~music21.abc.base.ABCFile.getReferenceNumberIndex`), and only the text of that work is read.
         '''
+        if number is not None and self.filename is not None:
+            # numbers are compared as integers when possible
+            number = '%s' % number
+            if number.isdigit():
+                number = int(number)
+            for key, start, end in self.getReferenceNumberIndex():
+                if key == number:
+                    return self.readstr(self._readWorkStr(start, end))
+            raise ABCFileException('cannot find requested reference number in source file: %s' % number)
         return self.readstr(self.file.read(), number) 
 
+    def getReferenceNumberIndex(self):
+        '''Return a list of (reference number, start, end) tuples giving the byte offsets of each work in the file opened from a file path, as returned by :func:`~music21.abc.base.buildReferenceNumberIndex`. 
+
+        The index is built once and cached for each file path; it is rebuilt if the modification time or size of the file changes.
+
+        >>> from music21 import *
+        >>> af = abc.ABCFile()
+        >>> af.open(corpus.getWork('essenFolksong/test0'))
+        >>> index = af.getReferenceNumberIndex()
+        >>> af.close()
+        >>> [key for key, start, end in index][:6]
+        [1, 2, 3, 4, 5, 6]
+        '''
+        if self.filename is None:
+            raise ABCFileException('cannot build a reference number index without a file path')
+        st = os.stat(self.filename)
+        stamp = (st.st_mtime, st.st_size)
+        if self.filename in _referenceNumberIndexCache:
+            stampCached, index = _referenceNumberIndexCache[self.filename]
+            if stampCached == stamp:
+                return index
+        f = open(self.filename, 'rb')
+        try:
+            index = buildReferenceNumberIndex(f.read())
+        finally:
+            f.close()
+        _referenceNumberIndexCache[self.filename] = (stamp, index)
+        return index
+
+    def _readWorkStr(self, start, end):
+        '''Read and decode the text of the file between byte offsets `start` and `end`, removing the line break that precedes the following work, as done by :meth:`~music21.abc.base.ABCFile.extractReferenceNumber`.
+        '''
+        f = open(self.filename, 'rb')
+        try:
+            f.seek(start)
+            strSrc = f.read(end - start)
+            # a trailing line break is only found before another work
+            if strSrc.endswith('\n') and f.read(1) != '':
+                strSrc = strSrc[:-1]
+        finally:
+            f.close()
+        return strSrc.decode('utf-8')
+
+    def iterHandlers(self):
+        '''Generate pairs of reference number and processed :class:`~music21.abc.base.ABCHandler` for each work in the file, one at a time, in the order found in the file. Each work is processed alone, as when a `number` is given to :meth:`~music21.abc.base.ABCFile.read`. If no reference numbers are defined, the complete file is returned with the number None.
+
+        >>> from music21 import *
+        >>> af = abc.ABCFile()
+        >>> af.open(corpus.getWork('essenFolksong/test0'))
+        >>> for number, ah in af.iterHandlers():
+        ...     if number == 5:
+        ...         break
+        >>> af.close()
+        >>> len(ah)
+        74
+        '''
+        if self.filename is not None:
+            index = self.getReferenceNumberIndex()
+            if len(index) == 0:
+                yield None, self.readstr(self.file.read())
+            for number, start, end in index:
+                yield number, self.readstr(self._readWorkStr(start, end))
+        else:
+            strSrc = self.file.read()
+            if isinstance(strSrc, unicode):
+                strSrc = strSrc.encode('utf-8')
+            index = buildReferenceNumberIndex(strSrc)
+            if len(index) == 0:
+                yield None, self.readstr(strSrc.decode('utf-8'))
+            for number, start, end in index:
+                workStr = strSrc[start:end]
+                if end < len(strSrc) and workStr.endswith('\n'):
+                    workStr = workStr[:-1]
+                yield number, self.readstr(workStr.decode('utf-8'))
 
     def extractReferenceNumber(self, strSrc, number):
         '''Extract a single reference number from many defined in a file. This permits loading a single work from a collection/opus without parsing the entire file. 
@@ -2365,6 +2436,25 @@ class Test(unittest.TestCase):
             self.assertEqual(countChords, chrodTokens)
         
 
+    def testTokenizeUnicode(self):
+        from music21.abc import testFiles
+
+        for tf in [testFiles.fyrareprisarn, testFiles.kitchGirl, 
+                   testFiles.morrisonsJig]:
+            ahBytes = ABCHandler()
+            ahBytes.tokenize(tf)
+            ahUnicode = ABCHandler()
+            ahUnicode.tokenize(tf.decode('utf-8'))
+            self.assertEqual([t.src for t in ahBytes.tokens], 
+                             [t.src for t in ahUnicode.tokens])
+        # non-ascii upper case alphas may begin metadata
+        ah = ABCHandler()
+        ah.tokenize(u'\xc4:foo\nA\xe4B')
+        self.assertEqual([repr(t) for t in ah.tokens], 
+            ["<ABCMetadata u'\\xc4:foo'>", "<ABCNote u'A'>", 
+             "<ABCNote u'\\xe4'>", "<ABCNote u'B'>"])
+
+
     def testRe(self):
 
         src = 'A: this is a test'
@@ -2658,6 +2748,37 @@ class Test(unittest.TestCase):
         af.close()
         self.assertEqual(len(ah), 101)
 
+    def testReferenceNumberIndex(self):
+        from music21 import corpus
+        fp = corpus.getWork('essenFolksong/han1')
+
+        af = ABCFile()
+        af.open(fp)
+        index = af.getReferenceNumberIndex()
+        # the cached index is returned
+        self.assertEqual(af.getReferenceNumberIndex() is index, True)
+        numbers = [number for number, start, end in index]
+        self.assertEqual(339 in numbers, True)
+        # the work read with the index matches the work extracted by lines
+        ahIndex = af.read(339)
+        ahLines = af.readstr(af.file.read(), 339)
+        af.close()
+        self.assertEqual([t.src for t in ahIndex.tokens], 
+                         [t.src for t in ahLines.tokens])
+
+        af = ABCFile()
+        af.open(fp)
+        post = [(number, len(ah)) for number, ah in af.iterHandlers()]
+        af.close()
+        self.assertEqual([number for number, count in post], numbers)
+        self.assertEqual(dict(post)[339], 101)
+
+        # file-like objects are split without an index
+        af = ABCFile()
+        af.openFileLike(StringIO.StringIO(open(fp).read()))
+        self.assertEqual([(number, len(ah)) for number, ah in 
+                          af.iterHandlers()], post)
+
 #-------------------------------------------------------------------------------
 # define presented order in documentation
 _DOC_ORDER = [ABCFile, ABCHandler, ABCHandlerBar]
@@ -294,7 +294,19 @@ def abcToStreamScore(abcHandler, inputM21=None):
     # meta data can be first
     md = metadata.Metadata()
     s.insert(0, md)
+    _abcHandlerToMetadata(abcHandler, md)
 
+    # find if this token list defines measures
+    # this should probably operate at the level of tunes, not the entire
+    # token list
+    for partHandler in _getPartHandlers(abcHandler):
+        abcToStreamPart(partHandler, s)
+    return s
+
+
+def _abcHandlerToMetadata(abcHandler, md):
+    '''Set the attributes of a Metadata object from the metadata tokens of an ABCHandler.
+    '''
     # get title from large-scale metadata
     titleCount = 0
     for t in abcHandler.tokens:    
@@ -321,6 +333,9 @@ def abcToStreamScore(abcHandler, inputM21=None):
                 #environLocal.printDebug(['got work number', md.number])
 
 
+def _getPartHandlers(abcHandler):
+    '''Return a list of ABCHandlers, one for each voice of an ABCHandler, each beginning with the leading metadata.
+    '''
     partHandlers = []
     tokenCollections = abcHandler.splitByVoice()
     if len(tokenCollections) == 1:
@@ -333,13 +348,68 @@ def abcToStreamScore(abcHandler, inputM21=None):
             #dummy = [t.src for t in newABCHandler.tokens]    
             #print dummy 
             partHandlers.append(newABCHandler)
+    return partHandlers
+
+
+def abcToRichMetadata(abcHandler):
+    '''Given an abcHandler object that defines a single work, return a :class:`~music21.metadata.RichMetadata` object with metadata and summary values (first time and key signatures, note count, duration, and pitch span) taken directly from the tokens, without building a Score.
+
+    >>> from music21 import *
+    >>> from music21.abc import testFiles
+    >>> af = abc.ABCFile()
+    >>> ah = af.readstr(testFiles.theAleWifesDaughter)
+    >>> rmd = abc.translate.abcToRichMetadata(ah)
+    >>> rmd.title
+    "The Ale Wife's Daughter"
+    >>> s = abc.translate.abcToStreamScore(af.readstr(testFiles.theAleWifesDaughter))
+    >>> rmd.noteCount == len(s.flat.notesAndRests)
+    True
+    >>> common.almostEquals(rmd.quarterLength, s.flat.highestTime)
+    True
+    '''
+    from music21 import metadata
+    from music21 import pitch
+
+    rmd = metadata.RichMetadata()
+    _abcHandlerToMetadata(abcHandler, rmd)
+
+    tsFirst = None
+    ksFirst = None
+    noteCount = 0
+    quarterLength = 0.0
+    pitchLowest = None
+    pitchHighest = None
+    for partHandler in _getPartHandlers(abcHandler):
+        qlPart = 0.0
+        for t in partHandler.tokens:
+            if isinstance(t, abcModule.ABCMetadata):
+                if t.isMeter() and tsFirst is None:
+                    tsFirst = t.getTimeSignatureObject() # may be None
+                elif t.isKey() and ksFirst is None:
+                    ksFirst = t.getKeySignatureObject()
+            elif isinstance(t, abcModule.ABCNote):
+                noteCount += 1
+                qlPart += t.quarterLength
+                # as ABCChord is subclass of ABCNote, handle first
+                if isinstance(t, abcModule.ABCChord):
+                    pitchNames = [tSub.pitchName for tSub in t.subTokens
+                                  if isinstance(tSub, abcModule.ABCNote)]
+                elif t.isRest:
+                    pitchNames = []
+                else:
+                    pitchNames = [t.pitchName]
+                for pitchName in pitchNames:
+                    p = pitch.Pitch(pitchName)
+                    if pitchLowest is None or p.ps < pitchLowest.ps:
+                        pitchLowest = p
+                    if pitchHighest is None or p.ps > pitchHighest.ps:
+                        pitchHighest = p
+        quarterLength = max(quarterLength, qlPart)
 
-    # find if this token list defines measures
-    # this should probably operate at the level of tunes, not the entire
-    # token list
-    for partHandler in partHandlers:
-        abcToStreamPart(partHandler, s)
-    return s
+    rmd.setSummary(timeSignatureFirst=tsFirst, keySignatureFirst=ksFirst, 
+        noteCount=noteCount, quarterLength=quarterLength, 
+        pitchLowest=pitchLowest, pitchHighest=pitchHighest)
+    return rmd
 
 
 
@@ -375,6 +445,30 @@ def abcToStreamOpus(abcHandler, inputM21=None, number=None):
         s.append(abcToStreamScore(abcHandler))
     return s
 
+def abcFileToStreamScores(fp):
+    '''Given the path to an ABC file, generate a Score for each work defined in the file, one at a time, in the order found in the file. 
+
+    Each work is located with the file's reference number index and is processed alone, as when a `number` is given to :func:`~music21.converter.parse`; an entire collection thus can be processed without holding all tokens or Scores in memory.
+
+    >>> from music21 import *
+    >>> fp = corpus.getWork('essenFolksong/test0')
+    >>> for s in abc.translate.abcFileToStreamScores(fp):
+    ...     if s.metadata.number == '5':
+    ...         break
+    >>> s.metadata.title
+    'Sakura'
+    >>> len(s.flat.notes)
+    50
+    '''
+    af = abcModule.ABCFile()
+    af.open(fp)
+    try:
+        for number, abcHandler in af.iterHandlers():
+            yield abcToStreamScore(abcHandler)
+    finally:
+        af.close()
+
+
 def reBar(music21Part, inPlace=True):
     """
     Re-bar overflow measures using the last known time signature.
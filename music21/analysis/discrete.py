@@ -39,6 +39,16 @@ _MOD = 'discrete.py'
 environLocal = environment.Environment(_MOD)
 
 
+def _getNumpy():
+    '''Return the numpy module, or None if it is not available. numpy is imported when first needed, not when this module is imported.
+    '''
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
 
 #------------------------------------------------------------------------------
 class DiscreteAnalysisException(Exception):
@@ -152,6 +162,31 @@ class DiscreteAnalysis(object):
         '''
         pass
 
+    # if True, the processor defines _getWindowSummary(), 
+    # _combineWindowSummaries(), and _processWindowSummary(), used by 
+    # the WindowedAnalysis to process windows without creating Streams
+    _windowSummaries = False
+
+    def _getWindowSummary(self, subStream):
+        '''Return a summary of the minimum window (a Measure) `subStream`, from which the solutions of all windows containing it can be found, or None if the window contains no notes.
+        '''
+        pass
+
+    def _combineWindowSummaries(self, summaryA, summaryB):
+        '''Return a new summary of two adjacent windows, as if they were a single window. Either summary may be None.
+        '''
+        pass
+
+    def _processWindowSummary(self, summary):
+        '''Given a window summary, return the same solution and color as :meth:`~music21.analysis.discrete.DiscreteAnalysis.process` would for the window.
+        '''
+        pass
+
+    def _processWindowSummaries(self, summaries):
+        '''Given a list of window summaries, return a list of solution and color pairs, one for each summary. Subclasses may override this to process all windows at once.
+        '''
+        return [self._processWindowSummary(summary) for summary in summaries]
+
 
 #------------------------------------------------------------------------------
 # alternative names
@@ -368,31 +403,44 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
             return None
  
         soln = [0] * 12
-        top = [0] * 12
-        bottomRight = [0] * 12
-        bottomLeft = [0] * 12
-            
         toneWeights = self._getWeights(weightType)
-        profileAverage = float(sum(toneWeights)) / len(toneWeights)
-        histogramAverage = float(sum(pcDistribution)) / len(pcDistribution) 
-            
         for i in range(len(soln)):
-            for j in range(len(toneWeights)):
-                top[i] = top[i] + ((
-                    toneWeights[(j - i) % 12]-profileAverage) * (
-                    pcDistribution[j]-histogramAverage))
-
-                bottomRight[i] = bottomRight[i] + ((
-                    toneWeights[(j-i)%12]-profileAverage)**2)
-                bottomLeft[i] = bottomLeft[i] + ((
-                    pcDistribution[j]-histogramAverage)**2)
-
-                if (bottomRight[i] == 0 or bottomLeft[i] == 0):
-                    soln[i] = 0
-                else:
-                    soln[i] = float(top[i]) / ((bottomRight[i]*bottomLeft[i])**.5)
+            soln[i] = self._getCorrelation(pcDistribution, toneWeights, i)
         return soln    
 
+    def _getCorrelation(self, pcDistribution, toneWeights, i):
+        '''Return the correlation of a pitch class distribution with the tone weights rotated to pitch class `i`, as found for each pitch class by :meth:`~music21.analysis.discrete.KeyWeightKeyAnalysis._getDifference`.
+
+        >>> from music21 import *
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> pcDist = [3.0, 0, 1.5, 0, 1.5, 0, 2.0, 0, 0, 0, 1.5, 0]
+        >>> weights = p._getWeights('major')
+        >>> p._getCorrelation(pcDist, weights, 10) == p._getDifference(
+        ...     [], pcDist, 'major')[10]
+        True
+        >>> p._getCorrelation([1.0] * 12, weights, 0)
+        0
+        '''
+        profileAverage = float(sum(toneWeights)) / len(toneWeights)
+        histogramAverage = float(sum(pcDistribution)) / len(pcDistribution) 
+
+        top = 0
+        bottomRight = 0
+        bottomLeft = 0
+        for j in range(len(toneWeights)):
+            top = top + ((
+                toneWeights[(j - i) % 12]-profileAverage) * (
+                pcDistribution[j]-histogramAverage))
+            bottomRight = bottomRight + ((
+                toneWeights[(j-i)%12]-profileAverage)**2)
+            bottomLeft = bottomLeft + ((
+                pcDistribution[j]-histogramAverage)**2)
+
+        if (bottomRight == 0 or bottomLeft == 0):
+            return 0
+        else:
+            return float(top) / ((bottomRight*bottomLeft)**.5)
+
     def solutionLegend(self, compress=False):
         ''' Returns a list of lists of possible results for the creation of a legend.
 
@@ -482,7 +530,9 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
     def _likelyKeys(self, sStream):
         pcDistribution = self._getPitchClassDistribution(sStream)
         #environLocal.printDebug(['process(); pcDistribution', pcDistribution])
-    
+        return self._likelyKeysFromDistribution(pcDistribution)
+
+    def _likelyKeysFromDistribution(self, pcDistribution):
         keyResultsMajor = self._convoluteDistribution(pcDistribution, 'major')
         differenceMajor = self._getDifference(keyResultsMajor, 
                           pcDistribution, 'major')
@@ -568,7 +618,13 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         #pcDistribution = [9,0,3,0,2,5,0,2,0,2,2,0]
     
         likelyKeysMajor, likelyKeysMinor = self._likelyKeys(sStream)
+        return self._processLikelyKeys(likelyKeysMajor, likelyKeysMinor, 
+            storeAlternatives, sStream)
 
+    def _processLikelyKeys(self, likelyKeysMajor, likelyKeysMinor, 
+        storeAlternatives=False, sStream=None):
+        '''Given the results of :meth:`~music21.analysis.discrete.KeyWeightKeyAnalysis._likelyKeys`, return the solution and color of :meth:`~music21.analysis.discrete.KeyWeightKeyAnalysis.process`.
+        '''
         #find the largest correlation value to use to select major or minor as the resulting key
         # values are the result of _getLikelyKeys
         # each first index is the sorted results; there will be 12
@@ -615,6 +671,197 @@ class KeyWeightKeyAnalysis(DiscreteAnalysis):
         # store solutions for compressed legend generation
         self._solutionsFound.append((solution, color))
         return solution, color        
+
+    _windowSummaries = True
+
+    def _getWindowSummary(self, subStream):
+        '''The summary of a window is its pitch class distribution.
+
+        >>> from music21 import *
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> m = s.parts[0].getElementsByClass('Measure')[1]
+        >>> p._getWindowSummary(m)
+        [0, 1.0, 0, 0, 1.0, 0, 0, 0, 0, 1.0, 0, 1.0]
+        >>> p._combineWindowSummaries(p._getWindowSummary(m), [1.0] * 12)
+        [1.0, 2.0, 1.0, 1.0, 2.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 2.0]
+        '''
+        return self._getPitchClassDistribution(subStream.flat.notesAndRests)
+
+    def _combineWindowSummaries(self, summaryA, summaryB):
+        if summaryA is None:
+            return summaryB
+        elif summaryB is None:
+            return summaryA
+        return [summaryA[i] + summaryB[i] for i in range(12)]
+
+    def _processWindowSummary(self, summary):
+        likelyKeysMajor, likelyKeysMinor = self._likelyKeysFromDistribution(
+            summary)
+        return self._processLikelyKeys(likelyKeysMajor, likelyKeysMinor)
+
+    def _processWindowSummaries(self, summaries):
+        '''If numpy is available, find the keys of all windows at once with :meth:`~music21.analysis.discrete.KeyWeightKeyAnalysis.getBestKeys`; the correlation coefficient of each key is then found as :meth:`~music21.analysis.discrete.KeyWeightKeyAnalysis.process` would find it.
+
+        >>> from music21 import *
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> summaries = [p._getWindowSummary(m) for m in 
+        ...     s.parts[0].getElementsByClass('Measure')[1:4]]
+        >>> post = p._processWindowSummaries(summaries)
+        >>> post == [p._processWindowSummary(x) for x in summaries]
+        True
+        >>> post[0]
+        ((A, 'major', 0.765...), '#bb9aff')
+        '''
+        if _getNumpy() is None:
+            return DiscreteAnalysis._processWindowSummaries(self, summaries)
+
+        tonics, modes, coefficients = self.getBestKeys(summaries)
+        weights = {'major': self._getWeights('major'), 
+                   'minor': self._getWeights('minor')}
+        post = []
+        for i in range(len(summaries)):
+            if tonics[i] is None:
+                raise DiscreteAnalysisException('failed to get likely keys for Stream component')
+            mode = modes[i]
+            coefficient = self._getCorrelation(summaries[i], weights[mode], 
+                          tonics[i])
+            p = self._bestKeyEnharmonic(pitch.Pitch(tonics[i]), mode)
+            solution = (p, mode, coefficient)
+            color = self.solutionToColor(solution)
+            self._solutionsFound.append((solution, color))
+            post.append((solution, color))
+        return post
+
+    def _getKeyArrays(self, pcDistributions):
+        '''Given a list of pitch class distributions, none of which are None, return two numpy arrays, each of shape (distributions, 2, 12): the correlations and the convolutions of each distribution with the major and minor weights rotated to each pitch class.
+        '''
+        numpy = _getNumpy()
+        weights = numpy.array([self._getWeights('major'), 
+                               self._getWeights('minor')], dtype=float)
+        # rotation[i][j] is the weight index of pitch class j in key i
+        rotation = (numpy.arange(12)[None, :] - 
+                    numpy.arange(12)[:, None]) % 12
+        profiles = weights[:, rotation].reshape(24, 12)
+        dist = numpy.array(pcDistributions, dtype=float)
+
+        convolutions = numpy.dot(dist, profiles.T)
+
+        profilesCentered = profiles - profiles.mean(axis=1)[:, None]
+        distCentered = dist - dist.mean(axis=1)[:, None]
+        top = numpy.dot(distCentered, profilesCentered.T)
+        bottomRight = (profilesCentered ** 2).sum(axis=1)
+        bottomLeft = (distCentered ** 2).sum(axis=1)
+        denominator = numpy.sqrt(bottomLeft[:, None] * bottomRight[None, :])
+        isZero = denominator == 0
+        correlations = numpy.where(isZero, 0.0, 
+                       top / numpy.where(isZero, 1.0, denominator))
+        return (correlations.reshape(-1, 2, 12), 
+                convolutions.reshape(-1, 2, 12))
+
+    def getKeyCorrelations(self, pcDistributions):
+        '''Given a list of pitch class distributions (lists of 12 values, as returned by :meth:`~music21.analysis.discrete.KeyWeightKeyAnalysis._getPitchClassDistribution`), return for each distribution a pair of lists, giving the correlation of the distribution with each major key and each minor key, indexed by tonic pitch class. For a distribution of None (an empty window), None is returned.
+
+        If numpy is available, all distributions are correlated with the weights of all 24 keys at once; the values may then differ from those of :meth:`~music21.analysis.discrete.KeyWeightKeyAnalysis.process` in the last digits.
+
+        >>> from music21 import *
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> pcDist = [3.0, 0, 1.5, 0, 1.5, 0, 2.0, 0, 0, 0, 1.5, 0]
+        >>> post = p.getKeyCorrelations([pcDist, None])
+        >>> len(post)
+        2
+        >>> major, minor = post[0]
+        >>> len(major), len(minor)
+        (12, 12)
+        >>> abs(major[10] - p._getDifference([], pcDist, 'major')[10]) < 1e-9
+        True
+        >>> post[1] is None
+        True
+        '''
+        valid = [x for x in pcDistributions if x is not None]
+        if _getNumpy() is not None and len(valid) > 0:
+            correlations = self._getKeyArrays(valid)[0].tolist()
+        else:
+            correlations = [[self._getDifference([], x, 'major'), 
+                             self._getDifference([], x, 'minor')] 
+                            for x in valid]
+        correlations = iter(correlations)
+        post = []
+        for pcDist in pcDistributions:
+            if pcDist is None:
+                post.append(None)
+            else:
+                post.append(tuple(next(correlations)))
+        return post
+
+    def getBestKeys(self, pcDistributions):
+        '''Given a list of pitch class distributions, return three lists, giving for each distribution the tonic pitch class, the mode, and the correlation coefficient of the most likely key, as found by :meth:`~music21.analysis.discrete.KeyWeightKeyAnalysis.process`. For a distribution of None, each value is None.
+
+        If numpy is available, all distributions are processed together, as with :meth:`~music21.analysis.discrete.KeyWeightKeyAnalysis.getKeyCorrelations`; where two keys are equally likely (such as for a whole-tone collection), a different key may then be chosen. This is much faster for many windows, as found in windowed analysis or over a corpus.
+
+        >>> from music21 import *
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> p = analysis.discrete.KrumhanslSchmuckler()
+        >>> pcDist = p._getPitchClassDistribution(s.flat.notesAndRests)
+        >>> tonics, modes, coefficients = p.getBestKeys([pcDist, None, 
+        ...     [1, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1]])
+        >>> tonics
+        [6, None, 0]
+        >>> modes
+        ['minor', None, 'major']
+        >>> coefficients[1] is None
+        True
+        >>> p.process(s)[0]
+        (F#, 'minor', 0.815...)
+        '''
+        tonics = []
+        modes = []
+        coefficients = []
+        valid = [x for x in pcDistributions if x is not None]
+
+        numpy = _getNumpy()
+        if numpy is not None and len(valid) > 0:
+            correlations, convolutions = self._getKeyArrays(valid)
+            count = len(valid)
+            # as in _getLikelyKeys(), a key with the same convolution as a 
+            # lower pitch class takes the place of that pitch class
+            candidates = (convolutions[:, :, :, None] == 
+                          convolutions[:, :, None, :]).argmax(axis=3)
+            rows = numpy.arange(count)[:, None, None]
+            modeIndices = numpy.arange(2)[None, :, None]
+            candidateCorrelations = correlations[rows, modeIndices, candidates]
+            best = candidateCorrelations.reshape(count, 24).max(axis=1)
+            # break ties as the sorting in process() does: by the higher 
+            # pitch class, then minor over major
+            rank = numpy.where(candidateCorrelations == best[:, None, None],
+                   candidates * 2 + modeIndices, -1).reshape(count, 24).max(
+                   axis=1)
+            results = [(int(r) // 2, ['major', 'minor'][int(r) % 2], 
+                       float(b)) for r, b in zip(rank, best)]
+        else:
+            results = []
+            for pcDist in valid:
+                likelyKeysMajor, likelyKeysMinor = \
+                    self._likelyKeysFromDistribution(pcDist)
+                sortList = [(coefficient, p, 'major') for 
+                            (p, coefficient) in likelyKeysMajor]
+                sortList += [(coefficient, p, 'minor') for 
+                             (p, coefficient) in likelyKeysMinor]
+                sortList.sort()
+                coefficient, p, mode = sortList[-1]
+                results.append((p.pitchClass, mode, coefficient))
+
+        results = iter(results)
+        for pcDist in pcDistributions:
+            if pcDist is None:
+                tonic, mode, coefficient = None, None, None
+            else:
+                tonic, mode, coefficient = next(results)
+            tonics.append(tonic)
+            modes.append(mode)
+            coefficients.append(coefficient)
+        return tonics, modes, coefficients
     
     def _solutionToObject(self, solution):
         '''Convert a solution into an appropriate object representation, returning a Key object.
@@ -1101,7 +1348,35 @@ class Ambitus(DiscreteAnalysis):
         >>> p.process(s)
         (63, '#665288')
         '''
-        post = self.getPitchSpan(sStream)
+        return self._processWindowSummary(self.getPitchSpan(sStream))
+
+    _windowSummaries = True
+
+    def _getWindowSummary(self, subStream):
+        '''The summary of a window is its pitch span.
+
+        >>> from music21 import *
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> p = analysis.discrete.Ambitus()
+        >>> m = s.parts[0].getElementsByClass('Measure')[3]
+        >>> p._getWindowSummary(m)
+        (66, 71)
+        >>> p._combineWindowSummaries((66, 71), (69, 73))
+        (66, 73)
+        >>> p._processWindowSummary((66, 73))
+        (7, '#1c1625')
+        '''
+        return self.getPitchSpan(subStream)
+
+    def _combineWindowSummaries(self, summaryA, summaryB):
+        if summaryA is None:
+            return summaryB
+        elif summaryB is None:
+            return summaryA
+        return (min(summaryA[0], summaryB[0]), max(summaryA[1], summaryB[1]))
+
+    def _processWindowSummary(self, summary):
+        post = summary
         if post != None:
             solution = post[1] - post[0] # max-min
         else:
@@ -39,6 +39,50 @@ class WindowedAnalysisException(Exception):
 
 
 #------------------------------------------------------------------------------
+def _combineSummaries(summaries, combine):
+    '''Combine a list of window summaries, in order, with the function `combine`, returning None for an empty list.
+    '''
+    post = None
+    for summary in summaries:
+        post = combine(post, summary)
+    return post
+
+def _slidingCombineSummaries(summaries, windowSize, combine):
+    '''Combine each run of `windowSize` consecutive window summaries, returning a list of the combined summaries of all overlapping windows of that size.
+
+    The summaries are divided into blocks of `windowSize`; each window is the combination of the part of one block after its start and the part of the following block before its end. Running combinations within blocks, from the start and from the end, are computed once, so `combine` is called about three times per window, regardless of the window size, and need not be invertible. 
+
+    >>> from music21 import *
+    >>> add = lambda x, y: (x or 0) + (y or 0)
+    >>> analysis.windowed._slidingCombineSummaries([1, 2, 3, 4, 5], 2, add)
+    [3, 5, 7, 9]
+    >>> analysis.windowed._slidingCombineSummaries([1, 2, 3, 4, 5], 3, add)
+    [6, 9, 12]
+    >>> analysis.windowed._slidingCombineSummaries([1, 2, 3, 4, 5], 6, add)
+    []
+    '''
+    count = len(summaries)
+    if windowSize > count:
+        return []
+    # combined summaries from the start of each block
+    fromStart = list(summaries)
+    for i in range(count):
+        if i % windowSize != 0:
+            fromStart[i] = combine(fromStart[i-1], summaries[i])
+    # combined summaries to the end of each block
+    toEnd = list(summaries)
+    for i in range(count - 2, -1, -1):
+        if (i + 1) % windowSize != 0:
+            toEnd[i] = combine(summaries[i], toEnd[i+1])
+
+    post = []
+    for i in range(count - windowSize + 1):
+        if i % windowSize == 0: # window is a complete block
+            post.append(toEnd[i])
+        else:
+            post.append(combine(toEnd[i], fromStart[i + windowSize - 1]))
+    return post
+
 
 class WindowedAnalysis(object):
     def __init__(self, streamObj, analysisProcessor):
@@ -53,6 +97,8 @@ class WindowedAnalysis(object):
         self._srcStream = streamObj
         # store a windowed Stream, partitioned into bars of 1/4
         self._windowedStream = self._getMinimumWindowStream() 
+        # summaries of each minimum window, if supported by the processor
+        self._windowSummaries = None
 
     def _getMinimumWindowStream(self):
         ''' Take the loaded stream and restructure it into measures of 1 quarter note duration.
@@ -113,6 +159,14 @@ class WindowedAnalysis(object):
         >>> len(a), len(b)
         (33, 33)
 
+        If the processor can summarize each minimum window (see :meth:`~music21.analysis.discrete.DiscreteAnalysis._getWindowSummary`), windows are analyzed by combining summaries with :meth:`~music21.analysis.windowed.WindowedAnalysis._analyzeSummaries`, rather than by creating a Stream for each window.
+        '''
+        if getattr(self.processor, '_windowSummaries', False):
+            return self._analyzeSummaries(windowSize, windowType)
+        return self._analyzeStreams(windowSize, windowType)
+
+    def _analyzeStreams(self, windowSize, windowType='overlap'):
+        '''Perform the analysis of :meth:`~music21.analysis.windowed.WindowedAnalysis._analyze` by creating a Stream for each window and passing it to the processor's process() method.
         '''
         maxWindowCount = len(self._windowedStream)
         # assuming that this is sorted
@@ -182,6 +236,62 @@ class WindowedAnalysis(object):
 
         return data, color
 
+    def _getWindowSummaries(self):
+        '''Return a list of the processor's summaries of each minimum window, finding them on first use.
+        '''
+        if self._windowSummaries is None:
+            self._windowSummaries = [self.processor._getWindowSummary(m) 
+                                     for m in self._windowedStream]
+        return self._windowSummaries
+
+    def _analyzeSummaries(self, windowSize, windowType='overlap'):
+        '''Perform the analysis of :meth:`~music21.analysis.windowed.WindowedAnalysis._analyze` by combining the summaries of minimum windows. For "overlap" windows, each window size requires a number of combinations proportional to the number of minimum windows; for "adjacentAverage" windows, the overlapping windows that contain each minimum window are combined again, as they are concatenated in a Stream by _analyze().
+
+        >>> from music21 import *
+        >>> s = corpus.parse('bach/bwv66.6')
+        >>> p = analysis.discrete.Ambitus()
+        >>> wa = analysis.windowed.WindowedAnalysis(s.parts[0], p)
+        >>> wa._analyzeSummaries(4)[0][:8]
+        [4, 7, 5, 5, 7, 4, 4, 5]
+        >>> wa._analyzeSummaries(4) == wa._analyzeStreams(4)
+        True
+        '''
+        summaries = self._getWindowSummaries()
+        combine = self.processor._combineWindowSummaries
+        maxWindowCount = len(summaries)
+
+        if windowType == 'overlap':
+            windowSummaries = _slidingCombineSummaries(summaries, windowSize, 
+                              combine)
+
+        elif windowType == 'noOverlap':
+            windowCount = (maxWindowCount / windowSize) + 1
+            windowSummaries = []
+            start = 0
+            for i in range(windowCount):
+                end = min(start + windowSize, maxWindowCount)
+                windowSummaries.append(_combineSummaries(summaries[start:end], 
+                                       combine))
+                start = end
+
+        elif windowType == 'adjacentAverage':
+            overlapped = _slidingCombineSummaries(summaries, windowSize, 
+                         combine)
+            windowSummaries = []
+            for i in range(maxWindowCount):
+                # overlapping windows that contain this minimum window
+                first = max(0, i - windowSize + 1)
+                last = min(i, len(overlapped) - 1)
+                windowSummaries.append(_combineSummaries(
+                    overlapped[first:last + 1], combine))
+
+        data = []
+        color = []
+        for d, c in self.processor._processWindowSummaries(windowSummaries):
+            data.append(d)
+            color.append(c)
+        return data, color
+
         
     def process(self, minWindow=1, maxWindow=1, windowStepSize=1, 
                 windowType='overlap', includeTotalWindow=True):
@@ -378,6 +488,39 @@ class Test(unittest.TestCase):
 
 
 
+    def testAnalyzeSummaries(self):
+        from music21 import corpus
+        from music21.analysis import discrete
+        s = corpus.parse('bach/bwv66.6')
+        for pClass in [discrete.KrumhanslSchmuckler, discrete.Ambitus]:
+            wa = WindowedAnalysis(s, pClass())
+            self.assertEqual(len(wa._windowedStream), 36)
+            # the Stream of an adjacentAverage window larger than 1 cannot 
+            # be created, as it contains the same Measures more than once
+            data, color = wa._analyzeSummaries(3, 'adjacentAverage')
+            self.assertEqual(len(data), 36)
+            for windowType, i in [('overlap', 1), ('overlap', 2), 
+                ('overlap', 5), ('overlap', 7), ('overlap', 36), 
+                ('overlap', 40), ('noOverlap', 1), ('noOverlap', 5), 
+                ('noOverlap', 7), ('noOverlap', 36), ('noOverlap', 40), 
+                ('adjacentAverage', 1)]:
+                try:
+                    data, color = wa._analyzeStreams(i, windowType)
+                except discrete.DiscreteAnalysisException:
+                    # empty windows cannot be analyzed for key
+                    self.assertRaises(discrete.DiscreteAnalysisException, 
+                        wa._analyzeSummaries, i, windowType)
+                    continue
+                dataS, colorS = wa._analyzeSummaries(i, windowType)
+                self.assertEqual(colorS, color)
+                if pClass is discrete.Ambitus:
+                    self.assertEqual(dataS, data)
+                    continue
+                self.assertEqual([str(x[:2]) for x in dataS], 
+                                 [str(x[:2]) for x in data])
+                for x, y in zip(dataS, data):
+                    self.assertAlmostEqual(x[2], y[2])
+
     def testVariableWindowing(self):
         from music21.analysis import discrete
         from music21 import corpus, graph
@@ -45,9 +45,11 @@ VERSION_STR = "%s.%s.%s" % (VERSION[0], VERSION[1], VERSION[2])
 
 import codecs
 import copy
+import imp
 import inspect
 import math
 import json
+import os
 import sys
 import types
 import unittest, doctest
@@ -84,22 +86,14 @@ _MOD = 'music21.base.py'
 environLocal = environment.Environment(_MOD)
 
 
-# check external dependencies and display 
+# check external dependencies and display; packages are found, not 
+# imported, as importing them is slow and they are imported where needed
 _missingImport = []
-try:
-    import matplotlib
-except ImportError:
-    _missingImport.append('matplotlib')
-
-try:
-    import numpy
-except ImportError:
-    _missingImport.append('numpy')
-
-try:
-    import scipy
-except ImportError:
-    _missingImport.append('scipy')
+for _name in ['matplotlib', 'numpy', 'scipy']:
+    try:
+        imp.find_module(_name)
+    except ImportError:
+        _missingImport.append(_name)
 
 # used for better PNG processing in lily -- not very important
 #try:
@@ -3299,7 +3293,22 @@ class Music21Object(JSONSerializer):
         if fp is None:
             fp = environLocal.getTempFile(ext)
 
-        if format in ['text', 'textline', 'musicxml', 'vexflow', 'vexflow.html']:        
+        if format == 'musicxml' and self.isStream:
+            # Streams write measures incrementally, w/o building a string;
+            # translation happens while the file is open, so do not leave
+            # a partial file behind if it fails
+            f = open(fp, 'w')
+            try:
+                try:
+                    self._writeMusicXML(f)
+                finally:
+                    f.close()
+            except:
+                os.remove(fp)
+                raise
+            return fp
+
+        elif format in ['text', 'textline', 'musicxml', 'vexflow', 'vexflow.html']:        
             if format == 'text':
                 dataStr = self._reprText()
             elif format == 'textline':
@@ -5475,6 +5484,21 @@ class Test(unittest.TestCase):
 
         n2 = copy.deepcopy(n1)
         #self.assertEqual(n2._activeSite, s1)
+
+    def testWriteMusicXMLFailure(self):
+        from music21 import note, stream
+
+        s = stream.Stream()
+        s.append(note.Note())
+        def failingWrite(fileLike):
+            fileLike.write('<?xml')
+            raise Music21ObjectException('cannot translate')
+        s._writeMusicXML = failingWrite
+
+        fp = environLocal.getTempFile('.xml')
+        self.assertRaises(Music21ObjectException, s.write, 'musicxml', fp)
+        # the partially written file is not left behind
+        self.assertEqual(os.path.exists(fp), False)
         
 
 #-------------------------------------------------------------------------------
@@ -576,6 +576,68 @@ def nearestMultiple(n, unit):
         return matchHigh, round(matchHigh - n, 7)
        
 
+def nearestMultiples(values, divisors):
+    '''Given a list of positive `values`, return a list of the nearest multiple of each value for whichever unit, 1/divisor for each of the supplied `divisors`, gives the smallest error, as in :meth:`~music21.stream.Stream.quantize`. If errors are equal, the smaller multiple is used.
+
+    All values are processed together, with numpy arrays if numpy is available; otherwise each distinct value is computed once.
+
+    >>> from music21 import *
+    >>> common.nearestMultiples([0.1, 0.49, 0.9, 1.49, 1.76], [4])
+    [0.0, 0.5, 1.0, 1.5, 1.75]
+    >>> common.nearestMultiples([0.3, 0.3, 1.26], [4, 3])
+    [0.333..., 0.333..., 1.25]
+    >>> common.nearestMultiples([], [4, 3])
+    []
+    '''
+    # numpy is imported here, not when common is imported, as common is 
+    # imported with music21
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+
+    if numpy is not None and len(values) > 0:
+        n = numpy.asarray(values, dtype=float)
+        best = None
+        bestError = None
+        for div in divisors:
+            unit = 1.0 / div
+            mult = numpy.floor(n / float(unit))
+            matchLow = unit * mult
+            matchHigh = unit * (mult + 1)
+            useLow = n < (matchLow + unit / 2.0)
+            match = numpy.where(useLow, matchLow, matchHigh)
+            error = numpy.round(numpy.abs(n - match), 7)
+            if best is None:
+                best, bestError = match, error
+            else:
+                replace = (error < bestError) | ((error == bestError) & 
+                           (match < best))
+                best = numpy.where(replace, match, best)
+                bestError = numpy.where(replace, error, bestError)
+        return best.tolist()
+
+    units = [1.0 / div for div in divisors]
+    found = {}
+    post = []
+    for target in values:
+        if target not in found:
+            candidates = []
+            for unit in units:
+                mult = math.floor(target / float(unit))
+                matchLow = unit * mult
+                matchHigh = unit * (mult + 1)
+                if target < (matchLow + unit / 2.0):
+                    match = matchLow
+                else:
+                    match = matchHigh
+                # reverse for sorting
+                candidates.append((round(abs(target - match), 7), match))
+            found[target] = min(candidates)[1]
+        post.append(found[target])
+    return post
+
+
 def standardDeviation(coll, bassel=False):
     '''Given a collection of values, return the standard deviation.
 
@@ -44,6 +44,7 @@ import doctest
 import unittest
 
 import copy
+import multiprocessing
 import os
 import re
 import time
@@ -56,6 +57,7 @@ import zipfile
 #     import pickle as pickleMod
 
 import pickle as pickleMod
+import cPickle # faster, optional format for StreamFreezer
 import StringIO # this module is not supported in python3
 # use io.StringIO  in python 3, avail in 2.6, not 2.5
 
@@ -70,10 +72,12 @@ from music21 import expressions
 from music21 import humdrum
 from music21 import instrument
 from music21 import key
+from music21 import metadata
 from music21 import meter
 from music21 import midi
 from music21 import musicxml
 from music21 import note
+from music21 import pitch
 from music21 import stream
 from music21 import tinyNotation
 
@@ -156,6 +160,41 @@ class ArchiveManager(object):
         return post
 
 
+    def _getRootName(self, f):
+        '''Given an open ZipFile, return the name of the MusicXML root file. The META-INF/container.xml file, if present, names the root file; otherwise the first top-level xml file is used. Only the (small) container file is decompressed.
+        '''
+        names = f.namelist()
+        if 'META-INF/container.xml' in names:
+            container = f.read('META-INF/container.xml')
+            match = re.search(r'full-path\s*=\s*["\']([^"\']+)["\']', container)
+            if match is not None and match.group(1) in names:
+                return match.group(1)
+        for subFp in names:
+            # the name musicXML.xml is often used, or get top level
+            # xml file
+            if 'META-INF' in subFp: 
+                continue
+            if subFp.endswith('.xml'):
+                return subFp
+        raise ArchiveManagerException('cannot find a musicxml file in: %s' % self.fp)
+
+    def getFile(self, name=None, format='musicxml'):
+        '''Return an open, file-like object that reads (and decompresses) a member of the archive on demand, rather than reading it into a string. If no name is given, the MusicXML root file is returned. The caller is responsible for closing the returned object.
+        '''
+        if self.archiveType != 'zip':
+            raise ArchiveManagerException('no support for extension: %s' % self.archiveType)
+        if name == None and format != 'musicxml':
+            raise ArchiveManagerException('no default file for format: %s' % format)
+        f = zipfile.ZipFile(self.fp, 'r')
+        try:
+            if name == None:
+                name = self._getRootName(f)
+            # the returned member keeps its own handle on the archive
+            post = f.open(name, 'r')
+        finally:
+            f.close()
+        return post
+
     def getData(self, name=None, format='musicxml' ):
         '''Return data from the archive by name. If no name is given, a default may be available. 
 
@@ -169,14 +208,7 @@ class ArchiveManager(object):
                 # and get the rootfile full-path
                 # a common presentation will be like this:
                 # ['musicXML.xml', 'META-INF/', 'META-INF/container.xml']
-                for subFp in f.namelist():
-                    # the name musicXML.xml is often used, or get top level
-                    # xml file
-                    if 'META-INF' in subFp: 
-                        continue
-                    if subFp.endswith('.xml'):
-                        post = f.read(subFp)
-                        break
+                post = f.read(self._getRootName(f))
 
             elif name == None and format == 'musedata': 
                 # this might concatenate all parts into a single string
@@ -352,12 +384,16 @@ class StreamFreezer(object):
         'pickle'
         >>> sf._parseWriteFmt('JSON')
         'jsonpickle'
+        >>> sf._parseWriteFmt('cPickle')
+        'cpickle'
         '''
         if fmt is None: # this is the default
             return 'pickle'
         fmt = fmt.strip().lower()
         if fmt in ['p', 'pickle']:
             return 'pickle'
+        elif fmt in ['cpickle']:
+            return 'cpickle'
         elif fmt in ['jsonpickle', 'json']:
             return 'jsonpickle'            
         elif fmt in ['jsonnative']:
@@ -407,12 +443,16 @@ class StreamFreezer(object):
 
     def writeStr(self, fmt=None):
         '''Return a pickled as String
+
+        The 'cpickle' format writes the same data as 'pickle' with the much faster cPickle module, but cPickle does not support all objects that pickle supports.
         '''
         fmt = self._parseWriteFmt(fmt)
         storage = self._packStream(self.stream)
 
         if fmt == 'pickle':
             out = pickleMod.dumps(storage, protocol=-1)
+        elif fmt == 'cpickle':
+            out = cPickle.dumps(storage, -1)
         elif fmt == 'jsonpickle':
             out = jsonpickle.encode(storage)
         else:
@@ -462,13 +502,20 @@ class StreamFreezer(object):
         self.stream = self._unpackStream(storage)
 
 
-    def openStr(self, fileData):
+    def openStr(self, fileData, fmt=None):
         '''Open a String as a pickle
+
+        The format is determined from the data, unless `fmt` is given; give 'cpickle' to load a pickle with the cPickle module.
         '''
-        fmt = self._parseOpenFmt(fileData)
+        if fmt is None:
+            fmt = self._parseOpenFmt(fileData)
+        else:
+            fmt = self._parseWriteFmt(fmt)
 
         if fmt == 'pickle':
             storage = pickleMod.loads(fileData)
+        elif fmt == 'cpickle':
+            storage = cPickle.loads(fileData)
         elif fmt == 'jsonpickle':
             storage = jsonpickle.decode(fileData)
         else:
@@ -481,6 +528,124 @@ class StreamFreezer(object):
 # Converters are associated classes; they are not subclasses, but all most define a pareData() method, a parseFile() method, and a .stream attribute or property. 
 
 
+#-------------------------------------------------------------------------------
+class StreamCache(object):
+    '''An in-process cache of Streams parsed from files, evicting the least recently used Streams when an estimated size in bytes exceeds `maxBytes`. Streams are stored with a key and the modification time of their file; a Stream is only returned if the file has not changed.
+
+    If `shared` is False, each call to :meth:`~music21.converter.StreamCache.get` returns an independent deep copy of the stored Stream. As the caller keeps and may modify the Stream given to :meth:`~music21.converter.StreamCache.put`, a Stream is not copied and stored the first time it is put, but only when it is put a second time, that is, when it has been asked for again; Streams used only once are never copied. If `shared` is True, the stored Stream itself is returned, after being made immutable with :meth:`~music21.stream.Stream.makeImmutable`; it must not be modified.
+
+    As measuring the memory of a Stream is expensive, the size of a Stream is estimated from the number of contained elements, each taking about `elementBytes`.
+
+    >>> from music21 import *
+    >>> sc = converter.StreamCache(maxBytes=2 * 1024 * 1024)
+    >>> s = converter.parse('tinyNotation: 4/4 c4 d e f')
+    >>> sc.put('a', 0, s)
+    >>> sc.get('a', 0) is None # not stored until put again
+    True
+    >>> sc.put('a', 0, s)
+    >>> post = sc.get('a', 0)
+    >>> post is s, len(post.flat.notes)
+    (False, 4)
+    >>> sc.get('a', 1) is None # the file has changed
+    True
+    >>> len(sc)
+    0
+    '''
+    # an estimate of the memory used by each element of a parsed Stream,
+    # including its duration, pitch, and site objects; measured as 
+    # 16-18 KB per element from the growth in resident memory when 
+    # copies of chorales, Luca, Schumann and Beethoven works are kept
+    elementBytes = 16384
+
+    def __init__(self, maxBytes=0, shared=False):
+        self.maxBytes = maxBytes
+        self.shared = shared
+        self.clear()
+
+    def __len__(self):
+        return len(self._order)
+
+    def clear(self):
+        '''Remove all stored Streams.
+        '''
+        self._streams = {} # key: (mtime, Stream, bytes)
+        self._order = [] # keys, least recently used first
+        self._pending = {} # key: mtime, for Streams put once and not stored
+        self.bytes = 0
+
+    def _estimateBytes(self, streamObj):
+        return len(streamObj.recurse(restoreActiveSites=False)) * self.elementBytes
+
+    def _remove(self, key):
+        mtime, streamObj, bytes = self._streams[key]
+        del self._streams[key]
+        self._order.remove(key)
+        self.bytes -= bytes
+
+    def get(self, key, mtime):
+        '''Return the Stream stored with `key` and the same modification time, or None.
+        '''
+        if key not in self._streams:
+            return None
+        if self._streams[key][0] != mtime: # stale
+            self._remove(key)
+            return None
+        streamObj = self._streams[key][1]
+        # move to the most recently used position
+        self._order.remove(key)
+        self._order.append(key)
+        if self.shared:
+            return streamObj
+        return copy.deepcopy(streamObj)
+
+    def put(self, key, mtime, streamObj):
+        '''Store a Stream, evicting the least recently used Streams as needed to stay within `maxBytes`. Streams larger than `maxBytes` are not stored.
+        '''
+        if key in self._streams:
+            self._remove(key)
+        if not self.shared:
+            # the caller keeps the Stream; only copy it for storage when
+            # it has been asked for before
+            if self._pending.get(key) != mtime:
+                self._pending[key] = mtime
+                return
+            del self._pending[key]
+        bytes = self._estimateBytes(streamObj)
+        if bytes > self.maxBytes:
+            return
+        while self.bytes + bytes > self.maxBytes:
+            self._remove(self._order[0])
+        if self.shared:
+            streamObj.makeImmutable()
+        else: # store a copy, as the caller will modify the Stream returned
+            streamObj = copy.deepcopy(streamObj)
+        self._streams[key] = (mtime, streamObj, bytes)
+        self._order.append(key)
+        self.bytes += bytes
+
+
+# the module-level cache used by parseFile; disabled until a size is set
+_parseCache = StreamCache(maxBytes=0)
+
+def setParseCache(maxBytes=0, shared=False):
+    '''Enable an in-process cache of Streams parsed from files by :func:`~music21.converter.parse` (and :func:`~music21.corpus.parse`), holding about `maxBytes` of Streams; a `maxBytes` of 0, the default, disables and clears the cache. 
+    
+    Unless `shared` is True, a file is cached when it is parsed a second time, and later parses return an independent copy of the cached Stream; if `shared` is True, all parses of a file return the same immutable Stream, which must not be modified. See :class:`~music21.converter.StreamCache`.
+
+    >>> from music21 import *
+    >>> converter.setParseCache(100 * 1024 * 1024)
+    >>> s1 = corpus.parse('bach/bwv66.6')
+    >>> s1 = corpus.parse('bach/bwv66.6') # stored in the cache
+    >>> s2 = corpus.parse('bach/bwv66.6') # returned from the cache
+    >>> s1 is s2, len(s1.flat.notes) == len(s2.flat.notes)
+    (False, True)
+    >>> converter.setParseCache(0)
+    '''
+    _parseCache.clear()
+    _parseCache.maxBytes = maxBytes
+    _parseCache.shared = shared
+
+
 #-------------------------------------------------------------------------------
 class ConverterHumdrum(object):
     '''Simple class wrapper for parsing Humdrum data provided in a file or in a string.
@@ -511,6 +676,15 @@ class ConverterHumdrum(object):
         self.stream = self.data.stream
         return self.data
 
+    def parseFileMetadata(self, filepath, number=None):
+        '''Read only reference records and summary values from a file path, returning a :class:`~music21.metadata.RichMetadata` object.
+        '''
+        f = open(filepath)
+        try:
+            return humdrum.spineParser.dataStreamToRichMetadata(f.readlines())
+        finally:
+            f.close()
+
 #-------------------------------------------------------------------------------
 class ConverterTinyNotation(object):
     '''Simple class wrapper for parsing TinyNotation data provided in a file or in a string.
@@ -638,26 +812,34 @@ class ConverterMusicXML(object):
 
 
     #---------------------------------------------------------------------------
-    def parseData(self, xmlString, number=None):
-        '''Open MusicXML data from a string.'''
+    def parseData(self, xmlString, number=None, parts=None, measures=None):
+        '''Open MusicXML data from a string.
+
+        If `parts` (a list of part ids, names, or indices) or `measures` (a pair of start and end measure numbers) are given, only that excerpt is loaded.
+        '''
         c = musicxml.Document()
-        c.read(xmlString)
+        c.read(xmlString, parts=parts, measures=measures)
         self._mxScore = c.score #  the mxScore object from the musicxml Document
         if len(self._mxScore) == 0:
             #print xmlString
             raise ConverterException('score from xmlString (%s...) either has no parts defined or was incompletely parsed' % xmlString[:30])
         self.load()
 
-    def parseFile(self, fp, number=None):
+    def parseFile(self, fp, number=None, parts=None, measures=None):
         '''Open from a file path; check to see if there is a pickled
         version available and up to date; if so, open that, otherwise
         open source.
+
+        If `parts` or `measures` are given, only that excerpt is loaded 
+        from the source; pickled files are neither read nor written.
         '''
         # return fp to load, if pickle needs to be written, fp pickle
         # this should be able to work on a .mxl file, as all we are doing
         # here is seeing which is more recent
 
-        pfObj = PickleFilter(fp, self.forceSource)
+        # an excerpt is not a complete score, and cannot be pickled
+        excerpt = parts is not None or measures is not None
+        pfObj = PickleFilter(fp, self.forceSource or excerpt)
         # fpDst here is the file path to load, which may or may not be
         # a pickled file 
         fpDst, writePickle, fpPickle = pfObj.status() # get status
@@ -702,9 +884,14 @@ class ConverterMusicXML(object):
             # here, we can see if this is a mxl or similar archive
             arch = ArchiveManager(fpDst)
             if arch.isArchive():
-                c.read(arch.getData())
+                # decompress the archived file while parsing
+                fileLike = arch.getFile()
+                try:
+                    c.readFile(fileLike, parts=parts, measures=measures)
+                finally:
+                    fileLike.close()
             else: # its a file path or a raw musicxml string
-                c.open(fpDst)
+                c.open(fpDst, parts=parts, measures=measures)
 
         # get mxScore object from .score attribute
         self._mxScore = c.score
@@ -731,6 +918,58 @@ class ConverterMusicXML(object):
 
         self.load()
 
+    def parseFileMetadata(self, fp, number=None):
+        '''Read only the score header and summary values from a MusicXML file path, without creating a Stream, returning a :class:`~music21.metadata.RichMetadata` object.
+        '''
+        c = musicxml.Document()
+        arch = ArchiveManager(fp)
+        if arch.isArchive():
+            fileLike = arch.getFile()
+            try:
+                summary = c.readSummary(fileLike, file=True)
+            finally:
+                fileLike.close()
+        else:
+            summary = c.readSummary(fp, file=True)
+
+        mxScore = c.score
+        # as in parseFile, use the file name if no titles are defined
+        if mxScore.get('movementTitle') == None:
+            mxWork = mxScore.get('workObj')
+            if mxWork == None or mxWork.get('workTitle') == None: 
+                junk, fn = os.path.split(fp)
+                mxScore.set('movementTitle', fn)
+
+        rmd = metadata.RichMetadata()
+        rmd.mx = mxScore
+
+        ts = None
+        if summary['timeSignatureFirst'] is not None:
+            ts = meter.TimeSignature('%s/%s' % summary['timeSignatureFirst'])
+        ks = None
+        if summary['keySignatureFirst'] is not None:
+            fifths, mode = summary['keySignatureFirst']
+            ks = key.KeySignature(fifths)
+            if mode is not None:
+                ks.mode = mode
+        pitches = []
+        for name in ['pitchLowest', 'pitchHighest']:
+            if summary[name] is None:
+                pitches.append(None)
+                continue
+            step, alter, octave = summary[name]
+            p = pitch.Pitch(step)
+            p.octave = octave
+            if alter != 0:
+                p.accidental = pitch.Accidental(alter)
+            pitches.append(p)
+
+        rmd.setSummary(timeSignatureFirst=ts, keySignatureFirst=ks, 
+            noteCount=summary['noteCount'], 
+            quarterLength=summary['quarterLength'],
+            pitchLowest=pitches[0], pitchHighest=pitches[1])
+        return rmd
+
 
 
 
@@ -815,6 +1054,22 @@ class ConverterABC(object):
         else: 
             abcTranslate.abcToStreamScore(abcHandler, self._stream)
 
+    def parseFileMetadata(self, fp, number=None):
+        '''Read only metadata and summary values from an ABC file path, without creating a Stream. If more than one work is defined in the file, and `number` is not given, a list of :class:`~music21.metadata.RichMetadata` objects, one for each work, is returned; otherwise, a single RichMetadata object is returned.
+        '''
+        af = abcModule.ABCFile()
+        af.open(fp)
+        try:
+            if number is not None:
+                return abcTranslate.abcToRichMetadata(af.read(number=number))
+            post = [abcTranslate.abcToRichMetadata(abcHandler) 
+                    for junk, abcHandler in af.iterHandlers()]
+        finally:
+            af.close()
+        if len(post) == 1:
+            return post[0]
+        return post
+
     def _getStream(self):
         return self._stream
 
@@ -861,11 +1116,15 @@ class ConverterRomanText(object):
 #-------------------------------------------------------------------------------
 class ConverterMuseData(object):
     '''Simple class wrapper for parsing MuseData.
+
+    If `processes` is greater than 1, parts are translated in parallel in a pool of worker processes.
     '''
 
-    def __init__(self):
+    def __init__(self, forceSource=False, processes=None):
         # always create a score instance
         self._stream = stream.Score()
+        self.forceSource = forceSource
+        self.processes = processes
 
     def parseData(self, strData, number=None):
         '''Get musedata from a string representation. 
@@ -881,11 +1140,12 @@ class ConverterMuseData(object):
         for strData in strDataList:
             mdw.addString(strData)
 
-        musedataTranslate.museDataWorkToStreamScore(mdw, self._stream)
+        musedataTranslate.museDataWorkToStreamScore(mdw, self._stream,
+            processes=self.processes)
 
 
-    def parseFile(self, fp, number=None):
-        '''
+    def _getMuseDataWork(self, fp):
+        '''Return a MuseDataWork from a file path, a directory of part files, a list of file paths, or a zip archive.
         '''
         mdw = musedataModule.MuseDataWork()
 
@@ -912,8 +1172,20 @@ class ConverterMuseData(object):
                 mdw.addFile(fp)
 
         #environLocal.printDebug(['ConverterMuseData: mdw file count', len(mdw.files)])
+        return mdw
 
-        musedataTranslate.museDataWorkToStreamScore(mdw, self._stream)
+    def parseFile(self, fp, number=None):
+        '''
+        '''
+        mdw = self._getMuseDataWork(fp)
+        musedataTranslate.museDataWorkToStreamScore(mdw, self._stream,
+            processes=self.processes)
+
+    def parseFileMetadata(self, fp, number=None):
+        '''Read only metadata and summary values from MuseData files, without creating a Stream, returning a :class:`~music21.metadata.RichMetadata` object.
+        '''
+        return musedataTranslate.museDataWorkToRichMetadata(
+            self._getMuseDataWork(fp))
 
 
 
@@ -939,8 +1211,9 @@ class Converter(object):
 
     def __init__(self):
         self._converter = None
+        self._richMetadata = None
 
-    def _setConverter(self, format, forceSource=False):
+    def _setConverter(self, format, forceSource=False, processes=None):
         # assume for now tt pickled files are alwasy musicxml
         # this may change in the future
         if format is None:
@@ -957,7 +1230,8 @@ class Converter(object):
         elif format == 'abc':
             self._converter = ConverterABC()
         elif format == 'musedata':
-            self._converter = ConverterMuseData()
+            self._converter = ConverterMuseData(forceSource=forceSource,
+                processes=processes)
         elif format == 'noteworthytext':
             self._converter = ConverterNoteworthy()
         
@@ -975,7 +1249,20 @@ class Converter(object):
             raise ValueError
         return os.path.join(dir, 'm21-' + common.getMd5(url) + ext)
 
-    def parseFile(self, fp, number=None, format=None, forceSource=False):
+    def _parseExcerptKeywords(self, format, parts=None, measures=None):
+        '''Return a dictionary of keyword arguments for selective loading of parts and measures, to be passed to the format converter. Only MusicXML supports selective loading.
+        '''
+        keywords = {}
+        if parts is None and measures is None:
+            return keywords
+        if format not in ['musicxml', 'pickle']:
+            raise ConverterException('loading selected parts or measures is not supported for format: %s' % format)
+        keywords['parts'] = parts
+        keywords['measures'] = measures
+        return keywords
+
+    def parseFile(self, fp, number=None, format=None, forceSource=False,
+        parts=None, measures=None, metadataOnly=False, processes=None):
         '''
         Given a file path, parse and store a music21 Stream.
         
@@ -983,6 +1270,21 @@ class Converter(object):
         If format is None then look up the format from the file 
         extension using `common.findFormatFile`.
         
+
+        For MusicXML, `parts` and `measures` can be used to load only an 
+        excerpt; see :func:`~music21.converter.parse`.
+
+
+        For MuseData, if `processes` is greater than 1, parts are 
+        translated in a pool of worker processes.
+
+
+        If `metadataOnly` is True, no Stream is stored; instead, metadata 
+        and summary values are stored as a 
+        :class:`~music21.metadata.RichMetadata` object, or a list of them 
+        for files that define more than one work, in `richMetadata`. 
+        MusicXML, ABC, Humdrum, and MuseData files are read in a single 
+        light pass; other formats are fully parsed.
         '''
         #environLocal.printDebug(['attempting to parseFile', fp])
         if not os.path.exists(fp):
@@ -995,13 +1297,30 @@ class Converter(object):
                 format = 'musedata'
             else:
                 format = common.findFormatFile(fp)
+                if format is None:
+                    # look at the start of the file only
+                    format = self.formatFromFile(fp)
                 if format is None:
                      raise ConverterFileException('cannot find a format extensions for: %s' % fp)
-        self._setConverter(format, forceSource=forceSource)
-        self._converter.parseFile(fp, number=number)
+        excerptKeywords = self._parseExcerptKeywords(format, parts, measures)
+        self._setConverter(format, forceSource=forceSource, 
+            processes=processes)
+        if metadataOnly:
+            if excerptKeywords:
+                raise ConverterException('cannot load an excerpt when only reading metadata')
+            if hasattr(self._converter, 'parseFileMetadata'):
+                self._richMetadata = self._converter.parseFileMetadata(fp, 
+                    number=number)
+            else:
+                self._converter.parseFile(fp, number=number)
+                self._richMetadata = _streamToRichMetadata(
+                    self._converter.stream)
+        else:
+            self._converter.parseFile(fp, number=number, **excerptKeywords)
 
 
-    def parseData(self, dataStr, number=None, format=None, forceSource=False):
+    def parseData(self, dataStr, number=None, format=None, forceSource=False,
+        parts=None, measures=None):
         '''Given raw data, determine format and parse into a music21 Stream.
         '''
         if common.isListLike(dataStr):
@@ -1036,8 +1355,9 @@ class Converter(object):
             else:
                 raise ConverterException('File not found or no such format found for: %s' % dataStr)
 
+        excerptKeywords = self._parseExcerptKeywords(format, parts, measures)
         self._setConverter(format)
-        self._converter.parseData(dataStr, number=number)
+        self._converter.parseData(dataStr, number=number, **excerptKeywords)
 
 
     def parseURL(self, url, format=None, number=None):
@@ -1135,6 +1455,65 @@ class Converter(object):
                 dataStr = dataStr.lstrip()
                 break
         return (format, dataStr)
+
+    def formatFromFile(self, fp, size=4096):
+        '''
+        Determine the format of a file by reading only its first `size` 
+        bytes, for files whose extension does not name a format. For 
+        zip archives only the directory of names is read. Returns None 
+        if no format can be found.
+
+        >>> from music21 import *
+        >>> import os
+        >>> from music21.musicxml import testPrimitive
+        >>> fp = environment.Environment().getTempFile('.dat')
+        >>> f = open(fp, 'w')
+        >>> f.write(testPrimitive.pitches01a)
+        >>> f.close()
+        >>> c = converter.Converter()
+        >>> c.formatFromFile(fp)
+        'musicxml'
+        >>> os.remove(fp)
+        '''
+        if zipfile.is_zipfile(fp):
+            f = zipfile.ZipFile(fp, 'r')
+            names = f.namelist()
+            f.close()
+            for name in names:
+                if 'META-INF' not in name and name.endswith('.xml'):
+                    return 'musicxml'
+            if len(musedataModule.MuseDataDirectory(names).getPaths()) > 0:
+                return 'musedata'
+            return None
+
+        f = open(fp, 'rb')
+        try:
+            head = f.read(size)
+        finally:
+            f.close()
+        if head.startswith('\xef\xbb\xbf'): # utf-8 byte order mark
+            head = head[3:]
+        if head.startswith('MThd'):
+            return 'midi'
+        head = head.lstrip()
+        format, junk = self.formatFromHeader(head)
+        if format is not None:
+            return format
+        headLower = head.lower()
+        if (head.startswith('<?xml') or '<score-partwise' in head or 
+            '<score-timewise' in head):
+            return 'musicxml'
+        elif head.startswith('!!!') or head.startswith('**'):
+            return 'humdrum'
+        elif headLower.startswith('!noteworthycomposer'):
+            return 'noteworthytext'
+        elif 'WK#:' in head:
+            return 'musedata'
+        elif re.search(r'^X:', head, re.MULTILINE) or headLower.startswith('%abc'):
+            return 'abc'
+        elif 'Time Signature:' in head:
+            return 'romanText'
+        return None
             
 
 
@@ -1150,25 +1529,61 @@ class Converter(object):
 
     stream = property(_getStream)
 
+    def _getRichMetadata(self):
+        return self._richMetadata
 
+    richMetadata = property(_getRichMetadata, doc='''
+        The :class:`~music21.metadata.RichMetadata` object, or list of them, stored by calling :meth:`~music21.converter.Converter.parseFile` with `metadataOnly` set to True.
+        ''')
+
+
+def _streamToRichMetadata(streamObj):
+    '''Return a :class:`~music21.metadata.RichMetadata` object for a parsed Score, or a list of them, one for each Score, for an Opus.
+    '''
+    if 'Opus' in streamObj.classes:
+        return [_streamToRichMetadata(s) for s in streamObj.scores]
+    rmd = metadata.RichMetadata()
+    if streamObj.metadata is not None:
+        rmd.merge(streamObj.metadata)
+    rmd.update(streamObj)
+    return rmd
 
 
 #-------------------------------------------------------------------------------
 # module level convenience methods
 
 
-def parseFile(fp, number=None, format=None, forceSource=False):
-    '''Given a file path, attempt to parse the file into a Stream.
+def parseFile(fp, number=None, format=None, forceSource=False, 
+    parts=None, measures=None, metadataOnly=False, processes=None):
+    '''Given a file path, attempt to parse the file into a Stream. 
+    
+    If `metadataOnly` is True, a :class:`~music21.metadata.RichMetadata` object (or a list of them) is returned instead; see :meth:`~music21.converter.Converter.parseFile`. For MuseData, parts are translated in a pool of `processes` worker processes if `processes` is greater than 1.
     '''
+    useCache = _parseCache.maxBytes > 0 and not metadataOnly
+    if useCache:
+        key = (os.path.abspath(fp), number, format, str(parts), str(measures))
+        mtime = os.path.getmtime(fp)
+        if not forceSource:
+            post = _parseCache.get(key, mtime)
+            if post is not None:
+                return post
+
     v = Converter()
-    v.parseFile(fp, number=number, format=format, forceSource=forceSource)
+    v.parseFile(fp, number=number, format=format, forceSource=forceSource,
+                parts=parts, measures=measures, metadataOnly=metadataOnly,
+                processes=processes)
+    if metadataOnly:
+        return v.richMetadata
+    if useCache:
+        _parseCache.put(key, mtime, v.stream)
     return v.stream
 
-def parseData(dataStr, number=None, format=None):
+def parseData(dataStr, number=None, format=None, parts=None, measures=None):
     '''Given musical data represented within a Python string, attempt to parse the data into a Stream.
     '''
     v = Converter()
-    v.parseData(dataStr, number=number, format=format)
+    v.parseData(dataStr, number=number, format=format, parts=parts,
+                measures=measures)
     return v.stream
 
 def parseURL(url, number=None, format=None, forceSource=False):
@@ -1192,6 +1607,26 @@ def parse(value, *args, **keywords):
     
     
     `format` specifies the format to parse the line of text or the file as.    
+
+
+    For MusicXML, `parts` (a list of part ids, part names, or integer 
+    part indices) and `measures` (a pair of start and end measure 
+    numbers, inclusive) load only an excerpt: unneeded parts and 
+    measures are skipped while reading the XML, and the clef, key, 
+    time, and divisions of skipped measures are carried forward.
+
+
+    If `metadataOnly` is True, a :class:`~music21.metadata.RichMetadata` 
+    object, with metadata and summary values such as the first time 
+    signature, the note count, and the pitch span, is returned instead 
+    of a Stream, or a list of RichMetadata objects for sources that 
+    define more than one work. MusicXML, ABC, Humdrum, and MuseData 
+    files are read in a single light pass, without creating a Stream.
+
+
+    For MuseData files and directories, if `processes` is greater than 1, 
+    the parts are translated in parallel in a pool of `processes` worker 
+    processes.
     
     A string of text is first checked to see if it is a 
     filename that exists on disk.  If not it is searched
@@ -1244,14 +1679,48 @@ def parse(value, *args, **keywords):
     else:   
         format = None
 
+    # for loading excerpts of MusicXML files
+    if 'parts' in keywords.keys():
+        parts = keywords['parts']
+    else:   
+        parts = None
+
+    if 'measures' in keywords.keys():
+        measures = keywords['measures']
+    else:   
+        measures = None
+
+    if 'metadataOnly' in keywords.keys():
+        metadataOnly = keywords['metadataOnly']
+    else:   
+        metadataOnly = False
+
+    if 'processes' in keywords.keys():
+        processes = keywords['processes']
+    else:   
+        processes = None
+
+    if metadataOnly:
+        if (common.isListLike(value) and len(value) == 2 and 
+            os.path.exists(value[0])):
+            value, number = value # from corpus.search
+        if not common.isListLike(value) and os.path.exists(value):
+            return parseFile(value, number=number, format=format, 
+                forceSource=forceSource, metadataOnly=True)
+        # urls and data are parsed completely
+        keywords = dict(keywords)
+        del keywords['metadataOnly']
+        return _streamToRichMetadata(parse(value, *args, **keywords))
+
     if (common.isListLike(value) and len(value) == 2 and 
         value[1] == None and os.path.exists(value[0])):
         # comes from corpus.search
-        return parseFile(value[0], format=format)
+        return parseFile(value[0], format=format, processes=processes)
     elif (common.isListLike(value) and len(value) == 2 and 
         isinstance(value[1], int) and os.path.exists(value[0])):
         # corpus or other file with movement number
-        return parseFile(value[0], format=format).getScoreByNumber(value[1])
+        return parseFile(value[0], format=format, 
+            processes=processes).getScoreByNumber(value[1])
     elif common.isListLike(value) or len(args) > 0: # tiny notation list
         if len(args) > 0: # add additional args to a list
             value = [value] + list(args)
@@ -1260,12 +1729,15 @@ def parse(value, *args, **keywords):
     elif value.startswith('MThd'):
         return parseData(value, number=number, format=format)
     elif os.path.exists(value):
-        return parseFile(value, number=number, format=format, forceSource=forceSource)
+        return parseFile(value, number=number, format=format, 
+            forceSource=forceSource, parts=parts, measures=measures,
+            processes=processes)
     elif (value.startswith('http://') or value.startswith('https://')): 
         # its a url; may need to broaden these criteria
         return parseURL(value, number=number, format=format, forceSource=forceSource)
     else:
-        return parseData(value, number=number, format=format)
+        return parseData(value, number=number, format=format, parts=parts,
+            measures=measures)
 
 
 
@@ -1324,7 +1796,7 @@ def freezeStr(streamObj, fmt=None):
 
     This function is based on the :class:`~music21.converter.StreamFreezer` object. 
 
-    The serialization format is defined by the `fmt` argument; 'pickle' (the default), 'jsonpickle' or 'jsonnative' are presently supported.
+    The serialization format is defined by the `fmt` argument; 'pickle' (the default), 'cpickle', 'jsonpickle' or 'jsonnative' are presently supported. The 'cpickle' format is much faster, but does not support all objects; load it with `fmt='cpickle'` in :func:`~music21.converter.unfreezeStr`.
 
     >>> from music21 import *
     >>> c = converter.parse('c4 d e f', '4/4')
@@ -1344,21 +1816,128 @@ def freezeStr(streamObj, fmt=None):
     {1.0} <music21.note.Note D>
     {2.0} <music21.note.Note E>
     {3.0} <music21.note.Note F>
+    >>> data = converter.freezeStr(c, fmt='cpickle')
+    >>> len(converter.unfreezeStr(data, fmt='cpickle').flat.notes)
+    4
 
     '''
     v = StreamFreezer(streamObj)
     return v.writeStr(fmt=fmt) # returns a string
 
-def unfreezeStr(strData):
+def unfreezeStr(strData, fmt=None):
     '''Given a serialization string, defrost into a Stream.
 
-    This function is based on the :class:`~music21.converter.StreamFreezer` object. 
+    This function is based on the :class:`~music21.converter.StreamFreezer` object. The format is determined from the data, unless given with `fmt`.
     '''
     v = StreamFreezer()
-    v.openStr(strData)
+    v.openStr(strData, fmt=fmt)
     return v.stream
 
 
+def _freezeParsed(post):
+    '''Serialize a parsed Stream with :func:`~music21.converter.freezeStr`, or a RichMetadata object, or a list of them, as JSON.
+    '''
+    if isinstance(post, list):
+        return [_freezeParsed(rmd) for rmd in post]
+    elif isinstance(post, metadata.RichMetadata):
+        return post.json
+    return freezeStr(post)
+
+def _unfreezeParsed(data, metadataOnly=False):
+    '''Restore an object serialized with :func:`~music21.converter._freezeParsed`.
+    '''
+    if isinstance(data, list):
+        return [_unfreezeParsed(rmdData, metadataOnly) for rmdData in data]
+    elif metadataOnly:
+        rmd = metadata.RichMetadata()
+        rmd.json = data
+        return rmd
+    return unfreezeStr(data)
+
+def _parseManyWorker(args):
+    '''Parse one value in a worker process, returning its index, the parsed Stream (or RichMetadata) serialized with :func:`~music21.converter._freezeParsed`, and an error message (None on success).
+    '''
+    i, value, keywords = args
+    try:
+        return (i, _freezeParsed(parse(value, **keywords)), None)
+    except Exception as e: # reported, with the value, in the parent
+        return (i, None, '%s: %s' % (e.__class__.__name__, e))
+
+def _parseManyError(value, msg, onError):
+    '''Return the result that stands in for a value that could not be parsed, as defined by `onError`.
+    '''
+    if onError == 'raise':
+        raise ConverterException('cannot parse %s: %s' % (value, msg))
+    elif onError == 'ignore':
+        return None
+    elif callable(onError):
+        return onError(value, msg)
+    raise ConverterException('no such onError value: %s' % onError)
+
+def iterParseMany(values, processes=None, chunksize=1, onError='raise', 
+    ordered=True, **keywords):
+    '''
+    Parse a list of values, as accepted by :func:`~music21.converter.parse`, and yield (index, Stream) pairs, where index is the position of the value in `values`.
+
+    If `processes` is greater than 1, values are parsed in a pool of worker processes, `chunksize` values at a time, and each Stream is returned to this process serialized with :func:`~music21.converter.freezeStr`; RichMetadata objects, parsed with `metadataOnly`, are returned as JSON. If `ordered` is False, pairs are yielded as soon as each value is parsed, rather than in the order of `values`.
+
+    See :func:`~music21.converter.parseMany` for `onError`. Additional keywords are passed to :func:`~music21.converter.parse`.
+    '''
+    values = list(values)
+    if processes is None or processes <= 1 or len(values) <= 1:
+        for i, value in enumerate(values):
+            try:
+                post = parse(value, **keywords)
+            except Exception as e:
+                post = _parseManyError(value, 
+                       '%s: %s' % (e.__class__.__name__, e), onError)
+            yield (i, post)
+        return
+
+    jobs = [(i, value, keywords) for i, value in enumerate(values)]
+    pool = multiprocessing.Pool(processes=processes)
+    try:
+        if ordered:
+            results = pool.imap(_parseManyWorker, jobs, chunksize)
+        else:
+            results = pool.imap_unordered(_parseManyWorker, jobs, chunksize)
+        for i, data, msg in results:
+            if msg is not None:
+                yield (i, _parseManyError(values[i], msg, onError))
+            else:
+                yield (i, _unfreezeParsed(data, 
+                    keywords.get('metadataOnly', False)))
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+def parseMany(values, processes=None, chunksize=1, onError='raise', 
+    **keywords):
+    '''
+    Parse a list of file paths, or any other values accepted by :func:`~music21.converter.parse`, returning a list of Streams in the same order.
+
+    If `processes` is greater than 1, values are parsed in a pool of worker processes; `chunksize` values are sent to a worker at a time. Parsed Streams are returned from the workers serialized with :func:`~music21.converter.freezeStr`. 
+
+    `onError` defines what happens when a value cannot be parsed: 'raise' (the default) raises a ConverterException, 'ignore' places None in the list, and a function, called with the value and an error message, places its return value in the list.
+
+    Additional keywords, such as `forceSource` or `format`, are passed to :func:`~music21.converter.parse`. To get Streams as they are parsed, use :func:`~music21.converter.iterParseMany`.
+
+    >>> from music21 import *
+    >>> post = converter.parseMany(['tinyNotation: 4/4 c4 d e f', 'tinyNotation: 3/4 g2.'])
+    >>> [len(s.flat.notes) for s in post]
+    [4, 1]
+    >>> converter.parseMany(['/no/such/file.xml'], onError='ignore')
+    [None]
+    '''
+    values = list(values)
+    post = [None] * len(values)
+    for i, s in iterParseMany(values, processes=processes, 
+        chunksize=chunksize, onError=onError, **keywords):
+        post[i] = s
+    return post
+
+
 
 
 #-------------------------------------------------------------------------------
@@ -1929,6 +2508,11 @@ class Test(unittest.TestCase):
         self.assertEqual(len(s.parts), 4)
         #s.show()
 
+        # parts can be translated in worker processes
+        s = parse(fp, forceSource=True, processes=2)
+        self.assertEqual(len(s.parts), 4)
+        self.assertEqual(len(s.flat.notes), len(parse(fp).flat.notes))
+
 
 
     def testMixedArchiveHandling(self):
@@ -1985,9 +2569,186 @@ class Test(unittest.TestCase):
         #s.show()
 
 
+    def testParseExcerptMusicXML(self):
+        from music21 import corpus
+        fp = corpus.getWork('bach/bwv66.6')
+        s = parse(fp, parts=[1], measures=(3, 5))
+        self.assertEqual(len(s.parts), 1)
+        mStream = s.parts[0].getElementsByClass('Measure')
+        self.assertEqual([m.number for m in mStream], [3, 4, 5])
+        # clef, key, and time carried forward from the first measure
+        mFirst = mStream[0]
+        self.assertEqual(mFirst.clef.sign, 'G')
+        self.assertEqual(mFirst.keySignature.sharps, 3)
+        self.assertEqual(mFirst.timeSignature.numerator, 4)
+
+        sFull = parse(fp)
+        pitchesFull = [str(p) for p in sFull.parts[1].measures(3, 5).pitches]
+        pitchesExcerpt = [str(p) for p in s.parts[0].pitches]
+        self.assertEqual(pitchesExcerpt, pitchesFull)
+
+        # select by part id
+        from music21.musicxml import testPrimitive
+        s = parseData(testPrimitive.staffGroupsNested41d, parts=['P2', 'P4'])
+        self.assertEqual(len(s.parts), 2)
+        # excerpts can only be taken from musicxml
+        self.assertRaises(ConverterException, parseData, 
+            'tinyNotation: c4 d e f', parts=[0])
+
+    def testParseMany(self):
+        from music21 import corpus
+        fpList = [corpus.getWork('bwv66.6'), '/no/such/file.xml', 
+                  corpus.getWork('hwv56/movement3-05.md')]
+        errors = []
+        def onError(value, msg):
+            errors.append(value)
+            return 'failed'
+        post = parseMany(fpList, processes=2, onError=onError)
+        self.assertEqual(len(post), 3)
+        self.assertEqual(len(post[0].parts), 4)
+        self.assertEqual(post[1], 'failed')
+        self.assertEqual(errors, ['/no/such/file.xml'])
+        self.assertEqual(len(post[2].flat.notes), 
+                         len(parse(fpList[2]).flat.notes))
+        self.assertRaises(ConverterException, parseMany, fpList, processes=2)
+
+        # results as they finish cover every index
+        indices = [i for i, s in iterParseMany(fpList, processes=2, 
+                   onError='ignore', ordered=False)]
+        self.assertEqual(sorted(indices), [0, 1, 2])
+
+    def testParseMetadataOnly(self):
+        from music21 import corpus
+        fpList = [corpus.getWork('bwv66.6'), corpus.getWork('bach/bwv366.krn'),
+                  corpus.getWork('hwv56/movement3-05.md')]
+        for fp in fpList:
+            rmd = parse(fp, metadataOnly=True)
+            self.assertEqual(isinstance(rmd, metadata.RichMetadata), True)
+            rmdFull = _streamToRichMetadata(parse(fp))
+            for attr in ['timeSignatureFirst', 'keySignatureFirst', 
+                'noteCount', 'quarterLength', 'pitchLowest', 'pitchHighest']:
+                self.assertEqual(getattr(rmd, attr), getattr(rmdFull, attr))
+        self.assertEqual(parse(fpList[0], metadataOnly=True).title, 'bwv66.6.mxl')
+
+        # multi-work abc files return a list; one work can be selected
+        fp = corpus.getWork('essenFolksong/teste')
+        post = parse(fp, metadataOnly=True)
+        self.assertEqual(len(post), 
+            len(parse(fp).getElementsByClass('Score')))
+        rmd = parse(fp, number=int(post[1].number), metadataOnly=True)
+        self.assertEqual(rmd.noteCount, post[1].noteCount)
+
+        # metadata is returned from worker processes 
+        post = parseMany(fpList + [fp], processes=2, metadataOnly=True)
+        self.assertEqual([rmd.noteCount for rmd in post[:3]],
+            [parse(fpWork, metadataOnly=True).noteCount for fpWork in fpList])
+        self.assertEqual([rmd.number for rmd in post[3]],
+            [rmd.number for rmd in parse(fp, metadataOnly=True)])
+
+    def testParseCache(self):
+        import shutil
+        from music21 import corpus
+        fpSrc = corpus.getWork('bach/bwv366.krn')
+        fp = environLocal.getTempFile('.krn')
+        shutil.copy(fpSrc, fp)
+        try:
+            setParseCache(100 * 1024 * 1024)
+            s1 = parse(fp)
+            # not stored until parsed again
+            self.assertEqual(len(_parseCache), 0)
+            s1 = parse(fp)
+            self.assertEqual(len(_parseCache), 1)
+            s2 = parse(fp)
+            self.assertEqual(s1 is s2, False)
+            # copies are independent
+            s2.parts[0].flat.notes[0].pitch.name = 'C#'
+            self.assertEqual(parse(fp).parts[0].flat.notes[0].pitch.name, 
+                             s1.parts[0].flat.notes[0].pitch.name)
+            # a changed file is parsed again
+            os.utime(fp, (0, os.path.getmtime(fp) + 10))
+            self.assertEqual(parse(fp) is None, False)
+            self.assertEqual(len(_parseCache), 0)
+            self.assertEqual(parse(fp) is None, False)
+            self.assertEqual(len(_parseCache), 1)
+
+            # shared streams are the same object
+            setParseCache(100 * 1024 * 1024, shared=True)
+            self.assertEqual(parse(fp) is parse(fp), True)
+
+            # least recently used streams are evicted 
+            bytes = _parseCache.bytes
+            setParseCache(bytes + 1, shared=True)
+            parse(fp)
+            parse(corpus.getWork('bach/bwv277.krn'))
+            self.assertEqual(len(_parseCache), 1)
+            self.assertEqual(_parseCache.bytes <= bytes + 1, True)
+        finally:
+            setParseCache(0)
+            os.remove(fp)
+        self.assertEqual(len(_parseCache), 0)
+
+    def testStreamCacheEstimate(self):
+        import gc, sys, types
+        from music21 import corpus
+
+        def measureBytes(root):
+            # the size of all objects reachable from root, without 
+            # modules, classes, and functions, which are shared
+            shared = (types.ModuleType, type, types.ClassType, 
+                types.FunctionType, types.BuiltinFunctionType, 
+                types.MethodType)
+            found = set()
+            stack = [root]
+            total = 0
+            while stack:
+                obj = stack.pop()
+                if id(obj) in found or isinstance(obj, shared):
+                    continue
+                found.add(id(obj))
+                total += sys.getsizeof(obj)
+                stack.extend(gc.get_referents(obj))
+            return total
+
+        s = corpus.parse('bach/bwv66.6', forceSource=True)
+        estimate = StreamCache()._estimateBytes(s)
+        measured = measureBytes(s)
+        self.assertEqual(measured / 2 < estimate < measured * 2, True)
+
+    def testFormatFromFileAndArchiveStreaming(self):
+        import shutil
+        fp = os.path.join(common.getSourceFilePath(), 'musicxml', 'testMxl.mxl')
+        af = ArchiveManager(fp)
+        fileLike = af.getFile()
+        self.assertEqual(fileLike.read(38), '<?xml version="1.0" encoding="UTF-8"?>')
+        fileLike.close()
+        s = parse(fp, forceSource=True)
+        self.assertEqual(len(s.parts) > 0, True)
+
+        # a file without a known extension is identified by its contents
+        c = Converter()
+        fpCopy = environLocal.getTempFile('.dat')
+        shutil.copy(fp, fpCopy)
+        self.assertEqual(c.formatFromFile(fpCopy), 'musicxml')
+        os.remove(fpCopy)
+
+        fpMidi = os.path.join(common.getSourceFilePath(), 'midi', 
+                              'testPrimitive', 'test01.mid')
+        shutil.copy(fpMidi, fpCopy)
+        self.assertEqual(c.formatFromFile(fpCopy), 'midi')
+        os.remove(fpCopy)
+
+        f = open(fpCopy, 'w')
+        f.write('X:1\nT:Scale\nM:4/4\nL:1/4\nK:C\nCDEF|\n')
+        f.close()
+        self.assertEqual(c.formatFromFile(fpCopy), 'abc')
+        s = parse(fpCopy)
+        self.assertEqual(len(s.flat.notes), 4)
+        os.remove(fpCopy)
+
+
 #-------------------------------------------------------------------------------
 # define presented order in documentation
-_DOC_ORDER = [parse, parseFile, parseData, parseURL, freeze, unfreeze, freezeStr, unfreezeStr, Converter, ConverterMusicXML, ConverterHumdrum]
+_DOC_ORDER = [parse, parseFile, parseData, parseURL, parseMany, iterParseMany, setParseCache, freeze, unfreeze, freezeStr, unfreezeStr, Converter, ConverterMusicXML, ConverterHumdrum, StreamCache]
 
 
 if __name__ == "__main__":
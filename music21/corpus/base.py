@@ -25,7 +25,11 @@ but to the best of our knowledge is true for the US.
 
 import re
 import os
+import sys
 import doctest, unittest
+import json
+import multiprocessing
+import pickle
 import zipfile
 
 import music21
@@ -44,6 +48,7 @@ environLocal = environment.Environment(_MOD)
 # a list of metadataCache's can reside in this module-level storage; this 
 # data is loaded on demand. 
 _METADATA_BUNDLES = {'core':None, 'virtual':None, 'local':None}
+_METADATA_DATABASES = {'core':None, 'virtual':None, 'local':None}
 
 # update and access through property to make clear
 # that this is a corpus distribution or a no-corpus distribution
@@ -88,34 +93,170 @@ class CorpusException(Exception):
 
 
 #-------------------------------------------------------------------------------
-def _findPaths(fpRoot, extList):
-    '''Given a root fp file path, recursively search all contained paths for files
-    in fpRoot matching any of the extensions in extList
-    
-    The `extList` is a list of file extensions. 
-    
-    NB: we've tried optimizing with fnmatch but it does not save any time.
+# path indices: for each root directory, the relative paths of all files, 
+# stored in the scratch directory and reused while the modification times 
+# of all contained directories are unchanged
+_PATH_INDEX_VERSION = 1
+_pathIndexCache = {}
+# for each root directory and extension list, a dictionary of lower-case 
+# work names (runs of path components) to file paths
+_workIndexCache = {}
+
+def _walkPaths(fpRoot):
+    '''Walk a root directory, returning a path index: a dictionary of the modification times of all directories and the relative paths of all files, in the order found.
     '''
-    # can replace extension matching with a regex    
-    #escape extension dots (if there) for regex
-    #extList = ["\\%s" % ex for ex in extList if ex.startswith('.')]
-    #extRe = re.compile('.*(%s)' % '|'.join(extList))
-
-    matched = []
-    # walk each top-level dir
+    dirs = {}
+    files = []
     for dirpath, dirnames, filenames in os.walk(fpRoot):
         if '.svn' in dirnames:
             # removing in place will stop recursion into these dirs
             dirnames.remove('.svn')
+        dirRel = os.path.relpath(dirpath, fpRoot)
+        dirs[dirRel] = os.path.getmtime(dirpath)
         for fn in filenames:
             if fn.startswith('.'): 
                 continue
-            for ext in extList:
-                if fn.endswith(ext):
-                    matched.append(os.path.join(dirpath, fn))
-                    break # just break out of outer loop
+            if dirRel == os.curdir:
+                files.append(fn)
+            else:
+                files.append(os.path.join(dirRel, fn))
+    return {'version': _PATH_INDEX_VERSION, 'root': os.path.abspath(fpRoot), 
+            'dirs': dirs, 'files': files}
+
+def _isPathIndexCurrent(pathIndex, fpRoot):
+    '''Return True if no files have been added to or removed from any directory since the path index was made. Adding or removing a file or directory changes the modification time of the containing directory.
+    '''
+    if (pathIndex.get('version') != _PATH_INDEX_VERSION or 
+        pathIndex.get('root') != os.path.abspath(fpRoot)):
+        return False
+    try:
+        for dirRel, mtime in pathIndex['dirs'].items():
+            if os.path.getmtime(os.path.join(fpRoot, dirRel)) != mtime:
+                return False
+    except OSError: # a directory has been removed
+        return False
+    return True
+
+def _decodePathIndex(pathIndex):
+    '''Return a path index read from JSON with file system (not unicode) strings, as returned by os.walk.
+    '''
+    encoding = sys.getfilesystemencoding() or 'utf-8'
+    def encode(fp):
+        if isinstance(fp, unicode):
+            return fp.encode(encoding)
+        return fp
+    return {'version': pathIndex['version'], 
+            'root': encode(pathIndex['root']), 
+            'dirs': dict([(encode(k), v) for k, v in pathIndex['dirs'].items()]),
+            'files': [encode(fp) for fp in pathIndex['files']]}
+
+def _getPathIndexFp(fpRoot):
+    return os.path.join(environLocal.getRootTempDir(), 
+        'm21-paths-' + common.getMd5(os.path.abspath(fpRoot)) + '.json')
+
+def _getPathIndex(fpRoot):
+    '''Return the path index of a root directory, reading it from the scratch directory if it is current, and otherwise walking the directory and storing a new index. 
+    '''
+    if fpRoot in _pathIndexCache:
+        return _pathIndexCache[fpRoot]
+
+    fpIndex = _getPathIndexFp(fpRoot)
+    pathIndex = None
+    if os.path.exists(fpIndex):
+        try:
+            f = open(fpIndex)
+            try:
+                pathIndex = _decodePathIndex(json.load(f))
+            finally:
+                f.close()
+        except (IOError, ValueError, KeyError): # an incomplete file
+            environLocal.printDebug(['path index is damaged', fpIndex])
+            pathIndex = None
+        if pathIndex is not None and not _isPathIndexCurrent(pathIndex, 
+            fpRoot):
+            pathIndex = None
+
+    if pathIndex is None:
+        pathIndex = _walkPaths(fpRoot)
+        try:
+            f = open(fpIndex, 'w')
+            try:
+                json.dump(pathIndex, f)
+            finally:
+                f.close()
+        except (IOError, OSError):
+            environLocal.printDebug(['cannot write path index', fpIndex])
+    _pathIndexCache[fpRoot] = pathIndex
+    return pathIndex
+
+def _findPaths(fpRoot, extList):
+    '''Given a root fp file path, recursively search all contained paths for files
+    in fpRoot matching any of the extensions in extList
+    
+    The `extList` is a list of file extensions. 
+    
+    The directory is not walked if a current path index is stored; see :func:`~music21.corpus.base._getPathIndex`.
+    '''
+    # str.endswith matches any of a tuple of extensions
+    extTuple = tuple(extList)
+    matched = []
+    for fpRel in _getPathIndex(fpRoot)['files']:
+        if fpRel.endswith(extTuple):
+            matched.append(os.path.join(fpRoot, fpRel))
     return matched
 
+def _getWorkIndex(fpRoot, extList):
+    '''Return a dictionary of work names to lists of file paths in a root directory that match any of the extensions in extList. 
+    
+    Work names are lower-case runs of path components below the root, separated by "/", where a file name is given with and without its extension: "bach/bwv66.6" and "bwv66.6.mxl" both name "bach/bwv66.6.mxl", and "beethoven/opus18no1" names all files in that directory.
+
+    >>> from music21 import *
+    >>> workIndex = corpus.base._getWorkIndex(common.getCorpusFilePath(), ['.mxl'])
+    >>> len(workIndex['bach/bwv66.6'])
+    1
+    '''
+    cacheKey = (fpRoot, tuple(extList))
+    if cacheKey in _workIndexCache:
+        return _workIndexCache[cacheKey]
+
+    workIndex = {}
+    for fp in _findPaths(fpRoot, extList):
+        parts = fp[len(fpRoot):].lower().strip(os.sep).split(os.sep)
+        fn = parts[-1]
+        if '.' in fn:
+            fnNoExt = fn[:fn.rfind('.')]
+        else:
+            fnNoExt = None
+        names = set()
+        for i in range(len(parts)):
+            for j in range(i + 1, len(parts) + 1):
+                names.add('/'.join(parts[i:j]))
+                if j == len(parts) and fnNoExt is not None:
+                    names.add('/'.join(parts[i:j-1] + [fnNoExt]))
+        for name in names:
+            if name not in workIndex:
+                workIndex[name] = []
+            workIndex[name].append(fp)
+    _workIndexCache[cacheKey] = workIndex
+    return workIndex
+
+def _getIndexedWorkList(workName, extList):
+    '''Return a list of file paths in the core and local corpora named by workName (see :func:`~music21.corpus.base._getWorkIndex`), or None if workName is not the name of any work in the indices.
+    '''
+    name = workName.lower().replace('\\', '/').replace(os.sep, '/').strip('/')
+    extList = _translateExtensions(extList=extList)
+    roots = [common.getCorpusFilePath()] + _getLocalRoots()
+    post = []
+    found = False
+    for fpRoot in roots:
+        workIndex = _getWorkIndex(fpRoot, extList)
+        if name in workIndex:
+            found = True
+            post += workIndex[name]
+    if not found:
+        return None
+    return post
+
 
 # cached once; default extensions for all corpus entires;
 # returned by _translateExtensions() function below
@@ -223,23 +364,28 @@ def getLocalPaths(extList=None, expandExtensions=True):
     cacheKey = ('local', tuple(extList))
     # not cached, fetch and reset 
     if cacheKey not in _pathsCache.keys():
-        # check paths before trying to search
-        candidatePaths = environLocal['localCorpusSettings']
-        validPaths = []
-        for fp in candidatePaths + _pathsLocalTemp:
-            if not os.path.isdir(fp):
-                environLocal.warn(
-                'invalid path set as localCorpusSetting: %s' % fp)
-            else:
-                validPaths.append(fp)
         # append successive matches into one list
         matched = []
-        for fp in validPaths:
+        for fp in _getLocalRoots():
             #environLocal.pd(['finding paths in:', fp])
             matched += _findPaths(fp, extList)
         _pathsCache[cacheKey] = matched
     return _pathsCache[cacheKey]
 
+def _getLocalRoots():
+    '''Return the directories of the local corpus, as defined in Environment settings and with :func:`~music21.corpus.addPath`, that exist.
+    '''
+    # check paths before trying to search
+    candidatePaths = environLocal['localCorpusSettings']
+    validPaths = []
+    for fp in candidatePaths + _pathsLocalTemp:
+        if not os.path.isdir(fp):
+            environLocal.warn(
+            'invalid path set as localCorpusSetting: %s' % fp)
+        else:
+            validPaths.append(fp)
+    return validPaths
+
 
 def addPath(fp):
     '''
@@ -323,13 +469,43 @@ def _updateMetadataBundle():
             # must update access paths for the files found on this system
             _METADATA_BUNDLES[d].updateAccessPaths(fpList)
 
-def cacheMetadata(domainList=['local']):
+def cacheMetadata(domainList=['local'], processes=None, rebuild=False, 
+    useDatabase=False, metadataOnly=True):
+    '''Update the metadata cache of the given domains, parsing only new or changed files unless `rebuild` is True. If `processes` is greater than 1, files are parsed in a pool of worker processes. If `useDatabase` is True, an SQLite database for :func:`~music21.corpus.query` is written as well. Unless `metadataOnly` is False, files are read without creating Streams where the format allows it.
+    '''
     if not common.isListLike(domainList):
         domainList = [domainList]
     for domain in domainList:
         # remove any cached values
         _METADATA_BUNDLES[domain] = None
-    metadataCache.cacheMetadata(domainList)        
+        if _METADATA_DATABASES[domain] is not None:
+            _METADATA_DATABASES[domain].close()
+            _METADATA_DATABASES[domain] = None
+    metadataCache.cacheMetadata(domainList, processes=processes, 
+        rebuild=rebuild, useDatabase=useDatabase, metadataOnly=metadataOnly)
+
+def query(domain=['core', 'virtual', 'local'], **keywords):
+    '''Query the SQLite metadata databases, written by :func:`~music21.corpus.cacheMetadata` when `useDatabase` is True, and return a list of pairs of file paths and work numbers. 
+
+    Keywords name RichMetadata fields, such as composer, timeSignatureFirst, noteCount, or ambitus; see :meth:`~music21.metadata.MetadataDatabase.query`. For example, works in 3/4 with an ambitus of less than two octaves:
+
+    >>> from music21 import *
+    >>> #_DOCS_SHOW corpus.query(timeSignatureFirst='3/4', ambitus=(None, 23))
+    '''
+    post = []
+    for d, f in (('core', getCorePaths), ('virtual', getVirtualPaths),
+                 ('local', getLocalPaths)):
+        if d not in domain:
+            continue
+        if _METADATA_DATABASES[d] is None:
+            db = metadata.MetadataDatabase(d)
+            if not os.path.exists(db._fp):
+                environLocal.warn('no metadata database found for: %s; try building one with corpus.cacheMetadata("%s", useDatabase=True)' % (d, d))
+                continue
+            db.updateAccessPaths(f())
+            _METADATA_DATABASES[d] = db
+        post += _METADATA_DATABASES[d].query(**keywords)
+    return post
 
 def search(query, field=None, domain=['core', 'virtual', 'local'],     
     extList=None):
@@ -502,9 +678,6 @@ def getWorkList(workName, movementNumber=None, extList=None):
     if not common.isListLike(extList):
         extList = [extList]
 
-    paths = getPaths(extList)
-    post = []
-
     # permit workName to be a list of paths/branches
     if common.isListLike(workName):
         workName = os.path.sep.join(workName)
@@ -513,14 +686,22 @@ def getWorkList(workName, movementNumber=None, extList=None):
 
     #environLocal.printDebug(['getWorkList(): searching for workName or workSlashses', workName, workSlashes])
 
-    # find all matches for the work name
-    # TODO: this should match by path component, not just
-    # substring
-    for path in paths:
-        if workName.lower() in path.lower():
-            post.append(path)
-        elif workSlashes.lower() in path.lower():
-            post.append(path)
+    # find all matches for the work name; if the work name is a run of 
+    # path components, it is found directly in an index; otherwise, 
+    # match any substring of a path
+    post = _getIndexedWorkList(workName, extList)
+    if post is not None:
+        for path in getVirtualPaths(extList):
+            if (workName.lower() in path.lower() or 
+                workSlashes.lower() in path.lower()):
+                post.append(path)
+    else:
+        post = []
+        for path in getPaths(extList):
+            if workName.lower() in path.lower():
+                post.append(path)
+            elif workSlashes.lower() in path.lower():
+                post.append(path)
     #environLocal.printDebug(['getWorkList(): post', post])
 
     postMvt = []
@@ -767,7 +948,7 @@ def getWork(workName, movementNumber=None, extList=None):
 
 
 def parse(workName, movementNumber=None, number=None, 
-    extList=None, forceSource=False):
+    extList=None, forceSource=False, processes=None):
     '''
     The most important method call for corpus.
     
@@ -785,6 +966,10 @@ def parse(workName, movementNumber=None, number=None,
     Advanced: if `forceSource` is True, the original file will always be loaded freshly and pickled (e.g., pre-parsed) files
     will be ignored.  This should not be needed if the file has been changed, since the filetime of the file and
     the filetime of the pickled version are compared.  But it might be needed if the music21 parsing routine has changed.
+
+    Works that are parsed repeatedly can be kept in memory with :func:`~music21.converter.setParseCache`.
+
+    For MuseData works, such as the movements of :func:`~music21.corpus.getHandelMessiah`, parts are translated in a pool of worker processes if `processes` is greater than 1.
     
     Example, get a chorale by Bach.  Note that the source type does not need to be
     specified, nor does the name Bach even (since it's the only piece with the title BWV 66.6)
@@ -799,6 +984,17 @@ def parse(workName, movementNumber=None, number=None,
     >>> bachChorale.corpusFilepath
     'bach/bwv66.6.mxl'
     '''
+    fp = _getWorkPath(workName, movementNumber, extList)
+    #return converter.parse(fp, forceSource=forceSource, number=number)
+
+    streamObj = converter.parse(fp, forceSource=forceSource, number=number,
+        processes=processes)
+    _addCorpusFilepath(streamObj, fp)
+    return streamObj
+
+def _getWorkPath(workName, movementNumber=None, extList=None):
+    '''Return the file path (or URL, for virtual works) of the first work that matches workName, as used by :func:`~music21.corpus.parse`.
+    '''
     if workName in [None, '']:
         raise CorpusException('a work name must be provided as an argument')
 
@@ -813,7 +1009,7 @@ def parse(workName, movementNumber=None, number=None,
             wn = os.path.sep.join(workName)
         if wn.endswith(".xml"):
             newWorkName = wn[0:len(wn)-4] + ".mxl" # might be compressed MXL file
-            return parse(newWorkName,movementNumber,number,extList,forceSource)
+            return _getWorkPath(newWorkName, movementNumber, extList)
         post = getVirtualWorkList(workName, movementNumber, extList)    
 
     if len(post) == 1:
@@ -822,12 +1018,29 @@ def parse(workName, movementNumber=None, number=None,
         raise CorpusException("Could not find a work that met this criteria %s" % workName)
     else: # greater than zero:
         fp = post[0] # get first
-        
-    #return converter.parse(fp, forceSource=forceSource, number=number)
+    return fp
 
-    streamObj = converter.parse(fp, forceSource=forceSource, number=number)
-    _addCorpusFilepath(streamObj, fp)
-    return streamObj
+def parseMany(workNames, processes=None, chunksize=1, onError='raise', 
+    forceSource=False):
+    '''
+    Parse a list of corpus work names, as given to :func:`~music21.corpus.parse`, returning a list of Streams in the same order. 
+
+    Works are parsed with :func:`~music21.converter.parseMany`; if `processes` is greater than 1, they are parsed in a pool of worker processes. See that function for `chunksize` and `onError`. 
+
+    >>> from music21 import *
+    >>> post = corpus.parseMany(['bwv66.6', 'bach/bwv324.xml'])
+    >>> [len(s.parts) for s in post]
+    [4, 4]
+    >>> post[0].corpusFilepath
+    'bach/bwv66.6.mxl'
+    '''
+    fpList = [_getWorkPath(workName) for workName in workNames]
+    post = converter.parseMany(fpList, processes=processes, 
+            chunksize=chunksize, onError=onError, forceSource=forceSource)
+    for fp, streamObj in zip(fpList, post):
+        if streamObj is not None:
+            _addCorpusFilepath(streamObj, fp)
+    return post
 
 def _addCorpusFilepath(streamObj, filepath):   
     # metadata attribute added to store the file path, for use later in identifying the score
@@ -844,6 +1057,170 @@ def _addCorpusFilepath(streamObj, filepath):
     else:
         streamObj.corpusFilepath = filepath
 
+#-------------------------------------------------------------------------------
+# map and reduce over corpus works
+
+def _getMapWorks(works=None, queryKeywords=None):
+    '''Return a list of (work, file path, number) triples for :func:`~music21.corpus.map`, where work is the value given in `works` (or returned by :func:`~music21.corpus.query`).
+    '''
+    if works is None and queryKeywords is None:
+        raise CorpusException('works or a query must be given')
+    post = []
+    if works is not None:
+        for work in works:
+            if isinstance(work, tuple): # a file path and number
+                post.append((work, work[0], work[1]))
+            else:
+                post.append((work, _getWorkPath(work), None))
+    if queryKeywords is not None:
+        for fp, number in query(**queryKeywords):
+            post.append(((fp, number), fp, number))
+    return post
+
+def _getMapCacheFp(func, version, fp, number):
+    '''Return the file path in the scratch directory of a result of :func:`~music21.corpus.map`.
+    '''
+    funcName = '%s.%s' % (func.__module__, func.__name__)
+    return os.path.join(environLocal.getRootTempDir(), 'm21-map-' + 
+        common.getMd5(repr((funcName, version, os.path.abspath(fp), number))) + 
+        '.p')
+
+def _readMapCache(fpCache, fp):
+    '''Return a list holding the cached result of a work, or None if there is no cached result or the file has been changed since it was stored.
+    '''
+    if not os.path.exists(fpCache):
+        return None
+    try:
+        f = open(fpCache, 'rb')
+        try:
+            mtime, result = pickle.load(f)
+        finally:
+            f.close()
+    except Exception: # a partial or outdated file: compute again
+        return None
+    if mtime != os.path.getmtime(fp):
+        return None
+    return [result]
+
+def _writeMapCache(fpCache, fp, result):
+    f = open(fpCache, 'wb')
+    try:
+        pickle.dump((os.path.getmtime(fp), result), f, 
+            pickle.HIGHEST_PROTOCOL)
+    finally:
+        f.close()
+
+def _mapWorker(args):
+    '''Parse one work and call the function on it, returning the index of the work, the result, and an error message (None on success).
+    '''
+    i, func, fp, number, forceSource = args
+    try:
+        streamObj = converter.parse(fp, forceSource=forceSource, number=number)
+        _addCorpusFilepath(streamObj, fp)
+        return (i, func(streamObj), None)
+    except Exception as e: # reported, with the work, in the parent
+        return (i, None, '%s: %s' % (e.__class__.__name__, e))
+
+def map(func, works=None, query=None, processes=None, chunksize=1, 
+    onError='raise', ordered=False, version=None, forceSource=False):
+    '''
+    Parse each work in `works`, a list of work names as given to :func:`~music21.corpus.parse` or of (file path, number) pairs, and call `func` with the parsed Stream, yielding (work, result) pairs. `query` may be given instead of, or in addition to, `works`: a dictionary of keywords for :func:`~music21.corpus.query`, whose matching works are given as (file path, number) pairs.
+
+    If `processes` is greater than 1, works are parsed and processed in a pool of worker processes, `chunksize` works at a time; `func` and its results must then be picklable, so `func` should be defined at the top level of a module. Pairs are yielded as soon as each work is processed; if `ordered` is True, they are yielded in the order of the works.
+
+    `onError` defines what happens when a work cannot be parsed or processed: 'raise' (the default) raises a CorpusException, 'ignore' skips the work, and a function, called with the work and an error message, gives the result yielded for the work.
+
+    If `version` is not None, results are stored in the scratch directory, keyed by the work, the name of `func`, and `version`, and are reused while the file of the work is unchanged; change `version` whenever `func` is changed.
+
+    >>> from music21 import *
+    >>> def countParts(s):
+    ...     return len(s.parts)
+    >>> post = corpus.map(countParts, ['bwv66.6', 'bach/bwv324.xml'], ordered=True)
+    >>> list(post)
+    [('bwv66.6', 4), ('bach/bwv324.xml', 4)]
+    >>> list(corpus.map(countParts, [('/no/such/file.xml', None)], onError=lambda work, msg: -1))
+    [(('/no/such/file.xml', None), -1)]
+    '''
+    mapWorks = _getMapWorks(works, query)
+
+    # cached results are yielded first, unless ordered
+    post = {} # results waiting to be yielded in order
+    jobs = []
+    fpCacheList = [None] * len(mapWorks)
+    for i, (work, fp, number) in enumerate(mapWorks):
+        if version is not None and os.path.exists(fp):
+            fpCacheList[i] = _getMapCacheFp(func, version, fp, number)
+            if not forceSource:
+                cached = _readMapCache(fpCacheList[i], fp)
+                if cached is not None:
+                    if ordered:
+                        post[i] = cached
+                    else:
+                        yield (work, cached[0])
+                    continue
+        jobs.append((i, func, fp, number, forceSource))
+
+    if processes is None or processes <= 1 or len(jobs) <= 1:
+        results = (_mapWorker(job) for job in jobs)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(processes=processes)
+        results = pool.imap_unordered(_mapWorker, jobs, chunksize)
+
+    try:
+        iNext = 0 # the next index to yield, if ordered
+        for i, result, msg in results:
+            work = mapWorks[i][0]
+            if msg is not None:
+                if onError == 'raise':
+                    raise CorpusException('cannot process %s: %s' % (work, msg))
+                elif onError == 'ignore':
+                    environLocal.printDebug(['cannot process', work, msg])
+                    post[i] = None
+                elif callable(onError):
+                    post[i] = [onError(work, msg)]
+                else:
+                    raise CorpusException('no such onError value: %s' % onError)
+            else:
+                if fpCacheList[i] is not None:
+                    _writeMapCache(fpCacheList[i], mapWorks[i][1], result)
+                post[i] = [result]
+            if not ordered:
+                if post[i] is not None:
+                    yield (work, post[i][0])
+                del post[i]
+                continue
+            while iNext < len(mapWorks) and iNext in post:
+                if post[iNext] is not None:
+                    yield (mapWorks[iNext][0], post[iNext][0])
+                del post[iNext]
+                iNext += 1
+        if ordered: # cached results after the last computed result
+            for i in sorted(post):
+                yield (mapWorks[i][0], post[i][0])
+        if pool is not None:
+            pool.close()
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+def mapReduce(func, reduceFunc, initial=None, **keywords):
+    '''
+    Call `func` on works with :func:`~music21.corpus.map`, to which the remaining keywords are given, and combine the results with `reduceFunc`, called with the combined value so far (starting with `initial`) and the result of each work, in the order in which the works are processed.
+
+    >>> from music21 import *
+    >>> def countNotes(s):
+    ...     return len(s.flat.notes)
+    >>> corpus.mapReduce(countNotes, lambda x, y: x + y, 0, 
+    ...     works=['bwv66.6', 'bach/bwv324.xml'])
+    269
+    '''
+    value = initial
+    for unused, result in map(func, **keywords):
+        value = reduceFunc(value, result)
+    return value
+
 def parseWork(*arguments, **keywords):
     '''This function exists for backwards compatibility. All calls should use :func:`~music21.corpus.parse` instead.
     '''
@@ -1210,6 +1587,37 @@ class Test(unittest.TestCase):
 
 
 
+    def testPathIndex(self):
+        import shutil, tempfile
+        fpRoot = tempfile.mkdtemp(dir=environLocal.getRootTempDir())
+        try:
+            os.mkdir(os.path.join(fpRoot, 'composer'))
+            for fn in ['a.krn', 'b.abc', '.hidden.krn']:
+                open(os.path.join(fpRoot, 'composer', fn), 'w').close()
+            self.assertEqual(_findPaths(fpRoot, ['.krn']), 
+                [os.path.join(fpRoot, 'composer', 'a.krn')])
+            self.assertEqual(os.path.exists(_getPathIndexFp(fpRoot)), True)
+
+            # a stored index is read while directories are unchanged
+            del _pathIndexCache[fpRoot]
+            self.assertEqual(len(_findPaths(fpRoot, ['.krn', '.abc'])), 2)
+
+            # adding a file changes the modification time of its directory
+            del _pathIndexCache[fpRoot]
+            fpDir = os.path.join(fpRoot, 'composer')
+            open(os.path.join(fpDir, 'c.krn'), 'w').close()
+            os.utime(fpDir, (0, os.path.getmtime(fpDir) + 10))
+            self.assertEqual(len(_findPaths(fpRoot, ['.krn'])), 2)
+
+            workIndex = _getWorkIndex(fpRoot, ['.krn'])
+            self.assertEqual(len(workIndex['composer']), 2)
+            self.assertEqual(workIndex['composer/c'], 
+                             workIndex['c.krn'])
+        finally:
+            del _pathIndexCache[fpRoot]
+            os.remove(_getPathIndexFp(fpRoot))
+            shutil.rmtree(fpRoot)
+
     def testGetWorkList(self):
         self.assertEqual(len(getPaths('.md')) >= 38, True)
 
@@ -1235,6 +1643,56 @@ class Test(unittest.TestCase):
             self.assertEqual(len(getWorkList(bwv, 2)), 1)
 
 
+    def testMap(self):
+        import shutil, tempfile
+        works = ['bwv66.6', 'bach/bwv324.xml', 'bach/bwv1.6.mxl']
+        serial = list(map(len, works, ordered=True))
+        self.assertEqual([work for work, unused in serial], works)
+
+        post = list(map(len, works, processes=2))
+        self.assertEqual(sorted(post), sorted(serial))
+        post = list(map(len, works, processes=2, ordered=True))
+        self.assertEqual(post, serial)
+        self.assertEqual(mapReduce(len, max, 0, works=works, processes=2), 
+                         max([result for unused, result in serial]))
+
+        # failures are reported per work
+        works = ['bwv66.6', ('/no/such/file.xml', None)]
+        self.assertRaises(CorpusException, list, map(len, works))
+        self.assertEqual(len(list(map(len, works, onError='ignore'))), 1)
+        errors = []
+        post = list(map(len, works, ordered=True, processes=2, 
+                        onError=lambda work, msg: errors.append(work)))
+        self.assertEqual(post[1], (works[1], None))
+        self.assertEqual(errors, [works[1]])
+
+        # results are cached by work and version until the file changes
+        fpDir = tempfile.mkdtemp()
+        try:
+            fp = os.path.join(fpDir, 'test.abc')
+            shutil.copy(os.path.join(common.getCorpusFilePath(), 
+                'essenFolksong', 'altdeu10.abc'), fp)
+            calls = []
+            def countCalls(s):
+                calls.append(s.corpusFilepath)
+                return len(s.flat.notes)
+            version = common.getMd5()
+            first = list(map(countCalls, [(fp, 1)], version=version))
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(list(map(countCalls, [(fp, 1)], version=version)), 
+                             first)
+            self.assertEqual(len(calls), 1)
+            list(map(countCalls, [(fp, 2)], version=version))
+            self.assertEqual(len(calls), 2)
+            os.utime(fp, (0, os.path.getmtime(fp) + 10))
+            self.assertEqual(list(map(countCalls, [(fp, 1)], version=version)), 
+                             first)
+            self.assertEqual(len(calls), 3)
+        finally:
+            for number in (1, 2):
+                os.remove(_getMapCacheFp(countCalls, version, fp, number))
+            shutil.rmtree(fpDir)
+
     def testWTCImport(self):
         from music21 import corpus
         s = corpus.parse('bach/bwv846', 1)
@@ -1265,7 +1723,7 @@ class Test(unittest.TestCase):
 
 #-------------------------------------------------------------------------------
 # define presented order in documentation
-_DOC_ORDER = [parse, getWork]
+_DOC_ORDER = [parse, parseMany, map, mapReduce, getWork]
 
 
 if __name__ == "__main__":
@@ -16,7 +16,9 @@ numbering schemes and filters and includes the Iterator()
 class for easily iterating through the chorale collection.
 '''
 
+import multiprocessing
 import music21
+from music21 import converter
 from music21.corpus import base
 import unittest, doctest
 
@@ -910,6 +912,34 @@ class ChoraleListRKBWV(object):
 
 
 
+#-------------------------------------------------------------------------------
+def _parseChorale(filename, analysisNumber=None):
+    '''
+    Parse a chorale, inserting the Roman numeral analysis numbered `analysisNumber` as an additional part if it is given and is in the corpus.
+    '''
+    chorale = base.parse(filename)
+    if analysisNumber is not None:
+        try:
+            riemenschneiderName = 'bach/choraleAnalyses/riemenschneider%03d.rntxt' % analysisNumber
+            analysis = base.parse(riemenschneiderName)
+            if analysis is not None:
+                chorale.insert(0, analysis.parts[0])
+        except: # fail silently
+            pass
+    return chorale
+
+def _prefetchChorale(args):
+    '''
+    Parse a chorale in a worker process, returning it pickled, or None if it cannot be parsed or pickled; the chorale is then parsed again, and any error raised, by the Iterator.
+
+    Chorales are frozen in the 'cpickle' format, as the default pure-Python pickle takes longer to load than the chorale takes to parse.
+    '''
+    try:
+        return converter.freezeStr(_parseChorale(*args), fmt='cpickle')
+    except Exception: # parse again in the main process
+        return None
+
+
 class Iterator(object):
     '''
     This is a class for iterating over many Bach Chorales. It is designed to make it easier to use
@@ -933,6 +963,8 @@ class Iterator(object):
     
     numberList = [list, of, numbers]
     
+    prefetch = the number of chorales to parse ahead in a pool of worker processes (default 0); see the `prefetch` attribute
+    
     >>> from music21 import *
     >>> for chorale in corpus.chorales.Iterator(1,4, returnType = 'filename'):
     ...    print chorale
@@ -1002,6 +1034,12 @@ class Iterator(object):
     University.  To get them as an additional part to the score set returnType to "stream", and
     add a keyword "analysis = True":
     
+    
+    When each chorale is processed at length, set `prefetch` to parse the following chorales in a pool of worker processes while the current one is used; no more than `prefetch` chorales are parsed ahead. Call :meth:`~music21.corpus.chorales.Iterator.close` to stop the worker processes if iteration is not completed.
+    
+    >>> BCI = corpus.chorales.Iterator(1, 3, prefetch=2)
+    >>> [len(chorale.parts) for chorale in BCI]
+    [4, 4, 4]
     '''
     _DOC_ORDER = ['numberingSystem', 'currentNumber', 'highestNumber', 'titleList', 'numberList', 'returnType', 'iterationType']
     
@@ -1026,6 +1064,9 @@ class Iterator(object):
         self._returnType = 'stream'
         self._iterationType = 'number'
         self.analysis = False
+        self.prefetch = 0
+        self._pool = None
+        self._prefetched = {} # parse arguments to pending results
         
         self._choraleList1 = ChoraleList() #For budapest, baerenreiter
         self._choraleList2 = ChoraleListRKBWV() #for kalmus, riemenschneider, title, and bwv
@@ -1043,6 +1084,8 @@ class Iterator(object):
                 self.iterationType = kwargs[key]
             elif key is 'analysis':
                 self.analysis = kwargs[key]
+            elif key is 'prefetch':
+                self.prefetch = kwargs[key]
         
         #These assignements must come after .iterationType
 
@@ -1066,13 +1109,66 @@ class Iterator(object):
         whatever the current numberingSystem is set to. If the _currentIndex becomes higher than the _highestIndex, the iteration stops.
         '''
         if self._currentIndex > self._highestIndex:
+            self.close()
             raise StopIteration
+        elif self.prefetch > 0 and self._returnType is 'stream':
+            nextChorale = self._returnPrefetched()
+            self._currentIndex += 1
+            return nextChorale
         else:
             nextChorale = self._returnCurrent()
             self._currentIndex += 1
             return nextChorale
+
+    def close(self):
+        '''
+        Stop the worker processes that parse chorales ahead when `prefetch` is set, discarding chorales that have been parsed ahead. This is done when iteration is complete; iteration can continue after closing, starting new worker processes.
+        '''
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        self._prefetched = {}
+
+    def __del__(self):
+        # an Iterator abandoned before iteration is complete must still
+        # stop its worker processes
+        if getattr(self, '_pool', None) is not None:
+            self.close()
     
     #---Functions
+    def _getParseArgs(self, index):
+        '''
+        Return the file name and the analysis number (or None) of the chorale at an index, as given to :func:`~music21.corpus.chorales._parseChorale`.
+        '''
+        filename = self._getFilename(index)
+        if self.numberingSystem is 'riemenschneider' and self.analysis == True:
+            return (filename, index + 1)
+        return (filename, None)
+
+    def _returnPrefetched(self):
+        '''
+        Return the chorale at the _currentIndex, parsed by a worker process, after starting to parse the chorales up to `prefetch` indices ahead. Chorales that are no longer ahead, because the range or the numberingSystem have changed, are discarded.
+        '''
+        highestIndex = min(self._currentIndex + self.prefetch, self._highestIndex)
+        argsList = [self._getParseArgs(i) for i in 
+                    range(self._currentIndex, highestIndex + 1)]
+        for args in self._prefetched.keys():
+            if args not in argsList:
+                del self._prefetched[args]
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(
+                processes=min(self.prefetch, multiprocessing.cpu_count()))
+        for args in argsList:
+            if args not in self._prefetched:
+                self._prefetched[args] = self._pool.apply_async(
+                    _prefetchChorale, (args,))
+
+        data = self._prefetched.pop(argsList[0]).get()
+        if data is None:
+            return _parseChorale(*argsList[0])
+        return converter.unfreezeStr(data, fmt='cpickle')
+
     def _returnCurrent(self):
         '''
         This returns a chorale based upon the _currentIndex and the numberingSystem. The numberList is the list
@@ -1156,6 +1252,17 @@ class Iterator(object):
         'bach/bwv253'       
         
         
+        '''
+        if self._returnType is 'stream':
+            return _parseChorale(*self._getParseArgs(self._currentIndex))
+        elif self._returnType is 'filename':
+            return self._getFilename(self._currentIndex)
+        else:
+            raise Exception("An unexpected returnType %s was introduced. This should not happen." % self._returnType)
+
+    def _getFilename(self, index):
+        '''
+        Return the corpus file name of the chorale at an index of the numberList, or of the titleList if the numberingSystem is 'title'.
         '''
         if self.numberingSystem is None:
             raise BachException("Cannot parse Chorales because no .numberingSystem set.")
@@ -1163,33 +1270,18 @@ class Iterator(object):
             if self._titleList is None:
                 raise BachException("Cannot parse Chorales because no titles to parse.")
             else:
-                filename = 'bach/bwv'+ str(self._choraleList2.byTitle[self.titleList[self._currentIndex]]['bwv'])
+                filename = 'bach/bwv'+ str(self._choraleList2.byTitle[self.titleList[index]]['bwv'])
         elif self.numberingSystem is 'riemenschneider':
-            filename = 'bach/bwv' + str(self._choraleList2.byRiemenschneider[self._numberList[self._currentIndex]]['bwv'])
+            filename = 'bach/bwv' + str(self._choraleList2.byRiemenschneider[self._numberList[index]]['bwv'])
         elif self.numberingSystem is 'baerenreiter':
-            filename = 'bach/bwv' + str(self._choraleList1.byBaerenreiter[self._numberList[self._currentIndex]]['bwv'])
+            filename = 'bach/bwv' + str(self._choraleList1.byBaerenreiter[self._numberList[index]]['bwv'])
         elif self.numberingSystem is 'budapest':
-            filename = 'bach/bwv' + str(self._choraleList1.byBudapest[self._numberList[self._currentIndex]]['bwv'])
+            filename = 'bach/bwv' + str(self._choraleList1.byBudapest[self._numberList[index]]['bwv'])
         elif self.numberingSystem is 'kalmus':
-            filename = 'bach/bwv' + str(self._choraleList2.byKalmus[self._numberList[self._currentIndex]]['bwv'])
-        else:
-            filename = 'bach/bwv' + str(self._numberList[self._currentIndex])
-        
-        if self._returnType is 'stream':
-            chorale = base.parse(filename)
-            if self.numberingSystem is 'riemenschneider' and self.analysis == True:
-                try:
-                    riemenschneiderName = 'bach/choraleAnalyses/riemenschneider%03d.rntxt' % (self._currentIndex + 1)
-                    analysis = base.parse(riemenschneiderName)
-                    if analysis is not None:
-                        chorale.insert(0, analysis.parts[0])
-                except: # fail silently
-                    pass
-            return chorale
-        elif self._returnType is 'filename':
-            return filename
+            filename = 'bach/bwv' + str(self._choraleList2.byKalmus[self._numberList[index]]['bwv'])
         else:
-            raise Exception("An unexpected returnType %s was introduced. This should not happen." % self._returnType)
+            filename = 'bach/bwv' + str(self._numberList[index])
+        return filename
         
     def _initializeNumberList(self):
         '''
@@ -1554,6 +1646,40 @@ class Test(unittest.TestCase):
     def runTest(self):
         pass
 
+    def testPrefetch(self):
+        serial = [chorale.flat.notes.highestTime for chorale in 
+                  Iterator(1, 3, analysis=True)]
+        BCI = Iterator(1, 3, analysis=True, prefetch=2)
+        post = []
+        for chorale in BCI:
+            post.append(chorale.flat.notes.highestTime)
+            self.assertEqual(len(BCI._prefetched) <= 2, True)
+        self.assertEqual(post, serial)
+        self.assertEqual(BCI._pool, None)
+
+        # changing the range discards chorales parsed ahead
+        BCI = Iterator(1, 10, prefetch=3)
+        unused = BCI.next()
+        self.assertEqual(len(BCI._prefetched), 3)
+        BCI.currentNumber = 7
+        self.assertEqual(BCI.next().corpusFilepath, 
+                         Iterator(7, 7).next().corpusFilepath)
+        ahead = [BCI._getParseArgs(i) for i in range(6, 10)]
+        self.assertEqual(BCI._getParseArgs(0) in ahead, False)
+        self.assertEqual(len(BCI._prefetched), 3)
+        for args in BCI._prefetched:
+            self.assertEqual(args in ahead, True)
+        BCI.close()
+        self.assertEqual(BCI._pool, None)
+
+        # an abandoned Iterator stops its worker processes
+        from multiprocessing import pool
+        BCI = Iterator(1, 10, prefetch=2)
+        unused = BCI.next()
+        workerPool = BCI._pool
+        del BCI
+        self.assertEqual(workerPool._state, pool.TERMINATE)
+
 class TestExternal(unittest.TestCase):
 
     def runTest(self):
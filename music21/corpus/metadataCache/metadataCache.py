@@ -13,6 +13,8 @@
 Run this module to process all files in the corpus. 
 '''
 
+import os
+
 from music21 import common
 
 
@@ -28,8 +30,11 @@ class MetadataCacheException(Exception):
 
 
 
-def cacheMetadata(domainList=['core', 'virtual']): 
+def cacheMetadata(domainList=['core', 'virtual'], processes=None, 
+    rebuild=False, useDatabase=False, metadataOnly=True): 
     '''The core cache is all locally-stored corpus files. 
+
+    Unless `rebuild` is True, an existing cache is updated: only files that are new or have changed since the cache was written are parsed. If `processes` is greater than 1, files are parsed in a pool of worker processes. If `useDatabase` is True, a :class:`~music21.metadata.MetadataDatabase` is written next to each bundle. Unless `metadataOnly` is False, files in formats that support it are read without creating Streams; see :func:`~music21.converter.parse`.
     '''
     from music21 import corpus, metadata
 
@@ -63,11 +68,19 @@ def cacheMetadata(domainList=['core', 'virtual']):
         environLocal.printDebug([
             'metadata cache: starting processing of paths:', len(paths)])
     
+        if not rebuild and os.path.exists(mdb._getFilePath()):
+            mdb.read()
+
         #mdb.addFromPaths(paths[-3:])
         # returns any paths that failed to load
-        fpError += mdb.addFromPaths(paths) 
+        fpError += mdb.updateFromPaths(paths, processes=processes, 
+            metadataOnly=metadataOnly) 
         #print mdb._storage
         mdb.write() # will use a default file path based on domain
+        if useDatabase:
+            db = metadata.MetadataDatabase(domain)
+            db.write(mdb)
+            db.close()
 
         environLocal.printDebug(['cache: writing time:', t, 'md items:', len(mdb._storage)])
         del mdb
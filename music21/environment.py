@@ -22,7 +22,6 @@ Additional documentation for and examples of using this module are found in :ref
 
 
 import os, sys
-import tempfile
 import doctest, unittest
 import xml.sax
 
@@ -169,7 +168,10 @@ class _EnvironmentCore(object):
     def __init__(self, forcePlatform=None):
         # only create one
         #sys.stderr.write('creating singelton _EnvironmentCore\n')
+        # the settings file is read on first access of the ref dictionary
+        self._settingsLoaded = True
         self._ref = {}
+        self._defaultRootTempDir = None
         # define all settings that are paths
         # store names of all values that are keys; check for validity
         self._keysToPaths = [] 
@@ -185,7 +187,18 @@ class _EnvironmentCore(object):
         self._loadDefaults(forcePlatform=forcePlatform) 
         # read will only right over values if set in field
         if forcePlatform is None: # only read if not forcing platform
-            self.read() # load a stored file if available
+            self._settingsLoaded = False # load a stored file if available
+
+    def _getRef(self):
+        if not self._settingsLoaded:
+            self._settingsLoaded = True
+            self.read()
+        return self._refStorage
+
+    def _setRef(self, value):
+        self._refStorage = value
+
+    _ref = property(_getRef, _setRef)
 
     def getKeysToPaths(self):
         return self._keysToPaths
@@ -243,6 +256,7 @@ class _EnvironmentCore(object):
                 self.__setitem__(name, value) # use for key checking
 
     def restoreDefaults(self):
+        self._settingsLoaded = True # do not read the settings file
         self._ref = {}
         self._loadDefaults() # defines all valid keys in ref
 
@@ -391,21 +405,30 @@ class _EnvironmentCore(object):
             fp = self.getSettingsPath()
         if not os.path.exists(fp):
             return None # do nothing if no file exists
+        self._settingsLoaded = True
 
-        saxparser = xml.sax.make_parser()
-        saxparser.setFeature(xml.sax.handler.feature_external_ges, 0)
-        saxparser.setFeature(xml.sax.handler.feature_external_pes, 0)
-        saxparser.setFeature(xml.sax.handler.feature_namespaces, 0)  
-    
-        h = SettingsHandler() 
-        saxparser.setContentHandler(h)
-        f = open(fp) # file i/o might be done outside of loop
-        saxparser.parse(f)
-        f.close()    
+        # settings are parsed once per process, unless the file changes
+        stat = os.stat(fp)
+        fileKey = (stat.st_mtime, stat.st_size)
+        if fp in _settingsCache and _settingsCache[fp][0] == fileKey:
+            settings = _settingsCache[fp][1]
+        else:
+            saxparser = xml.sax.make_parser()
+            saxparser.setFeature(xml.sax.handler.feature_external_ges, 0)
+            saxparser.setFeature(xml.sax.handler.feature_external_pes, 0)
+            saxparser.setFeature(xml.sax.handler.feature_namespaces, 0)  
+        
+            h = SettingsHandler() 
+            saxparser.setContentHandler(h)
+            f = open(fp) # file i/o might be done outside of loop
+            saxparser.parse(f)
+            f.close()    
+            settings = h.getSettings()
+            _settingsCache[fp] = (fileKey, settings)
 
         # load from XML into dictionary
         # updates self._ref in place
-        self._fromSettings(h.getSettings(), self._ref)
+        self._fromSettings(settings, self._ref)
 
     def _toSettings(self, ref):
         '''Convert a ref dictionary to a Settings object
@@ -442,23 +465,31 @@ class _EnvironmentCore(object):
         f = open(fp, 'w')
         f.write(settings.xmlStr())
         f.close()
+        # the modification time may not change within a second
+        if fp in _settingsCache:
+            del _settingsCache[fp]
 
     #---------------------------------------------------------------------------
     # utility methods for commonly needed OS services
 
     def getDefaultRootTempDir(self):
         # this returns the root temp dir; this does not create a new dir
+        # the directory is found once, on first use, as 
+        # tempfile.gettempdir() probes candidate directories by writing to them
+        if (self._defaultRootTempDir is not None and 
+            os.path.exists(self._defaultRootTempDir)):
+            return self._defaultRootTempDir
+        import tempfile
         dstDir = os.path.join(tempfile.gettempdir(), 'music21')
         # if this path already exists, we have nothing more to do
-        if os.path.exists(dstDir): 
-            return dstDir
-        else:
+        if not os.path.exists(dstDir): 
             # make this directory as a temp directory
             try:
                 os.mkdir(dstDir)
             except OSError: # cannot make the directory
                 dstDir = tempfile.gettempdir()
-            return dstDir
+        self._defaultRootTempDir = dstDir
+        return dstDir
 
     def getRootTempDir(self):
         if self._ref['directoryScratch'] is None:
@@ -475,6 +506,7 @@ class _EnvironmentCore(object):
         note that the file is closed after finding, so some older versions
         of python/OSes, etc. will immediately delete the file.
         '''
+        import tempfile
         # get the root dir, which may be the user-specified dir
         rootDir = self.getRootTempDir()
 
@@ -557,6 +589,10 @@ class _EnvironmentCore(object):
 
 #-------------------------------------------------------------------------------
 # store one instance of _EnvironmentCore within this module
+# parsed settings files, as pairs of (modification time, size) and Settings 
+# objects, keyed by file path
+_settingsCache = {}
+
 # this is a module-level implementation of the singleton pattern
 # reloading the module will force a recreation of the module
 _environStorage = {'instance':None, 'forcePlatform':None}
@@ -1133,6 +1169,44 @@ class Test(unittest.TestCase):
         self.assertEqual(env['localCorpusSettings'], ['a', 'b'])
 
 
+    def testReadSettings(self):
+        import tempfile
+        # the settings file is read on first access
+        core = _EnvironmentCore()
+        self.assertEqual(core._settingsLoaded, False)
+        post = core['debug']
+        self.assertEqual(core._settingsLoaded, True)
+
+        fd, fp = tempfile.mkstemp(suffix='.xml')
+        os.close(fd)
+        try:
+            core = _EnvironmentCore(forcePlatform='nix')
+            core['midiPath'] = 'a'
+            core.write(fp)
+            self.assertEqual(fp in _settingsCache, False)
+
+            core = _EnvironmentCore(forcePlatform='nix')
+            core.read(fp)
+            self.assertEqual(core['midiPath'], 'a')
+            settings = _settingsCache[fp][1]
+            # reading again reuses the parsed settings
+            core.read(fp)
+            self.assertEqual(_settingsCache[fp][1] is settings, True)
+
+            # changed files are parsed again
+            core['midiPath'] = 'bc'
+            core.write(fp)
+            os.utime(fp, (0, os.path.getmtime(fp) + 10))
+            core = _EnvironmentCore(forcePlatform='nix')
+            core.read(fp)
+            self.assertEqual(core['midiPath'], 'bc')
+            self.assertEqual(_settingsCache[fp][1] is settings, False)
+        finally:
+            os.remove(fp)
+            if fp in _settingsCache:
+                del _settingsCache[fp]
+
+
 #-------------------------------------------------------------------------------
 # define presented order in documentation
 _DOC_ORDER = [UserSettings, Environment, Preference]
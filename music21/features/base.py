@@ -975,6 +975,41 @@ class DataSet(object):
         self.dataInstances.append(di)
         self.streams.append(s)
 
+    def addMultipleData(self, dataList, classValues, ids=None, processes=None):
+        '''Add a list of Streams, DataInstances, or paths to corpus or local files to this data set, with a list of class values and an optional list of ids. 
+
+        Paths are parsed with :func:`~music21.converter.parseMany`; if `processes` is greater than 1, they are parsed in a pool of worker processes.
+        '''
+        if len(classValues) != len(dataList):
+            raise DataSetException('the number of class values must match the number of data')
+        if ids is None:
+            ids = [None] * len(dataList)
+        elif len(ids) != len(dataList):
+            raise DataSetException('the number of ids must match the number of data')
+
+        # resolve all paths first, so that they can be parsed together
+        paths = []
+        for data in dataList:
+            if common.isStr(data):
+                if os.path.exists(data) or data.startswith('http'):
+                    paths.append(data)
+                else: # assume corpus; take the first of many matches
+                    fp = corpus.getWork(data)
+                    if common.isListLike(fp):
+                        fp = fp[0]
+                    paths.append(fp)
+        parsed = converter.parseMany(paths, processes=processes)
+        parsed.reverse()
+
+        for data, classValue, id in zip(dataList, classValues, ids):
+            if common.isStr(data):
+                s = parsed.pop()
+                # assume we can use this string as an id
+                di = DataInstance(s, id=data)
+                self.addData(di, classValue=classValue)
+            else:
+                self.addData(data, classValue=classValue, id=id)
+
     def process(self):
         '''Process all Data with all FeatureExtractors. Processed data is stored internally as numerous Feature objects. 
         '''
@@ -1358,6 +1393,17 @@ class Test(unittest.TestCase):
         ds.write(format='csv')
         ds.write(format='arff')
 
+    def testDataSetAddMultipleData(self):
+        from music21 import features
+        featureExtractors = features.extractorsById(['ql1', 'ql2', 'ql4'], 'native')
+        ds = features.DataSet(classLabel='Composer')
+        ds.addFeatureExtractors(featureExtractors)
+        ds.addMultipleData(['bwv66.6', 'hwv56/movement3-05.md'], 
+                           ['Bach', 'Handel'], processes=2)
+        ds.process()
+        of = OutputCSV(ds)
+        post = of.getString(lineBreak='//')
+        self.assertEqual(post, 'Identifier,Unique_Note_Quarter_Lengths,Most_Common_Note_Quarter_Length,Range_of_Note_Quarter_Lengths,Composer//bwv66.6,3,1.0,1.5,Bach//hwv56/movement3-05.md,7,0.5,3.75,Handel')
 
 
     def testFeatureFail(self):
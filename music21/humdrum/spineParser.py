@@ -24,8 +24,11 @@ music21's ability to parse humdrum.
 
 SpineParsing consists of several steps.
 
-* The data file is read in and all events are sliced horizontally (EventCollections) and vertically (Protospines)
-* Protospines are parsed into HumdrumSpines by following Spine Path Indicators (:samp:`*^` and :samp:`*v` especially)
+* The data file is read in and split into tab columns in one pass.  Spine Path Indicators 
+    (:samp:`*^` and :samp:`*v` especially) are followed as a map from column to HumdrumSpine, 
+    so each event is placed directly into its HumdrumSpine. (The same slicing can also be 
+    done horizontally (EventCollections) and vertically (Protospines); 
+    see :meth:`~music21.humdrum.spineParser.HumdrumDataCollection.parseProtoSpinesAndEventCollections`.)
     Protospines that separate become new Protospines with their parentSpine indicated.  Protospines
     that merge again then followed by the same Protospine as before.  This will cause problems if
     a voice remerges with another staff, but in practice I have not seen a .krn file that does this and
@@ -73,6 +76,9 @@ import os
 
 spinePathIndicators = ["*+", "*-", "*^", "*v", "*x", "*"]
 
+# store parsed kern note and rest tokens, keyed by token string
+_kernTokenCache = {}
+
 class HumdrumDataCollection(object):
     '''
     A HumdrumDataCollection takes in a mandatory list where each element
@@ -115,6 +121,9 @@ class HumdrumDataCollection(object):
     
     '''
     parsedLines = False
+    # set only if parseProtoSpinesAndEventCollections() is called
+    protoSpines = None
+    eventCollections = None
     
     def __init__(self, dataStream = [] ):
         if dataStream is []:
@@ -153,9 +162,7 @@ class HumdrumDataCollection(object):
         except AssertionError:
             raise HumdrumException('getEventListFromDataStream failed: did not parse entire file')
 
-        self.parseProtoSpinesAndEventCollections()
-        
-        self.spineCollection = self.createHumdrumSpines()
+        self.spineCollection = self.parseSpineColumns()
         self.spineCollection.createMusic21Streams()
         self.parsedLines = True
 
@@ -217,9 +224,9 @@ class HumdrumDataCollection(object):
             line = line.rstrip()
             if line == "":
                 continue # technically forbidden by Humdrum but the source of so many errors!
-            elif re.match('\!\!\!', line):
+            elif line.startswith('!!!'):
                 self.eventList.append(GlobalReference(self.parsePositionInStream, line))
-            elif re.match('\!\!', line): ## find global comments at the top of the line
+            elif line.startswith('!!'): ## find global comments at the top of the line
                 self.eventList.append(GlobalComment(self.parsePositionInStream, line))
             else:
                 thisLine = SpineLine(self.parsePositionInStream, line)
@@ -368,6 +375,159 @@ class HumdrumDataCollection(object):
         
         return (returnProtoSpines, returnEventCollections)
 
+    def parseSpineColumns(self):
+        r'''
+        Run after :meth:`~music21.humdrum.spineParser.HumdrumDataCollection.parseEventListFromDataStream()`
+        to split each SpineLine of self.eventList into its tab columns
+        and place each cell directly into the HumdrumSpine currently
+        at that column.  Spine path indicators are followed (with
+        the same rules as 
+        :meth:`~music21.humdrum.spineParser.HumdrumDataCollection.createHumdrumSpines`)
+        by updating the list that maps column index to HumdrumSpine.
+        
+
+        This gives the same :class:`~music21.humdrum.spineParser.SpineCollection`
+        as calling parseProtoSpinesAndEventCollections() and then
+        createHumdrumSpines(), but does not create ProtoSpine or 
+        EventCollection objects, or SpineEvent objects for empty cells.
+        
+
+        >>> from music21 import *
+        >>> eventString = "!!! COM: Beethoven, Ludwig van\n" + \
+        ...               "**kern\t**dynam\n" + \
+        ...               "*^\t*\n" + \
+        ...               "C4\te4\tpp\n" + \
+        ...               "*v\t*v\t*\n" + \
+        ...               "D8\t.\n"
+        >>> hdc = music21.humdrum.spineParser.HumdrumDataCollection(eventString)
+        >>> sc = hdc.parseSpineColumns()
+        >>> for spine in sc.spines:
+        ...     print spine, [str(e) for e in spine.eventList]
+        Spine: 0 [parent of: 2 3  ] ['**kern', '*^', 'D8']
+        Spine: 1 ['**dynam', '*', 'pp', '*', '.']
+        Spine: 2 [child of: 0] ['C4', '*v']
+        Spine: 3 [child of: 0] ['e4', '*v']
+        '''
+        if self.eventList == []:
+            self.parseEventListFromDataStream()
+
+        # currentSpineList is a list of currently active
+        # spines ordered from left to right.
+        currentSpineList = common.defList(default = None)
+        spineCollection = SpineCollection()
+
+        for i, thisLine in enumerate(self.eventList):
+            if thisLine.isSpineLine is not True:
+                continue # global events do not belong to spines
+            lineEvents = []
+            spinePathData = False
+            for j, contents in enumerate(thisLine.spineData):
+                thisEvent = SpineEvent(contents, i)
+                currentSpine = currentSpineList[j]
+                if currentSpine is None: 
+                    ## first event after a None = new spine because 
+                    ## Humdrum does not require *+ at the beginning
+                    currentSpine = spineCollection.addSpine()
+                    currentSpine.insertPoint = i
+                    currentSpineList[j] = currentSpine
+                currentSpine.append(thisEvent)
+                # currentSpine.id is always unique in a spineCollection
+                thisEvent.protoSpineId = currentSpine.id
+                if contents in spinePathIndicators:
+                    spinePathData = True
+                lineEvents.append(thisEvent)
+
+            if spinePathData is True:
+                currentSpineList = self._followSpinePaths(spineCollection,
+                                   currentSpineList, lineEvents, i)
+        return spineCollection
+
+    def _followSpinePaths(self, spineCollection, currentSpineList, 
+        lineEvents, i):
+        '''
+        Given the list of currently active spines and a list of the
+        SpineEvents (or None) in each column of line i, where the line 
+        contains spine path data, return the list of spines active 
+        after that line, adding new spines to spineCollection as needed.
+
+        Columns beyond self.maxSpines are ignored.
+        '''
+        # note that nothing else can happen in an eventCollection
+        # except spine path data if any spine has spine path data.
+        # thus, this is illegal.  The C#4 will be ignored:
+        # *x     *x     C#4
+        newSpineList = common.defList()
+        mergerActive = False
+        exchangeActive = False
+        numEvents = len(lineEvents)
+        for j in range(0, self.maxSpines):
+            if j < numEvents:
+                thisEvent = lineEvents[j]
+            else:
+                thisEvent = None
+            currentSpine = currentSpineList[j]
+            if thisEvent is None and currentSpine is not None:
+                ## should this happen?
+                newSpineList.append(currentSpine)
+            elif thisEvent is None:
+                continue
+            elif thisEvent.contents == "*-":  ## terminate spine
+                currentSpine.endingPosition = i
+            elif thisEvent.contents == "*^":  ## split spine assume they are voices
+                newSpine1 = spineCollection.addSpine(streamClass = music21.stream.Voice)
+                newSpine1.insertPoint = i+1
+                newSpine1.parentSpine = currentSpine
+                newSpine1.isFirstVoice = True
+                newSpine2 = spineCollection.addSpine(streamClass = music21.stream.Voice)
+                newSpine2.insertPoint = i+1
+                newSpine2.parentSpine = currentSpine
+                currentSpine.endingPosition = i # will be overridden if merged
+                currentSpine.childSpines.append(newSpine1)
+                currentSpine.childSpines.append(newSpine2)
+                
+                currentSpine.childSpineInsertPoints[i] = (newSpine1, newSpine2)
+                newSpineList.append(newSpine1)
+                newSpineList.append(newSpine2)
+            elif thisEvent.contents == "*v":  #merge spine -- n.b. we allow non-adjacent lines to be merged. this is incorrect
+                if mergerActive is False:     #               per humdrum syntax, but is easily done.
+                    # assume that previous spine continues
+                    if currentSpine.parentSpine is not None:
+                        mergerActive = currentSpine.parentSpine
+                    else:
+                        mergerActive == True
+                    currentSpine.endingPosition = i
+                else:  ## if second merger code is not found then a one-to-one spine "merge" occurs
+                    currentSpine.endingPosition = i
+                    # merge back to parent if possible:
+                    if currentSpine.parentSpine is not None:
+                        newSpineList.append(currentSpine.parentSpine)
+                    # or merge back to other spine's parent:
+                    elif mergerActive is not True: # other spine parent set
+                        newSpineList.append(mergerActive)
+                    # or make a new spine...
+                    else:
+                        s = spineCollection.addSpine(streamClass = music21.stream.Part)
+                        s.insertPoint = i
+                        newSpineList.append(s)
+                    
+                    mergerActive = False
+
+            elif thisEvent.contents == "*x":  # exchange spine    
+                if exchangeActive is False:
+                    exchangeActive = currentSpine
+                else:  ## if second exchange is not found, then both lines disappear and exception is raised
+                       ## n.b. we allow more than one PAIR of exchanges in a line so long as the first
+                       ## is totally finished by the time the second happens
+                    newSpineList.append(currentSpine)
+                    newSpineList.append(exchangeActive)
+                    exchangeActive = False;
+            else:  ## null processing code "*" 
+                newSpineList.append(currentSpine)
+                
+        if exchangeActive is not False:
+            raise HumdrumException("ProtoSpine found with unpaired exchange instruction at line %d [%s]" % (i, lineEvents))
+        return newSpineList
+
     def createHumdrumSpines(self, protoSpines = None, eventCollections = None):
         '''
         Takes the data from the object's protoSpines and eventCollections
@@ -398,6 +558,8 @@ class HumdrumDataCollection(object):
 
         
         if protoSpines == None or eventCollections == None:
+            if self.protoSpines is None or self.eventCollections is None:
+                self.parseProtoSpinesAndEventCollections()
             protoSpines = self.protoSpines
             eventCollections = self.eventCollections
         maxSpines = len(protoSpines)
@@ -428,78 +590,11 @@ class HumdrumDataCollection(object):
                     thisEvent.protoSpineId = currentSpine.id
 
             # check for spinePathData
-            # note that nothing else can happen in an eventCollection
-            # except spine path data if any spine has spine path data.
-            # thus, this is illegal.  The C#4 will be ignored:
-            # *x     *x     C#4
             if thisEventCollection.spinePathData is True:
-                newSpineList = common.defList()
-                mergerActive = False
-                exchangeActive = False
-                for j in range(0, maxSpines):
-                    thisEvent = protoSpines[j].eventList[i]                 
-                    currentSpine = currentSpineList[j]
-                    if thisEvent is None and currentSpine is not None:
-                        ## should this happen?
-                        newSpineList.append(currentSpine)
-                    elif thisEvent is None:
-                        continue
-                    elif thisEvent.contents == "*-":  ## terminate spine
-                        currentSpine.endingPosition = i
-                    elif thisEvent.contents == "*^":  ## split spine assume they are voices
-                        newSpine1 = spineCollection.addSpine(streamClass = music21.stream.Voice)
-                        newSpine1.insertPoint = i+1
-                        newSpine1.parentSpine = currentSpine
-                        newSpine1.isFirstVoice = True
-                        newSpine2 = spineCollection.addSpine(streamClass = music21.stream.Voice)
-                        newSpine2.insertPoint = i+1
-                        newSpine2.parentSpine = currentSpine
-                        currentSpine.endingPosition = i # will be overridden if merged
-                        currentSpine.childSpines.append(newSpine1)
-                        currentSpine.childSpines.append(newSpine2)
-                        
-                        currentSpine.childSpineInsertPoints[i] = (newSpine1, newSpine2)
-                        newSpineList.append(newSpine1)
-                        newSpineList.append(newSpine2)
-                    elif thisEvent.contents == "*v":  #merge spine -- n.b. we allow non-adjacent lines to be merged. this is incorrect
-                        if mergerActive is False:     #               per humdrum syntax, but is easily done.
-                            # assume that previous spine continues
-                            if currentSpine.parentSpine is not None:
-                                mergerActive = currentSpine.parentSpine
-                            else:
-                                mergerActive == True
-                            currentSpine.endingPosition = i
-                        else:  ## if second merger code is not found then a one-to-one spine "merge" occurs
-                            currentSpine.endingPosition = i
-                            # merge back to parent if possible:
-                            if currentSpine.parentSpine is not None:
-                                newSpineList.append(currentSpine.parentSpine)
-                            # or merge back to other spine's parent:
-                            elif mergerActive is not True: # other spine parent set
-                                newSpineList.append(mergerActive)
-                            # or make a new spine...
-                            else:
-                                s = spineCollection.addSpine(streamClass = music21.stream.Part)
-                                s.insertPoint = i
-                                newSpineList.append(s)
-                            
-                            mergerActive = False
-
-                    elif thisEvent.contents == "*x":  # exchange spine    
-                        if exchangeActive is False:
-                            exchangeActive = currentSpine
-                        else:  ## if second exchange is not found, then both lines disappear and exception is raised
-                               ## n.b. we allow more than one PAIR of exchanges in a line so long as the first
-                               ## is totally finished by the time the second happens
-                            newSpineList.append(currentSpine)
-                            newSpineList.append(exchangeActive)
-                            exchangeActive = False;
-                    else:  ## null processing code "*" 
-                        newSpineList.append(currentSpine)
-                        
-                if exchangeActive is not False:
-                    raise HumdrumException("ProtoSpine found with unpaired exchange instruction at line %d [%s]" % (i, thisEventCollection.events))
-                currentSpineList = newSpineList
+                lineEvents = [protoSpines[j].eventList[i] for j in 
+                              range(0, maxSpines)]
+                currentSpineList = self._followSpinePaths(spineCollection,
+                                   currentSpineList, lineEvents, i)
         
         return spineCollection
     
@@ -949,7 +1044,11 @@ class HumdrumSpine(object):
         currentMeasureNumber = 0
         currentMeasureOffset = 0
         hasMeasureOne = False
-        for el in streamIn:
+        # inserting into a measure changes streamIn, the measure's site, 
+        # which would otherwise be sorted again on each iteration; 
+        # its order does not change
+        for el in list(streamIn.elements):
+            el.activeSite = streamIn
             if 'Stream' in el.classes:
                 if currentMeasureNumber != 0 or len(currentMeasure) > 0:
                     streamOut.append(currentMeasure)
@@ -1605,6 +1704,10 @@ def hdStringToNote(contents):
     Does not check to see that it is sane or part of a :samp:`**kern` spine, etc.
 
 
+    Each distinct string is parsed only once; the results are cached and
+    a new object is created from them on each call.
+
+
     New rhythmic extensions defined in
     http://wiki.humdrum.org/index.php/Rational_rhythms
     are fully implemented:
@@ -1644,84 +1747,94 @@ def hdStringToNote(contents):
     2
     '''
     
+    try:
+        kernToken = _kernTokenCache[contents]
+    except KeyError:
+        kernToken = _parseKernToken(contents)
+        _kernTokenCache[contents] = kernToken
+    return _kernTokenToNote(kernToken)
+
+def _connectedTurn():
+    t1 = music21.expressions.Turn()
+    t1.connectedToPrevious = True  ## true by default, but explicitly
+    return t1
+
+def _parseKernToken(contents):
+    '''
+    Parse a kern note or rest string into a tuple of the values needed
+    to create the music21 object: (pitch, accidental, tieType, 
+    expressions, articulations, stemDirection, durationSpec, grace, beams). 
+    pitch is a (step, octave) pair or None for a rest; expressions and 
+    articulations are lists of callables that return new objects.
+
+    >>> from music21 import *
+    >>> humdrum.spineParser._parseKernToken('8cc#L')
+    (('c', 5), '#', None, [], [], None, ('type', 'eighth', 0), None, [('start',)])
+    '''
     # http://www.lib.virginia.edu/artsandmedia/dmmc/Music/Humdrum/kern_hlp.html#kern
     
     # 3.2.1 -- pitch
     
     matchedNote = re.search("([a-gA-G]+)", contents)
 
-    thisObject = None
     if matchedNote:
-        thisObject = music21.note.Note()
         kernNoteName = matchedNote.group(1)
         step = kernNoteName[0].lower()
-        thisObject.step = step
         if (step == kernNoteName[0]): ## middle C or higher
             octave = 3 + len(kernNoteName)
         else: # below middle C
             octave = 4 - len(kernNoteName)
-        thisObject.octave = octave
+        pitchSpec = (step, octave)
 
     # 3.3 -- Rests
     elif contents.count("r"):
-        thisObject = music21.note.Rest()
+        pitchSpec = None
     else:
         raise HumdrumException("Could not parse %s for note information" % contents)
 
     matchedSharp = re.search("(\#+)", contents)
     matchedFlat  = re.search("(\-+)", contents)
     
+    accidental = None
     if matchedSharp:
-        thisObject.accidental = matchedSharp.group(0)
+        accidental = matchedSharp.group(0)
     elif matchedFlat:
-        thisObject.accidental = matchedFlat.group(0)
+        accidental = matchedFlat.group(0)
     elif contents.count("n"):
-        thisObject.accidental = "n"
+        accidental = "n"
     
     # 3.2.2 -- Slurs, Ties, Phrases
-    # TODO: add music21 phrase information
-    if contents.count('{'):
-        for i in range(0, contents.count('{')):
-            pass # phraseMark start
-    if contents.count('}'):
-        for i in range(0, contents.count('}')):
-            pass # phraseMark end
-    if contents.count('('):
-        for i in range(0, contents.count('(')):
-            pass # slur start
-    if contents.count(')'):
-        for i in range(0, contents.count(')')):
-            pass # slur end
+    # TODO: add music21 phrase information (phrase marks { }, slurs ( ) )
+    tieType = None
     if contents.count('['):
-        thisObject.tie = music21.tie.Tie("start")
+        tieType = "start"
     elif contents.count(']'):
-        thisObject.tie = music21.tie.Tie("stop")
+        tieType = "stop"
     elif contents.count('_'):
-        thisObject.tie = music21.tie.Tie("continue")
+        tieType = "continue"
     
     ## 3.2.3 Ornaments    
+    expressions = []
     if contents.count('t'):
-        thisObject.expressions.append(music21.expressions.HalfStepTrill())
+        expressions.append(music21.expressions.HalfStepTrill)
     elif contents.count('T'):
-        thisObject.expressions.append(music21.expressions.WholeStepTrill())
+        expressions.append(music21.expressions.WholeStepTrill)
     
     if contents.count('w'):
-        thisObject.expressions.append(music21.expressions.HalfStepInvertedMordent())
+        expressions.append(music21.expressions.HalfStepInvertedMordent)
     elif contents.count('W'):
-        thisObject.expressions.append(music21.expressions.WholeStepInvertedMordent())
+        expressions.append(music21.expressions.WholeStepInvertedMordent)
     elif contents.count('m'):
-        thisObject.expressions.append(music21.expressions.HalfStepMordent())
+        expressions.append(music21.expressions.HalfStepMordent)
     elif contents.count('M'):
-        thisObject.expressions.append(music21.expressions.WholeStepMordent())
+        expressions.append(music21.expressions.WholeStepMordent)
 
     if contents.count('S'):
-        thisObject.expressions.append(music21.expressions.Turn())
+        expressions.append(music21.expressions.Turn)
     elif contents.count('$'):
-        thisObject.expressions.append(music21.expressions.InvertedTurn())
+        expressions.append(music21.expressions.InvertedTurn)
     elif contents.count('R'):
-        t1 = music21.expressions.Turn()
-        t1.connectedToPrevious = True  ## true by default, but explicitly
-        thisObject.expressions.append(t1)
+        expressions.append(_connectedTurn)
     
     if contents.count(':'):
         ## TODO: deal with arpeggiation -- should have been in a 
@@ -1729,111 +1842,324 @@ def hdStringToNote(contents):
         pass
     
     if contents.count("O"):
-        thisObject.expressions.append(music21.expressions.Ornament())  
+        expressions.append(music21.expressions.Ornament)  
         # generic ornament
     
     # 3.2.4 Articulation Marks
+    articulations = []
     if contents.count('\''):
-        thisObject.articulations.append(music21.articulations.Staccato())
+        articulations.append(music21.articulations.Staccato)
     if contents.count('"'):
-        thisObject.articulations.append(music21.articulations.Pizzicato())
+        articulations.append(music21.articulations.Pizzicato)
     if contents.count('`'):
         # called 'attacca' mark but means staccatissimo:
         # http://www.music-cog.ohio-state.edu/Humdrum/representations/kern.rep.html
-        thisObject.articulations.append(music21.articulations.Staccatissimo())
+        articulations.append(music21.articulations.Staccatissimo)
     if contents.count('~'):
-        thisObject.articulations.append(music21.articulations.Tenuto())
+        articulations.append(music21.articulations.Tenuto)
     if contents.count('^'):
-        thisObject.articulations.append(music21.articulations.Accent())
+        articulations.append(music21.articulations.Accent)
     if contents.count(';'):
-        thisObject.expressions.append(music21.expressions.Fermata())
+        expressions.append(music21.expressions.Fermata)
 
     
     # 3.2.5 Up & Down Bows
     if contents.count('v'):
-        thisObject.articulations.append(music21.articulations.UpBow())
+        articulations.append(music21.articulations.UpBow)
     elif contents.count('u'):
-        thisObject.articulations.append(music21.articulations.DownBow())
+        articulations.append(music21.articulations.DownBow)
     
     # 3.2.6 Stem Directions
+    stemDirection = None
     if contents.count('/'):
-        thisObject.stemDirection = "up"
+        stemDirection = "up"
     elif contents.count('\\'):
-        thisObject.stemDirection = "down"        
+        stemDirection = "down"        
     
     # 3.2.7 Duration +
     # 3.2.8 N-Tuplets
+    dots = contents.count('.')
+    durationSpec = None
     foundRational = re.search("(\d+)\%(\d+)", contents)
     foundNumber = re.search("(\d+)", contents)
     if foundRational:
         durationFirst = int(foundRational.group(1))
         durationSecond = float(foundRational.group(2))
-        thisObject.duration.quarterLength = 4*durationSecond/durationFirst
-        if contents.count('.'):
-            thisObject.duration.dots = contents.count('.')            
+        durationSpec = ('quarterLength', 4*durationSecond/durationFirst, dots)
         
     elif foundNumber:
         durationString = foundNumber.group(1)
         durationType = int(foundNumber.group(1))
         if durationString == '000': # for larger values, see http://wiki.humdrum.org/index.php/Rational_rhythms
-            thisObject.duration.type = 'maxima'
-            if contents.count('.'):
-                thisObject.duration.dots = contents.count('.')            
+            durationSpec = ('type', 'maxima', dots)
         elif durationString == '00': # for larger values, see http://wiki.humdrum.org/index.php/Rational_rhythms
-            thisObject.duration.type = 'longa'
-            if contents.count('.'):
-                thisObject.duration.dots = contents.count('.')            
+            durationSpec = ('type', 'longa', dots)
         elif durationType == 0:
-            thisObject.duration.type = 'breve'
-            if contents.count('.'):
-                thisObject.duration.dots = contents.count('.')
+            durationSpec = ('type', 'breve', dots)
         elif durationType in duration.typeFromNumDict:
-            thisObject.duration.type = duration.typeFromNumDict[durationType]
-            if contents.count('.'):
-                thisObject.duration.dots = contents.count('.')
+            durationSpec = ('type', duration.typeFromNumDict[durationType], 
+                            dots)
         else:
             dT = int(durationType) + 0.0
             (remainder, exponents) = math.modf(math.log(dT, 2))
             basevalue = 2**exponents
-            thisObject.duration.type = duration.typeFromNumDict[int(basevalue)]
-            newTup = duration.Tuplet()
-            newTup.durationActual.type = thisObject.duration.type
-            newTup.durationNormal.type = thisObject.duration.type
-
             gcd = common.euclidGCD(int(dT), basevalue)
-            newTup.numberNotesActual = dT/gcd
-            newTup.numberNotesNormal = float(basevalue)/gcd
-            
-            if contents.count('.'):
-                newTup.durationNormal.dots = contents.count('.')
-            
-            thisObject.duration.appendTuplet(newTup)
+            durationSpec = ('tuplet', duration.typeFromNumDict[int(basevalue)],
+                            dots, dT/gcd, float(basevalue)/gcd)
                     
     # 3.2.9 Grace Notes and Groupettos
     # TODO: Rewrite after music21 gracenotes are implemented
+    grace = None
     if contents.count('q'):
-        thisObject = thisObject.getGrace()
+        grace = 'q'
     elif contents.count('Q'):
-        thisObject = thisObject.getGrace()
-        thisObject.duration.slash = False
+        grace = 'Q'
     elif contents.count('P'):
-        thisObject = thisObject.getGrace(appogiatura=True)
+        grace = 'P'
     elif  contents.count('p'):
         pass # end appogiatura duration -- not needed in music21...
     
     # 3.2.10 Beaming
     # TODO: Support really complex beams
+    beams = []
     for i in range(0, contents.count('L')):
-        thisObject.beams.append('start')
+        beams.append(('start',))
     for i in range(0, contents.count('J')):
-        thisObject.beams.append('stop')
+        beams.append(('stop',))
     for i in range(0, contents.count('k')):
-        thisObject.beams.append('partial', 'right')
+        beams.append(('partial', 'right'))
     for i in range(0, contents.count('K')):
-        thisObject.beams.append('partial', 'right')
+        beams.append(('partial', 'right'))
+    
+    return (pitchSpec, accidental, tieType, expressions, articulations, 
+            stemDirection, durationSpec, grace, beams)
+
+def _kernTokenToNote(kernToken):
+    '''
+    Create a new music21 Note or Rest from a tuple returned by 
+    :func:`~music21.humdrum.spineParser._parseKernToken`.
+    '''
+    (pitchSpec, accidental, tieType, expressions, articulations, 
+        stemDirection, durationSpec, grace, beams) = kernToken
+
+    if pitchSpec is not None:
+        thisObject = music21.note.Note()
+        thisObject.step = pitchSpec[0]
+        thisObject.octave = pitchSpec[1]
+    else:
+        thisObject = music21.note.Rest()
+    if accidental is not None:
+        thisObject.accidental = accidental
+    if tieType is not None:
+        thisObject.tie = music21.tie.Tie(tieType)
+    for expressionClass in expressions:
+        thisObject.expressions.append(expressionClass())
+    for articulationClass in articulations:
+        thisObject.articulations.append(articulationClass())
+    if stemDirection is not None:
+        thisObject.stemDirection = stemDirection
+
+    if durationSpec is not None:
+        if durationSpec[0] == 'quarterLength':
+            thisObject.duration.quarterLength = durationSpec[1]
+            if durationSpec[2]:
+                thisObject.duration.dots = durationSpec[2]
+        elif durationSpec[0] == 'type':
+            thisObject.duration.type = durationSpec[1]
+            if durationSpec[2]:
+                thisObject.duration.dots = durationSpec[2]
+        else: # tuplet
+            durationType, dots, numberNotesActual, numberNotesNormal = \
+                durationSpec[1:]
+            thisObject.duration.type = durationType
+            newTup = duration.Tuplet()
+            newTup.durationActual.type = durationType
+            newTup.durationNormal.type = durationType
+            newTup.numberNotesActual = numberNotesActual
+            newTup.numberNotesNormal = numberNotesNormal
+            if dots:
+                newTup.durationNormal.dots = dots
+            thisObject.duration.appendTuplet(newTup)
+
+    if grace == 'q':
+        thisObject = thisObject.getGrace()
+    elif grace == 'Q':
+        thisObject = thisObject.getGrace()
+        thisObject.duration.slash = False
+    elif grace == 'P':
+        thisObject = thisObject.getGrace(appogiatura=True)
+
+    for beamArgs in beams:
+        thisObject.beams.append(*beamArgs)
     
     return thisObject
 
+# store pitch and duration values of kern tokens, keyed by token string
+_kernSummaryCache = {}
+
+def _kernTokenSummary(contents):
+    '''
+    Return a tuple of (pitch, quarterLength) for a kern note or rest string, 
+    where pitch is a :class:`~music21.pitch.Pitch` or None for a rest. Grace notes 
+    have a quarterLength of zero.
+
+    >>> from music21 import *
+    >>> humdrum.spineParser._kernTokenSummary('8.cc#L')
+    (C#5, 0.75)
+    >>> humdrum.spineParser._kernTokenSummary('4r')
+    (None, 1.0)
+    '''
+    try:
+        return _kernSummaryCache[contents]
+    except KeyError:
+        pass
+    n = hdStringToNote(contents)
+    if n.isRest:
+        p = None
+    else:
+        p = n.pitch
+    post = (p, n.duration.quarterLength)
+    _kernSummaryCache[contents] = post
+    return post
+
+
+def dataStreamToRichMetadata(dataStream):
+    r'''
+    Read a list of lines (or a string) of Humdrum data and return a 
+    :class:`~music21.metadata.RichMetadata` object without creating spines 
+    or Streams. 
+    
+    Reference records (!!!) are stored as work ids or contributors;
+    summary values (first time and key signatures, note count, duration, 
+    and pitch span) are read directly from the \*\*kern spines. 
+
+    >>> from music21 import *
+    >>> hdData = "!!!COM: Bach, Johann Sebastian\n" + \
+    ...          "!!!OTL: Test\n" + \
+    ...          "**kern\t**kern\n" + \
+    ...          "*M3/4\t*M3/4\n" + \
+    ...          "2G\t4c\n" + \
+    ...          ".\t4e 4g\n" + \
+    ...          "4r\t4cc\n" + \
+    ...          "*-\t*-\n"
+    >>> rmd = humdrum.spineParser.dataStreamToRichMetadata(hdData)
+    >>> rmd.composer
+    'Bach, Johann Sebastian'
+    >>> rmd.title
+    'Test'
+    >>> rmd.timeSignatureFirst, rmd.noteCount, rmd.quarterLength
+    ('3/4', 5, 3.0)
+    >>> rmd.pitchLowest, rmd.pitchHighest
+    ('G3', 'C5')
+    '''
+    from music21 import metadata
+
+    if isinstance(dataStream, basestring):
+        dataStream = dataStream.splitlines()
+
+    rmd = metadata.RichMetadata()
+    tsFirst = None
+    ksFirst = None
+    noteCount = 0
+    pitchLowest = None
+    pitchHighest = None
+    highestTime = 0.0
+
+    # for each active spine, store its type and the offset at 
+    # which its next event begins
+    spineTypes = []
+    spineOffsets = []
+
+    for line in dataStream:
+        line = line.rstrip()
+        if line == "":
+            continue
+        elif line.startswith('!!!'):
+            ref = GlobalReference(0, line)
+            code = ref.code.strip().lower()
+            if ref.value == '':
+                pass
+            elif code in metadata.WORK_ID_ABBREVIATIONS:
+                rmd.setWorkId(code, ref.value)
+            elif code in metadata.ROLE_ABBREVIATIONS:
+                rmd.addContributor(metadata.Contributor(
+                    role=metadata.abbreviationToRole(code), name=ref.value))
+            continue
+        elif line.startswith('!'):
+            continue
+
+        spineData = SpineLine(0, line).spineData
+        if spineData[0].startswith('**'): # exclusive interpretations
+            spineTypes = [sd[2:] for sd in spineData]
+            spineOffsets = [0.0 for sd in spineData]
+            continue
+        elif spineData[0].startswith('*'): # tandem interpretations
+            newTypes = []
+            newOffsets = []
+            i = 0
+            while i < len(spineData):
+                sd = spineData[i]
+                spineType = spineTypes[i]
+                offset = spineOffsets[i]
+                if sd == '*^': # split 
+                    newTypes += [spineType, spineType]
+                    newOffsets += [offset, offset]
+                elif sd == '*v': # join all adjacent spines
+                    while i + 1 < len(spineData) and spineData[i + 1] == '*v':
+                        i += 1
+                        offset = max(offset, spineOffsets[i])
+                    newTypes.append(spineType)
+                    newOffsets.append(offset)
+                elif sd == '*x' and i + 1 < len(spineData): # exchange
+                    newTypes += [spineTypes[i + 1], spineType]
+                    newOffsets += [spineOffsets[i + 1], offset]
+                    i += 1
+                elif sd == '*+': # add a spine, defined on the next line
+                    newTypes += [spineType, None]
+                    newOffsets += [offset, offset]
+                elif sd == '*-': # terminate
+                    pass
+                else:
+                    newTypes.append(spineType)
+                    newOffsets.append(offset)
+                    if spineType == 'kern':
+                        if (tsFirst is None and sd.startswith('*M') 
+                            and not sd.startswith('*MM')):
+                            tsFirst = kernTandamToObject(sd)
+                        elif ksFirst is None and sd.startswith('*k'):
+                            ksFirst = kernTandamToObject(sd)
+                i += 1
+            spineTypes = newTypes
+            spineOffsets = newOffsets
+            continue
+
+        for i, sd in enumerate(spineData):
+            if i >= len(spineTypes) or spineTypes[i] != 'kern':
+                continue
+            if sd == '.' or sd.startswith('=') or sd.startswith('!'):
+                continue
+            # chords are separated by spaces; take duration from the first
+            quarterLength = None
+            for sub in sd.split():
+                p, ql = _kernTokenSummary(sub)
+                if quarterLength is None:
+                    quarterLength = ql
+                if p is not None:
+                    if pitchLowest is None or p.ps < pitchLowest.ps:
+                        pitchLowest = p
+                    if pitchHighest is None or p.ps > pitchHighest.ps:
+                        pitchHighest = p
+            if quarterLength is not None:
+                noteCount += 1
+                spineOffsets[i] += quarterLength
+                highestTime = max(highestTime, spineOffsets[i])
+
+    rmd.setSummary(timeSignatureFirst=tsFirst, keySignatureFirst=ksFirst, 
+        noteCount=noteCount, quarterLength=highestTime, 
+        pitchLowest=pitchLowest, pitchHighest=pitchHighest)
+    return rmd
+
+
 def hdStringToMeasure(contents, previousMeasure = None):
     '''
     kern uses an equals sign followed by processing instructions to
@@ -2132,6 +2458,23 @@ class Test(unittest.TestCase):
         masterStream = hf1.stream
         #masterStream.show('text')
         
+    def testParseSpineColumns(self):
+        for data in [testFiles.mazurka6, testFiles.splitSpines2, 
+                     testFiles.fakeTest]:
+            hdc = HumdrumDataCollection(data)
+            scColumns = hdc.parseSpineColumns()
+            self.assertEqual(hdc.protoSpines, None)
+            hdc.parseProtoSpinesAndEventCollections()
+            scProto = hdc.createHumdrumSpines()
+            self.assertEqual(len(scColumns.spines), len(scProto.spines))
+            for spineA, spineB in zip(scColumns.spines, scProto.spines):
+                self.assertEqual(repr(spineA), repr(spineB))
+                self.assertEqual(spineA.insertPoint, spineB.insertPoint)
+                self.assertEqual(spineA.endingPosition, spineB.endingPosition)
+                self.assertEqual(
+                    [(e.contents, e.position) for e in spineA.eventList], 
+                    [(e.contents, e.position) for e in spineB.eventList])
+
     def testMoveDynamics(self):
         hf1 = HumdrumDataCollection(testFiles.fakeTest)
         #hf1.parseLines()
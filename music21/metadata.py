@@ -36,6 +36,11 @@ import os
 import inspect
 import re
 
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None
+
 import music21
 from music21 import common
 from music21 import musicxml
@@ -1580,7 +1585,7 @@ class Metadata(music21.Music21Object):
             useRegex = True
             reQuery = query # already compiled
         # look for regex characters
-        elif common.isStr(query) and ('*' in query or '.' in query or '|' in query or '+' in query or '?' in query or '{' in query or '}' in query):
+        elif _isRegexStr(query):
             useRegex = True
             reQuery = re.compile(query, flags=re.I) 
 
@@ -1761,7 +1766,7 @@ class RichMetadata(Metadata):
         '''Define all attributes of this object that should be JSON serialized for storage and re-instantiation. Attributes that name basic Python objects or :class:`~music21.base.JSONSerializer` subclasses, or dictionaries or lists that contain Python objects or :class:`~music21.base.JSONSerializer` subclasses, can be provided.
         '''
         # add new names to base-class names
-        return ['keySignatureFirst', 'timeSignatureFirst', 'pitchHighest', 'pitchLowest', 'noteCount', 'quarterLength'] + Metadata.jsonAttributes(self)
+        return ['keySignatureFirst', 'timeSignatureFirst', 'pitchHighest', 'pitchLowest', 'ambitus', 'noteCount', 'quarterLength'] + Metadata.jsonAttributes(self)
 
     def jsonComponentFactory(self, idStr):
         from music21 import meter
@@ -1813,6 +1818,29 @@ class RichMetadata(Metadata):
                     setattr(self, name, otherValue)
 
 
+    def setSummary(self, timeSignatureFirst=None, keySignatureFirst=None,
+        noteCount=None, quarterLength=None, pitchLowest=None, 
+        pitchHighest=None):
+        '''Set the attributes that summarize the contents of a Score, given a TimeSignature and a KeySignature, a count of notes and rests, a total duration, and the lowest and highest Pitch objects. Time and key signatures are stored by their string representation, as re-instantiating them is expensive; the ambitus is stored in half steps.
+
+        >>> from music21 import *
+        >>> rmd = metadata.RichMetadata()
+        >>> rmd.setSummary(meter.TimeSignature('3/4'), noteCount=12,
+        ...     pitchLowest=pitch.Pitch('c4'), pitchHighest=pitch.Pitch('a5'))
+        >>> rmd.timeSignatureFirst, rmd.noteCount, rmd.ambitus, rmd.pitchHighest
+        ('3/4', 12, 21, 'A5')
+        '''
+        if timeSignatureFirst is not None:
+            self.timeSignatureFirst = str(timeSignatureFirst)
+        if keySignatureFirst is not None:
+            self.keySignatureFirst = str(keySignatureFirst)
+        self.noteCount = noteCount
+        self.quarterLength = quarterLength
+        if pitchLowest is not None and pitchHighest is not None:
+            self.pitchLowest = pitchLowest.nameWithOctave
+            self.pitchHighest = pitchHighest.nameWithOctave
+            self.ambitus = int(round(pitchHighest.ps - pitchLowest.ps))
+
     def update(self, streamObj):
         '''Given a Stream object, update attributes with stored objects. 
         '''
@@ -1840,11 +1868,10 @@ class RichMetadata(Metadata):
         flat = streamObj.flat.sorted
 
 
+        tsFirst = None
         tsStream = flat.getElementsByClass('TimeSignature')
         if len(tsStream) > 0:
-            # just store the string representation  
-            # re-instantiating TimeSignature objects is expensive
-            self.timeSignatureFirst = str(tsStream[0])
+            tsFirst = tsStream[0]
         
         # this presently does not work properly b/c ts comparisons are not
         # built-in; need to add __eq__ methods to MeterTerminal
@@ -1852,15 +1879,30 @@ class RichMetadata(Metadata):
 #             if ts not in self.timeSignatures:
 #                 self.timeSignatures.append(ts)
 
+        ksFirst = None
         ksStream = flat.getElementsByClass('KeySignature')
         if len(ksStream) > 0:
-            self.keySignatureFirst = str(ksStream[0])
+            ksFirst = ksStream[0]
 #         for ks in ksStream:
 #             if ks not in self.keySignatures:
 #                 self.keySignatures.append(ts)
 
-        self.noteCount = len(flat.notesAndRests)
-        self.quarterLength = flat.highestTime
+        # the pitch span is found directly; see the comment below. only 
+        # pitches of notes and chords are used, as flat.pitches includes
+        # the scale pitches of Key objects
+        pitchLowest = None
+        pitchHighest = None
+        for n in flat.notes:
+            for p in n.pitches:
+                if pitchLowest is None or p.ps < pitchLowest.ps:
+                    pitchLowest = p
+                if pitchHighest is None or p.ps > pitchHighest.ps:
+                    pitchHighest = p
+
+        self.setSummary(timeSignatureFirst=tsFirst, keySignatureFirst=ksFirst,
+            noteCount=len(flat.notesAndRests), 
+            quarterLength=flat.highestTime, 
+            pitchLowest=pitchLowest, pitchHighest=pitchHighest)
 
 # commenting out temporarily due to memory error     
 # with corpus/beethoven/opus132.xml
@@ -1880,6 +1922,63 @@ class RichMetadata(Metadata):
 
 
 
+#-------------------------------------------------------------------------------
+# the longest n-gram stored in the search index of a MetadataBundle
+_INDEX_GRAM_SIZE = 3
+
+def _isRegexStr(query):
+    '''Return True if a string query is to be treated as a regular expression by :meth:`~music21.metadata.Metadata.search`.
+    '''
+    if not common.isStr(query):
+        return False
+    for char in '*.|+?{}':
+        if char in query:
+            return True
+    return False
+
+def _getRegexLiterals(pattern):
+    '''Return a list of lower-case strings that any match of a regular expression pattern must contain, or None if these cannot be determined simply.
+
+    >>> from music21 import *
+    >>> metadata._getRegexLiterals('^bach.*')
+    ['bach']
+    >>> metadata._getRegexLiterals('bee?thov(.*)') is None
+    True
+    >>> metadata._getRegexLiterals('bee?thov.*en')
+    ['be', 'thov', 'en']
+    >>> metadata._getRegexLiterals('third|fourth') is None
+    True
+    '''
+    # alternation, escapes, classes, and groups are not examined
+    for char in '|\\[(':
+        if char in pattern:
+            return None
+    post = []
+    current = ''
+    inBraces = False
+    for char in pattern:
+        if inBraces:
+            if char == '}':
+                inBraces = False
+            continue
+        if char in '.^$*+?{}':
+            # the preceding character may be absent
+            if char in '*?{' and current != '':
+                current = current[:-1]
+            if current != '':
+                post.append(current.lower())
+            current = ''
+            if char == '{':
+                inBraces = True
+        else:
+            current += char
+    if current != '':
+        post.append(current.lower())
+    if len(post) == 0:
+        return None
+    return post
+
+
 #-------------------------------------------------------------------------------
 class MetadataBundle(music21.JSONSerializer):
     '''An object that provides access to, searches within, and storage and loading of multiple Metadata objects.
@@ -1900,13 +1999,25 @@ class MetadataBundle(music21.JSONSerializer):
         # keys are the same for self._storage
         self._accessPaths = {}
 
+        # for each source file, keyed as in self._storage without a work 
+        # number, a list of modification time, md5 of the file contents, 
+        # and the keys of self._storage created from this file
+        self._sources = {}
+
+        # an inverted index of search values: for each search field, a 
+        # dictionary of lower-case n-grams of stored values, each with the 
+        # keys of self._storage that contain it; the key '' indexes all 
+        # fields. An empty dictionary means the index must be built; it is 
+        # built on the first search, and is not stored
+        self._index = {}
+
     #---------------------------------------------------------------------------
     # overridden methods for json processing 
 
     def jsonAttributes(self):
         '''Define all attributes of this object that should be JSON serialized for storage and re-instantiation. Attributes that name basic Python objects or :class:`~music21.base.JSONSerializer` subclasses, or dictionaries or lists that contain Python objects or :class:`~music21.base.JSONSerializer` subclasses, can be provided.
         '''
-        return ['_storage', '_name']
+        return ['_storage', '_name', '_sources']
 
     def jsonComponentFactory(self, idStr):
         if '.Metadata' in idStr:
@@ -1948,11 +2059,13 @@ class MetadataBundle(music21.JSONSerializer):
     
     
 
-    def addFromPaths(self, pathList):
+    def addFromPaths(self, pathList, processes=None, metadataOnly=False):
         '''Parse and store metadata from numerous files.
 
         If any files cannot be loaded, they file paths will be collected in a list. 
 
+        If `processes` is greater than 1, files are parsed in a pool of worker processes with :func:`~music21.converter.iterParseMany`. If `metadataOnly` is True, MusicXML, ABC, Humdrum, and MuseData files are read without creating Streams; see :func:`~music21.converter.parse`.
+
         >>> from music21 import *
         >>> mb = metadata.MetadataBundle()
         >>> mb.addFromPaths(corpus.getWorkList('bwv66.6'))
@@ -1960,22 +2073,43 @@ class MetadataBundle(music21.JSONSerializer):
         >>> len(mb._storage)
         1
         '''
-        import gc # get a garbage collector
         fpError = [] # store errors
 
         # converter imports modules that import metadata
         from music21 import converter
-        for fp in pathList:
+        pathList = list(pathList)
+        self._index = {} # rebuilt when next searched
+
+        def onError(fp, msg):
+            environLocal.warn('parse failed: %s' % fp)
+            fpError.append(fp)
+            return None
+
+        for i, post in converter.iterParseMany(pathList, processes=processes,
+            onError=onError, ordered=False, forceSource=True, 
+            metadataOnly=metadataOnly):
+            fp = pathList[i]
             environLocal.printDebug(['updateMetadataCache: examining:', fp])
             cp = self.corpusPathToKey(fp)
-            try:
-                post = converter.parse(fp, forceSource=True)
-            except:
-                environLocal.warn('parse failed: %s' % fp)
-                fpError.append(fp)
+            cpSource = cp
+            keysStored = []
+            if post is None: # could not be parsed
+                self._addSource(cpSource, fp, keysStored)
                 continue
 
-            if 'Opus' in post.classes:
+            if isinstance(post, RichMetadata):
+                environLocal.printDebug(['updateMetadataCache: storing:', cp])
+                self._storage[cp] = post
+                keysStored.append(cp)
+            elif isinstance(post, list): # one RichMetadata for each work
+                for rmd in post:
+                    if rmd.number == None:
+                        environLocal.printDebug(['addFromPaths: got works that do not have work numbers:', fp])
+                    else:
+                        cp = self.corpusPathToKey(fp, number=rmd.number)
+                        self._storage[cp] = rmd
+                        keysStored.append(cp)
+            elif 'Opus' in post.classes:
                 # need to get scores from each opus?
                 # problem here is that each sub-work has metadata, but there
                 # is only a single source file
@@ -1992,23 +2126,93 @@ class MetadataBundle(music21.JSONSerializer):
                         cp = self.corpusPathToKey(fp, number=md.number)
                         environLocal.printDebug(['addFromPaths: storing:', cp])
                         self._storage[cp] = rmd
+                        keysStored.append(cp)
                     del s # for memory conservation
             else:
                 md = post.metadata
-                if md is None:
-                    continue    
-                rmd = RichMetadata()
-                rmd.merge(md)
-                rmd.update(post) # update based on Stream
-                environLocal.printDebug(['updateMetadataCache: storing:', cp])
-                self._storage[cp] = rmd
-    
+                if md is not None:
+                    rmd = RichMetadata()
+                    rmd.merge(md)
+                    rmd.update(post) # update based on Stream
+                    environLocal.printDebug(['updateMetadataCache: storing:', cp])
+                    self._storage[cp] = rmd
+                    keysStored.append(cp)
+
+            self._addSource(cpSource, fp, keysStored)
             # explicitly delete the imported object for memory conservation
             del post
-            gc.collect()
 
         return fpError
 
+    def _addSource(self, cp, fp, keysStored):
+        '''Record the modification time and content md5 of a source file, and the keys of metadata stored from it. Files that could not be parsed are recorded with no keys, so that they are not parsed again until they change. Virtual works are urls, recorded without a modification time or md5; they are parsed again only when the bundle is rebuilt.
+        '''
+        if os.path.exists(fp):
+            self._sources[cp] = [os.path.getmtime(fp), 
+                self._getContentMd5(fp), keysStored]
+        else:
+            self._sources[cp] = [None, None, keysStored]
+
+    def _getContentMd5(self, fp):
+        f = open(fp, 'rb')
+        try:
+            return common.getMd5(f.read())
+        finally:
+            f.close()
+
+    def updateFromPaths(self, pathList, processes=None, metadataOnly=False):
+        '''Parse and store metadata only from files that are new or have changed since they were last added, and remove metadata of files that are not in `pathList`. A file has changed if its modification time and the md5 of its contents both differ from the stored values. Files that could not be parsed are not parsed again until they change, and virtual works (urls) are not parsed again.
+
+        Returns a list of file paths that could not be parsed; see :meth:`~music21.metadata.MetadataBundle.addFromPaths`.
+
+        >>> from music21 import *
+        >>> mb = metadata.MetadataBundle()
+        >>> mb.updateFromPaths(corpus.getWorkList('bwv66.6'))
+        []
+        >>> len(mb._storage)
+        1
+        >>> mb.updateFromPaths(corpus.getWorkList('bwv66.6')) # nothing to do
+        []
+        >>> mb.updateFromPaths([])
+        []
+        >>> len(mb._storage)
+        0
+        '''
+        if len(self._sources) == 0:
+            # metadata stored without sources cannot be updated
+            self._storage = {}
+
+        current = {}
+        stale = []
+        for fp in pathList:
+            cp = self.corpusPathToKey(fp)
+            current[cp] = fp
+            if cp not in self._sources:
+                stale.append(fp)
+            elif os.path.exists(fp):
+                source = self._sources[cp]
+                mtime = os.path.getmtime(fp)
+                if mtime == source[0]:
+                    continue
+                elif self._getContentMd5(fp) == source[1]:
+                    source[0] = mtime # touched but not changed
+                else:
+                    stale.append(fp)
+
+        # remove metadata of changed and removed files
+        staleKeys = set([self.corpusPathToKey(fp) for fp in stale])
+        for cp in self._sources.keys():
+            if cp in staleKeys or cp not in current:
+                for key in self._sources[cp][2]:
+                    if key in self._storage:
+                        del self._storage[key]
+                del self._sources[cp]
+                self._index = {}
+
+        environLocal.printDebug(['MetadataBundle: updating paths:', len(stale)])
+        return self.addFromPaths(stale, processes=processes, 
+            metadataOnly=metadataOnly)
+
     def _getFilePath(self):
         if self._name in ['virtual', 'core']:
             fp = os.path.join(common.getMetadataCacheFilePath(), 
@@ -2042,6 +2246,8 @@ class MetadataBundle(music21.JSONSerializer):
             environLocal.warn('no metadata found for: %s; try building cache with corpus.cacheMetadata("%s")' % (self._name, self._name))
             return
         self.jsonRead(fp)
+        # bundles written with a stored index must not use it
+        self._index = {}
         environLocal.printDebug(['MetadataBundle: loading time:', self._name, t, 'md items:', len(self._storage)])
 
 
@@ -2091,11 +2297,96 @@ class MetadataBundle(music21.JSONSerializer):
         #environLocal.printDebug(['metadata grouping time:', t, 'md bundles found:', len(post)])
         #return post
 
+    def _updateIndex(self):
+        '''Build the inverted index of all n-grams, up to three characters long, of the search values of all stored metadata, if it has not yet been built. Values are indexed as strings, in lower case, as they are compared by :meth:`~music21.metadata.Metadata.search`.
+        '''
+        if len(self._index) > 0:
+            return
+        index = {'': {}}
+        for key in self._storage.keys():
+            md = self._storage[key]
+            for field in md._searchAttributes:
+                value = getattr(md, field)
+                if not common.isStr(value):
+                    try:
+                        value = str(value)
+                    except UnicodeError:
+                        continue
+                value = value.lower()
+                if field not in index:
+                    index[field] = {}
+                for postings in (index[field], index['']):
+                    for i in range(len(value)):
+                        for j in range(i + 1, min(i + _INDEX_GRAM_SIZE, 
+                            len(value)) + 1):
+                            gram = value[i:j]
+                            if gram not in postings:
+                                postings[gram] = set()
+                            postings[gram].add(key)
+        self._index = index
+
+    def _getPostings(self, gram, field=''):
+        return self._index[field].get(gram, set())
+
+    def _getIndexKeys(self, literal, field=''):
+        '''Return the set of keys of stored metadata whose values of `field` (or of any field, if `field` is '') may contain the lower-case string `literal`.
+        '''
+        if len(literal) <= _INDEX_GRAM_SIZE:
+            return self._getPostings(literal, field)
+        post = None
+        for i in range(len(literal) - _INDEX_GRAM_SIZE + 1):
+            keys = self._getPostings(literal[i:i + _INDEX_GRAM_SIZE], field)
+            if post is None:
+                post = set(keys)
+            else:
+                post &= keys
+            if len(post) == 0:
+                break
+        return post
+
+    def _getSearchCandidates(self, query, field=None):
+        '''Return the set of keys of stored metadata that may match a query, as given to :meth:`~music21.metadata.MetadataBundle.search`, or None if all stored metadata must be searched. 
+
+        Plain string queries, and regular expressions whose literal parts can be found, are looked up in the index; other regular expressions, and fields that are not search fields, require a search of all metadata.
+        '''
+        self._updateIndex()
+        if field is None:
+            field = ''
+        elif field not in self._index:
+            return None
+
+        if hasattr(query, 'search'): # a compiled regular expression
+            if query.flags & re.VERBOSE:
+                return None
+            literals = _getRegexLiterals(query.pattern)
+        elif _isRegexStr(query):
+            literals = _getRegexLiterals(query)
+        else:
+            literals = [str(query).lower()]
+        if literals is None or '' in literals:
+            return None
+        for literal in literals:
+            try: # values and stored n-grams may be str or unicode
+                literal.encode('ascii')
+            except UnicodeError:
+                return None
+
+        post = None
+        for literal in literals:
+            keys = self._getIndexKeys(literal, field)
+            if post is None:
+                post = set(keys)
+            else:
+                post &= keys
+        return post
+
     def search(self, query, field=None, extList=None):
         '''Perform search, on all stored metadata, permit regular expression matching. 
 
         Return pairs of file paths and work numbers, or None
 
+        Stored metadata that may match are found with an inverted index of n-grams, built on the first search; each candidate is then matched with :meth:`~music21.metadata.Metadata.search`. Regular expressions with alternatives, groups, or character classes are matched against all stored metadata.
+
         >>> from music21 import *
         >>> mb = metadata.MetadataBundle()
         >>> mb.addFromPaths(corpus.getWorkList('ciconia'))
@@ -2112,7 +2403,12 @@ class MetadataBundle(music21.JSONSerializer):
         1
         '''
         post = []
-        for key in self._storage.keys():
+        candidates = self._getSearchCandidates(query, field)
+        if candidates is None:
+            keys = self._storage.keys()
+        else:
+            keys = [key for key in candidates if key in self._storage]
+        for key in keys:
             md = self._storage[key]
             match, fieldPost = md.search(query, field)
             if match:
@@ -2140,6 +2436,137 @@ class MetadataBundle(music21.JSONSerializer):
 
 
 
+#-------------------------------------------------------------------------------
+class MetadataDatabase(object):
+    '''An SQLite database of the RichMetadata of a :class:`~music21.metadata.MetadataBundle`, with a typed and indexed column for each summary field, permitting queries without loading the JSON storage of a bundle.
+
+    The database is stored in a file named after the bundle, next to its JSON storage; a different file path can be given with `fp`.
+
+    >>> from music21 import *
+    >>> mb = metadata.MetadataBundle()
+    >>> mb.addFromPaths(corpus.getWorkList('bwv66.6'))
+    []
+    >>> db = metadata.MetadataDatabase(fp=':memory:')
+    >>> db.write(mb)
+    >>> db.updateAccessPaths(corpus.getWorkList('bwv66.6'))
+    >>> len(db.query(timeSignatureFirst='4/4', ambitus=(None, 36)))
+    1
+    >>> len(db.query(timeSignatureFirst='3/4'))
+    0
+    >>> db.close()
+    '''
+    # column names, as RichMetadata attributes, and SQLite types
+    fields = [('composer', 'TEXT'), ('title', 'TEXT'), ('number', 'TEXT'),
+              ('keySignatureFirst', 'TEXT'), ('timeSignatureFirst', 'TEXT'),
+              ('noteCount', 'INTEGER'), ('ambitus', 'INTEGER'),
+              ('pitchHighest', 'TEXT'), ('pitchLowest', 'TEXT'),
+              ('quarterLength', 'REAL')]
+    # text fields that are matched exactly, rather than by substring
+    exactFields = ['keySignatureFirst', 'timeSignatureFirst', 
+                   'pitchHighest', 'pitchLowest']
+
+    def __init__(self, name='default', fp=None):
+        if sqlite3 is None:
+            raise MetadataException('the sqlite3 module is not available')
+        self._name = name
+        if fp is None:
+            fp = os.path.splitext(MetadataBundle(name)._getFilePath())[0] + '.db'
+        self._fp = fp
+        self._connection = None
+        # keys are the same as the keys of the bundle
+        self._accessPaths = {}
+
+    def _getConnection(self):
+        if self._connection is None:
+            self._connection = sqlite3.connect(self._fp)
+            self._connection.text_factory = str
+        return self._connection
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def write(self, metadataBundle):
+        '''Replace the contents of the database with the stored metadata of a MetadataBundle. 
+        '''
+        names = [name for name, junk in self.fields]
+        rows = []
+        for key in metadataBundle._storage.keys():
+            md = metadataBundle._storage[key]
+            row = [key]
+            for name in names:
+                value = getattr(md, name, None)
+                if not (value is None or common.isStr(value) or 
+                    isinstance(value, (int, long, float))):
+                    value = str(value)
+                row.append(value)
+            rows.append(row)
+
+        c = self._getConnection()
+        c.execute('DROP TABLE IF EXISTS metadata')
+        c.execute('CREATE TABLE metadata (key TEXT PRIMARY KEY, %s)' % 
+                  ', '.join(['%s %s' % pair for pair in self.fields]))
+        for name in names:
+            c.execute('CREATE INDEX metadata_%s ON metadata (%s)' % (name, name))
+        c.executemany('INSERT INTO metadata VALUES (%s)' % 
+                      ', '.join(['?'] * (len(names) + 1)), rows)
+        c.commit()
+
+    def updateAccessPaths(self, pathList):
+        '''For each stored key, find the complete, local file path that returns this; see :meth:`~music21.metadata.MetadataBundle.updateAccessPaths`.
+        '''
+        mb = MetadataBundle(self._name)
+        for row in self._getConnection().execute('SELECT key FROM metadata'):
+            mb._storage[row[0]] = None
+        mb.updateAccessPaths(pathList)
+        self._accessPaths = mb._accessPaths
+
+    def query(self, **keywords):
+        '''Return pairs of file paths and work numbers of stored metadata that meet all given criteria. Keywords name fields: for the first time and key signatures and the highest and lowest pitches, the value must equal the stored string (such as '3/4' or 'E5'); for other text fields, the value is a case-insensitive substring; for numeric fields, the value is either a number or a pair of a minimum and maximum, either of which can be None. Call :meth:`~music21.metadata.MetadataDatabase.updateAccessPaths` first.
+        '''
+        fieldTypes = dict(self.fields)
+        conditions = []
+        values = []
+        for name in sorted(keywords.keys()):
+            if name not in fieldTypes:
+                raise MetadataException('cannot query field: %s' % name)
+            value = keywords[name]
+            if name in self.exactFields:
+                conditions.append('%s = ?' % name)
+                values.append(str(value))
+            elif fieldTypes[name] == 'TEXT':
+                conditions.append('%s LIKE ?' % name)
+                values.append('%' + str(value) + '%')
+            elif common.isListLike(value):
+                if value[0] is not None:
+                    conditions.append('%s >= ?' % name)
+                    values.append(value[0])
+                if value[1] is not None:
+                    conditions.append('%s <= ?' % name)
+                    values.append(value[1])
+            else:
+                conditions.append('%s = ?' % name)
+                values.append(value)
+        sql = 'SELECT key, number FROM metadata'
+        if len(conditions) > 0:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+
+        post = []
+        for key, number in self._getConnection().execute(sql, values):
+            if key not in self._accessPaths:
+                continue # in metadata cache, but no longer in filesystem
+            if number != "" and number is not None:
+                try:
+                    number = int(number)
+                except ValueError:
+                    pass
+            result = (self._accessPaths[key], number)
+            if result not in post:
+                post.append(result)
+        return post
+
+
 #-------------------------------------------------------------------------------
 
 class Test(unittest.TestCase):
@@ -2418,7 +2845,147 @@ class Test(unittest.TestCase):
         self.assertEqual(rmd.noteCount, 165)
         self.assertEqual(rmd.quarterLength, 36.0)
 
-        self.assertEqual(rmd.json, '{"__attr__": {"_urls": [], "quarterLength": 36.0, "noteCount": 165, "_contributors": [], "timeSignatureFirst": "4/4", "keySignatureFirst": "sharps 3, mode minor", "_workIds": {"movementName": {"__attr__": {"_data": "bwv66.6.mxl"}, "__class__": "<class \'music21.metadata.Text\'>"}}}, "__version__": [1, 0, 0], "__class__": "<class \'music21.metadata.RichMetadata\'>"}')
+        self.assertEqual(rmd.ambitus, 34)
+        self.assertEqual(rmd.pitchLowest, 'F#2')
+        self.assertEqual(rmd.pitchHighest, 'E5')
+
+        self.assertEqual(rmd.json, '{"__attr__": {"_urls": [], "quarterLength": 36.0, "pitchHighest": "E5", "noteCount": 165, "_contributors": [], "ambitus": 34, "timeSignatureFirst": "4/4", "pitchLowest": "F#2", "keySignatureFirst": "sharps 3, mode minor", "_workIds": {"movementName": {"__attr__": {"_data": "bwv66.6.mxl"}, "__class__": "<class \'music21.metadata.Text\'>"}}}, "__version__": [1, 0, 0], "__class__": "<class \'music21.metadata.RichMetadata\'>"}')
+
+    def testMetadataBundleSearchIndex(self):
+        from music21 import corpus, metadata
+        fpList = corpus.getWorkList('ciconia') + corpus.getWorkList('bwv66.6') + corpus.getComposer('luca')
+        mb = metadata.MetadataBundle()
+        mb.addFromPaths(fpList)
+        mb.updateAccessPaths(fpList)
+
+        def scan(query, field=None):
+            post = []
+            for key in mb._storage.keys():
+                match, junk = mb._storage[key].search(query, field)
+                if match:
+                    post.append(mb._accessPaths[key])
+            return sorted(post)
+
+        queries = [('cicon', 'composer'), ('cicon', None), ('gloria', None),
+            ('a', 'title'), ('bwv', None), ('^bach', None), ('cic.*', None),
+            ('bach|ciconia', 'composer'), (re.compile('ciconia'), 'composer'),
+            ('4/4', 'timeSignatureFirst'), ('16.', 'noteCount'), 
+            ('compos', 'compose'), ('xyz', None), ('none', None)]
+        for query, field in queries:
+            post = sorted([fp for fp, number in mb.search(query, field)])
+            self.assertEqual(post, scan(query, field))
+        self.assertEqual(mb._getSearchCandidates('bach|ciconia'), None)
+        self.assertEqual(len(mb._getSearchCandidates('cicon', 'composer')), 
+                         len(mb.search('cicon', 'composer')))
+
+        # the index is not stored with the bundle, but built when searched
+        self.assertEqual('_index' in mb.json, False)
+        mbNew = metadata.MetadataBundle()
+        mbNew.json = mb.json
+        self.assertEqual(len(mbNew._index), 0)
+        mbNew.updateAccessPaths(fpList)
+        self.assertEqual(sorted(mbNew.search('gloria')), 
+                         sorted(mb.search('gloria')))
+
+    def testMetadataDatabase(self):
+        from music21 import corpus, metadata
+        fpList = corpus.getWorkList('bwv66.6') + corpus.getComposer('luca')
+        mb = metadata.MetadataBundle()
+        mb.addFromPaths(fpList)
+        mb.updateAccessPaths(fpList)
+        fpDb = environLocal.getTempFile('.db')
+        try:
+            db = metadata.MetadataDatabase(fp=fpDb)
+            db.write(mb)
+            db.close()
+
+            # a new instance reads the file
+            db = metadata.MetadataDatabase(fp=fpDb)
+            db.updateAccessPaths(fpList)
+            self.assertEqual(len(db.query()), len(mb._storage))
+            post = db.query(noteCount=(100, None), ambitus=(None, 35))
+            expected = []
+            for key in mb._storage.keys():
+                md = mb._storage[key]
+                if md.noteCount >= 100 and md.ambitus <= 35:
+                    expected.append(mb._accessPaths[key])
+            self.assertEqual(sorted([x[0] for x in post]), sorted(expected))
+            self.assertEqual(sorted(db.query(composer='luca')), 
+                             sorted(mb.search('luca', 'composer')))
+            self.assertEqual(len(db.query(composer='LUCA')), 1)
+            self.assertEqual(len(db.query(composer='luca', 
+                             timeSignatureFirst='4/4')), 0)
+            # signatures and pitches are not matched by substring
+            self.assertEqual(len(db.query(timeSignatureFirst='6/8')), 1)
+            self.assertEqual(len(db.query(timeSignatureFirst='/8')), 0)
+            self.assertEqual(len(db.query(
+                keySignatureFirst='sharps 3, mode minor')), 1)
+            self.assertEqual(len(db.query(keySignatureFirst='sharps 3')), 0)
+            self.assertEqual(len(db.query(pitchHighest='E5')), 1)
+            self.assertEqual(len(db.query(pitchHighest='5')), 0)
+            self.assertRaises(metadata.MetadataException, db.query, tempo=3)
+            db.close()
+        finally:
+            os.remove(fpDb)
+
+    def testMetadataBundleUpdate(self):
+        import shutil
+        import time
+        from music21 import corpus, metadata
+        from music21.musicxml import testPrimitive
+
+        fpList = []
+        for src in [testPrimitive.pitches01a, testPrimitive.rhythmDurations03a]:
+            fp = environLocal.getTempFile('.xml')
+            f = open(fp, 'w')
+            f.write(src)
+            f.close()
+            fpList.append(fp)
+
+        mb = metadata.MetadataBundle()
+        self.assertEqual(mb.updateFromPaths(fpList), [])
+        self.assertEqual(len(mb._storage), 2)
+        
+        # the sources are kept with the json storage
+        mbNew = metadata.MetadataBundle()
+        mbNew.json = mb.json
+        self.assertEqual(sorted(mbNew._sources.keys()), 
+                         sorted(mb._sources.keys()))
+        
+        # a touched file is not parsed again, a changed one is
+        cp0 = mbNew.corpusPathToKey(fpList[0])
+        cp1 = mbNew.corpusPathToKey(fpList[1])
+        rmd0 = mbNew._storage[cp0]
+        rmd1 = mbNew._storage[cp1]
+        for fp in fpList:
+            os.utime(fp, (time.time() + 10, time.time() + 10))
+        f = open(fpList[1], 'w')
+        f.write(testPrimitive.pitches01a)
+        f.close()
+        self.assertEqual(mbNew.updateFromPaths(fpList), [])
+        self.assertEqual(mbNew._storage[cp0] is rmd0, True)
+        self.assertEqual(mbNew._storage[cp1] is rmd1, False)
+        self.assertEqual(mbNew._storage[cp1].noteCount, rmd0.noteCount)
+
+        # removed files are removed from storage
+        self.assertEqual(mbNew.updateFromPaths(fpList[:1]), [])
+        self.assertEqual(mbNew._storage.keys(), [cp0])
+
+        # a file that cannot be parsed is not parsed again until it changes
+        fpList[1:] = [environLocal.getTempFile('.xml')]
+        f = open(fpList[1], 'w')
+        f.write('<?xml version="1.0"?><score-partwise')
+        f.close()
+        self.assertEqual(mbNew.updateFromPaths(fpList), fpList[1:])
+        self.assertEqual(mbNew.updateFromPaths(fpList), [])
+        f = open(fpList[1], 'w')
+        f.write(testPrimitive.pitches01a)
+        f.close()
+        os.utime(fpList[1], (time.time() + 20, time.time() + 20))
+        self.assertEqual(mbNew.updateFromPaths(fpList), [])
+        self.assertEqual(len(mbNew._storage), 2)
+        for fp in fpList:
+            os.remove(fp)
 
 
 #-------------------------------------------------------------------------------
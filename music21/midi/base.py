@@ -21,6 +21,7 @@ import unittest, doctest
 import unicodedata
 import sys, os, string, types
 import struct
+import mmap
 
 try:
     import StringIO # python 2 
@@ -168,6 +169,43 @@ def getVariableLengthNumber(str):
             #environLocal.printDebug(['getVariableLengthNumber: depth read into string: %s' % i])
             return sum, str[i:] 
 
+def readNumber(data, pos, length):
+    '''Return the value of `length` bytes of `data` starting at index `pos`, as well as the index following those bytes. 
+
+    Unlike :func:`~music21.midi.base.getNumber`, the data is not copied: `data` can be a string, a buffer, or an mmap object.
+
+    >>> from music21 import *
+    >>> midi.readNumber('test', 0, 2)
+    (29797, 2)
+    >>> midi.readNumber('test', 2, 2)
+    (29556, 4)
+    '''
+    sum = 0 
+    for i in range(pos, pos + length): 
+        sum = (sum << 8) + ord(data[i]) 
+    return sum, pos + length
+
+def readVariableLengthNumber(data, pos): 
+    '''Return the value of a variable length number in `data` starting at index `pos`, as well as the index following the number. 
+
+    Unlike :func:`~music21.midi.base.getVariableLengthNumber`, the data is not copied.
+
+    >>> from music21 import *
+    >>> midi.readVariableLengthNumber('A-u', 0)
+    (65, 1)
+    >>> midi.readVariableLengthNumber('A-u', 1)
+    (45, 2)
+    >>> midi.readVariableLengthNumber('\\xff\\x7f', 0)
+    (16383, 2)
+    '''
+    sum = 0 
+    while True: 
+        x = ord(data[pos]) 
+        sum = (sum << 7) + (x & 0x7F) 
+        pos += 1 
+        if not (x & 0x80): 
+            return sum, pos
+
 def getNumbersAsList(str):
     '''
     Translate each char into a number, return in a list. 
@@ -296,13 +334,13 @@ class Enumeration(object):
         return Enumeration(lst) 
 
     def hasattr(self, attr): 
-        if attr in self.lookup.keys():
+        if attr in self.lookup:
             return True
         return False
         #return self.lookup.has_key(attr) 
 
     def hasValue(self, attr): 
-        if attr in self.reverseLookup.keys():
+        if attr in self.reverseLookup:
             return True
         return False
         #return self.reverseLookup.has_key(attr) 
@@ -565,12 +603,15 @@ class MidiEvent(object):
         >>> me1.velocity
         120
         '''
-        # x, y, and z define characteristics of the first two chars
+        pos = self._readChannelVoiceMessage(ord(str[0]), str, 1)
+        return str[pos:]
+
+    def _readChannelVoiceMessage(self, x, data, pos):
+        '''Given the status byte value `x` and the index `pos` of the first data byte in `data`, read a channel voice message and return the index following the message.
+        '''
         # for x: The left nybble (4 bits) contains the actual command, and the right nibble contains the midi channel number on which the command will be executed.
-        x = ord(str[0]) # return the char number
         y = x & 0xF0  # bitwise and to derive channel number
-        z = ord(str[1])
-        thirdByte = str[2] 
+        z = ord(data[pos])
 
         self.channel = (x & 0x0F) + 1  # this is same as y + 1
         self.type = channelVoiceMessages.whatis(y) 
@@ -578,21 +619,19 @@ class MidiEvent(object):
         if (self.type == "PROGRAM_CHANGE" or 
             self.type == "CHANNEL_KEY_PRESSURE"): 
             self.data = z 
-            return str[2:] 
+            return pos + 1
         elif (self.type == "CONTROLLER_CHANGE"):
             # for now, do nothing with this data
-            # for a note, str[2] is velocity; here, it is the control value
+            # for a note, the third byte is velocity; here, it is the 
+            # control value
             self.pitch = z # this is the controller id
-            self.velocity = ord(thirdByte) # this is the controller value
-            return str[3:] 
+            self.velocity = ord(data[pos + 1]) # this is the controller value
+            return pos + 2
         else: 
             self.pitch = z # the second byte
             # read the third chart toi get velocity 
-            self.velocity = ord(thirdByte) 
-            # each MidiChannel object is accessed here
-            # using that channel, data for each event is added or 
-            # removed 
-            return str[3:] 
+            self.velocity = ord(data[pos + 1]) 
+            return pos + 2
 
     def read(self, time, str): 
         '''
@@ -618,80 +657,79 @@ class MidiEvent(object):
         >>> (159 & 0x0F) + 1 # getting the channel
         16
         '''
-        if len(str) < 2:
+        pos = self._readBuffer(time, str, 0, len(str))
+        return str[pos:]
+
+    def _readBuffer(self, time, data, pos, end):
+        '''
+        Read this event from `data` starting at index `pos`, not reading beyond index `end`; return the index following the event. 
+
+        The `data` is never sliced, other than to extract the data of sysex and meta events. 
+        '''
+        if end - pos < 2:
             # often what we have here are null events:
             # the string is simply: 0x00
-            environLocal.printDebug(['MidiEvent.read(): got bad data string', 'time', time, 'str', repr(str)])
-            return ''
+            environLocal.printDebug(['MidiEvent.read(): got bad data string', 'time', time, 'str', repr(data[pos:end])])
+            return end
 
         # x, y, and z define characteristics of the first two chars
         # for x: The left nybble (4 bits) contains the actual command, and the right nibble contains the midi channel number on which the command will be executed.
-        x = ord(str[0]) # given a string representation, get decimal number
+        x = ord(data[pos]) # given a string representation, get decimal number
 
         # detect running status: if the status byte is less than 128, its 
         # not a status byte, but a data byte
         if x < 128:
             # environLocal.printDebug(['MidiEvent.read(): found running status even data', 'self.lastStatusByte:', self.lastStatusByte])
-
             if self.lastStatusByte is not None:
                 rsb = self.lastStatusByte
             else: # provide a default
                 rsb = chr(0x90)
-            #post = self._parseChannelVoiceMessage(str, runningStatusByte=rsb)
-            #return post
-            # add the running status byte to the front of the string 
-            # and process as before
-            str = rsb + str
-            x = ord(str[0]) # given a string representation, get decimal number
+            # process the data bytes found at pos with the running status byte
+            x = ord(rsb)
         else:
             # store last status byte
-            self.lastStatusByte = str[0]
+            self.lastStatusByte = data[pos]
+            pos += 1
+        # pos is now the index of the first data byte
 
         y = x & 0xF0  # bitwise and to derive message type
-        z = ord(str[1]) 
-
-        #environLocal.printDebug(['MidiEvent.read(): trying to parse a MIDI event, looking at first two chars:', 'repr(x)', repr(x), 'charToBinary(str[0])', charToBinary(str[0]), 'charToBinary(str[1])', charToBinary(str[1])])
+        z = ord(data[pos]) 
 
         if channelVoiceMessages.hasValue(y): 
-            return self._parseChannelVoiceMessage(str)
+            return self._readChannelVoiceMessage(x, data, pos)
 
         elif y == 0xB0 and channelModeMessages.hasValue(z): 
             self.channel = (x & 0x0F) + 1 
             self.type = channelModeMessages.whatis(z) 
             if self.type == "LOCAL_CONTROL": 
-                self.data = (ord(str[2]) == 0x7F) 
+                self.data = (ord(data[pos + 1]) == 0x7F) 
             elif self.type == "MONO_MODE_ON": 
-                self.data = ord(str[2]) 
+                self.data = ord(data[pos + 1]) 
             else:
-                environLocal.printDebug(['unhandled message:', str[2]])
-            return str[3:]
+                environLocal.printDebug(['unhandled message:', data[pos + 1]])
+            return pos + 2
 
         elif x == 0xF0 or x == 0xF7: 
             self.type = {0xF0: "F0_SYSEX_EVENT", 
                          0xF7: "F7_SYSEX_EVENT"}[x] 
-            length, str = getVariableLengthNumber(str[1:]) 
-            self.data = str[:length] 
-            return str[length:]
+            length, pos = readVariableLengthNumber(data, pos) 
+            self.data = data[pos:min(pos + length, end)] 
+            return pos + length
 
         # SEQUENCE_TRACK_NAME and other MetaEvents are here
         elif x == 0xFF: 
-            #environLocal.printDebug(['MidiEvent.read(): got a variable length meta event', charToBinary(str[0])])
             if not metaEvents.hasValue(z): 
                 environLocal.printDebug(["unknown meta event: FF %02X" % z])
                 sys.stdout.flush() 
                 raise MidiException("Unknown midi event type: %r, %r" % (x, z))
             self.type = metaEvents.whatis(z) 
-            length, str = getVariableLengthNumber(str[2:]) 
-            self.data = str[:length] 
-            # return remainder
-            return str[length:] 
+            length, pos = readVariableLengthNumber(data, pos + 1) 
+            self.data = data[pos:min(pos + length, end)] 
+            return pos + length
         else:
             # an uncaught message
-            environLocal.printDebug(['got unknown midi event type', repr(x), 'charToBinary(str[0])', charToBinary(str[0]), 'charToBinary(str[1])', charToBinary(str[1])])
-
+            environLocal.printDebug(['got unknown midi event type', repr(x), 'charToBinary(data[pos])', charToBinary(data[pos])])
             raise MidiException("Unknown midi event type")
-            #return everything but the first character
-            return str[1:] # 
 
 
     def write(self): 
@@ -929,51 +967,87 @@ class MidiTrack(object):
         Creates and stores :class:`~music21.midi.base.DeltaTime` 
         and :class:`~music21.midi.base.MidiEvent` objects. 
         '''
-        time = 0 # a running counter of ticks
+        pos = self._readBuffer(str, 0)
+        return str[pos:] # remainder string after extracting track data
+
+    def _readBuffer(self, data, pos):
+        '''
+        Read the track that begins at index `pos` of `data`, and return the index following the track. 
 
-        if not str[:4] == "MTrk":
+        The `data` is walked with an index and is not copied; it can be a string, a buffer, or an mmap object.
+        '''
+        start, end = self._readHeader(data, pos)
+        events = self.events
+        for delta_t, e in self._iterBuffer(data, start, end):
+            events.append(delta_t) 
+            events.append(e) 
+        # the next chunk begins after the declared length of this track
+        return start + self.length
+
+    def _readHeader(self, data, pos):
+        '''
+        Read the chunk header of the track that begins at index `pos` of `data`, and set the `length` attribute. Return the indices of the start and end of the event data.
+        '''
+        if not data[pos:pos + 4] == "MTrk":
             raise MidiException('badly formed midi string: missing leading MTrk')
         # get the 4 chars after the MTrk encoding
-        length, str = getNumber(str[4:], 4)      
+        length, pos = readNumber(data, pos + 4, 4)
         #environLocal.printDebug(['MidiTrack.read(): got chunk size', length])   
         self.length = length 
+        return pos, min(pos + length, len(data))
 
-        # all event data is in the track str
-        trackStr = str[:length] 
-        remainder = str[length:] 
+    def _iterBuffer(self, data, pos, end, includeSysex=True, 
+        includeMeta=True):
+        '''
+        Generate pairs of :class:`~music21.midi.base.DeltaTime` and :class:`~music21.midi.base.MidiEvent` objects from the event data of this track found between indices `pos` and `end` of `data`. The objects are not stored in this track.
 
-        ePrevious = None
-        while trackStr: 
+        If `includeSysex` or `includeMeta` is False, sysex or meta events are passed over without creating objects; the time of a skipped event is added to the following DeltaTime.
+        '''
+        skipEvents = not includeSysex or not includeMeta
+        skippedTime = 0 # ticks of skipped events
+        lastStatusByte = None
+        while pos < end: 
             # shave off the time stamp from the event
+            dt, pos = readVariableLengthNumber(data, pos)
+
+            if skipEvents and end - pos >= 2:
+                x = ord(data[pos])
+                length = None
+                if x == 0xFF and not includeMeta:
+                    # unknown meta events are dropped with their time, 
+                    # as when reading
+                    if metaEvents.hasValue(ord(data[pos + 1])):
+                        length, posData = readVariableLengthNumber(data, 
+                                                                   pos + 2)
+                    else:
+                        continue
+                elif (x == 0xF0 or x == 0xF7) and not includeSysex:
+                    length, posData = readVariableLengthNumber(data, pos + 1)
+                if length is not None:
+                    # a status byte is always stored, as when reading
+                    lastStatusByte = data[pos]
+                    skippedTime += dt
+                    pos = posData + length
+                    continue
+
             delta_t = DeltaTime(self) 
-            # return extracted time, as well as remaining string
-            dt, trackStrCandidate = delta_t.read(trackStr) 
-            # this is the offset that this event happens at, in ticks
-            timeCandidate = time + dt 
-    
+            delta_t.time = dt + skippedTime
             # pass self to event, set this MidiTrack as the track for this event
             e = MidiEvent(self) 
-            if ePrevious is not None: # set the last status byte
-                e.lastStatusByte = ePrevious.lastStatusByte
+            e.lastStatusByte = lastStatusByte
             # some midi events may raise errors; simply skip for now
             try:
-                trackStrCandidate = e.read(timeCandidate, trackStrCandidate) 
+                # the time is the offset of this event, in ticks; this is 
+                # not stored on the event
+                pos = e._readBuffer(None, data, pos, end) 
             except MidiException:
-                # assume that trackStr, after delta extraction, is still correct
-                #environLocal.printDebug(['forced to skip event; delta_t:', delta_t])
-                # set to result after taking delta time
-                trackStr = trackStrCandidate
+                # assume that the index, after delta extraction, is 
+                # still correct
                 continue
-            # only set after trying to read, which may raise exception
-            time = timeCandidate
-            trackStr = trackStrCandidate # remainder string
-            # only append if we get this far
-            self.events.append(delta_t) 
-            self.events.append(e) 
-            ePrevious = e
-
-        return remainder # remainder string after extracting track data
-    
+            skippedTime = 0
+            lastStatusByte = e.lastStatusByte
+            yield delta_t, e
+
     def write(self): 
         '''
         returns a string of midi-data from the `.events` in the object.
@@ -1093,32 +1167,52 @@ class MidiFile(object):
         '''
         self.file.close() 
     
-    def read(self): 
+    def read(self, useMmap=False): 
         '''
         Read and parse MIDI data stored in a file.
+
+        If `useMmap` is True and the file is a real file, the file is memory-mapped rather than read into a string; only the data of each event is copied.
         '''
-        self.readstr(self.file.read()) 
+        if useMmap and hasattr(self.file, 'fileno'):
+            data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                self.readstr(data)
+            finally:
+                data.close()
+        else:
+            self.readstr(self.file.read()) 
     
     def readstr(self, str): 
         '''
         Read and parse MIDI data as a string.
+
+        The string is walked with an index and never sliced into remainders, so the time needed is linear in the size of the data. Any object that supports indexing and slicing into strings, such as a buffer or an mmap object, can be given.
+        '''
+        numTracks, pos = self._readHeader(str)
+        for i in range(numTracks): 
+            trk = MidiTrack(i) # sets the MidiTrack index parameters
+            pos = trk._readBuffer(str, pos) # get the index of the next track
+            self.tracks.append(trk)
+
+    def _readHeader(self, data):
+        '''
+        Read the header chunk of MIDI data, setting the format and timing attributes of this object. Return the number of tracks and the index of the first track.
         '''
-        if not str[:4] == "MThd":
-            raise MidiException('badly formated midi string, got: %s' % str[:20])
+        if not data[:4] == "MThd":
+            raise MidiException('badly formated midi string, got: %s' % data[:20])
 
-        # we step through the str src, chopping off characters as we go
-        # and reassigning to str
-        length, str = getNumber(str[4:], 4) 
+        # we step through the data, advancing an index as we go
+        length, pos = readNumber(data, 4, 4) 
         if not length == 6:
             raise MidiException('badly formated midi string')
 
-        format, str = getNumber(str, 2) 
+        format, pos = readNumber(data, pos, 2) 
         self.format = format 
         if not format in [0, 1]:
             raise MidiException('cannot handle midi file format: %s' % format)
 
-        numTracks, str = getNumber(str, 2) 
-        division, str = getNumber(str, 2) 
+        numTracks, pos = readNumber(data, pos, 2) 
+        division, pos = readNumber(data, pos, 2) 
 
         # very few midi files seem to define ticksPerSecond
         if division & 0x8000: 
@@ -1132,13 +1226,56 @@ class MidiFile(object):
         else: 
             self.ticksPerQuarterNote = division & 0x7FFF 
 
-        #environLocal.printDebug(['MidiFile.readstr(): got midi file format:', self.format, 'with specified number of tracks:', numTracks, 'ticksPerSecond:', self.ticksPerSecond, 'ticksPerQuarterNote:', self.ticksPerQuarterNote])
+        #environLocal.printDebug(['MidiFile._readHeader(): got midi file format:', self.format, 'with specified number of tracks:', numTracks, 'ticksPerSecond:', self.ticksPerSecond, 'ticksPerQuarterNote:', self.ticksPerQuarterNote])
+        return numTracks, pos
+
+    def iterEvents(self, trackFilter=None, includeSysex=True, 
+        includeMeta=True, useMmap=False):
+        '''
+        Read the MIDI data stored in the open file, generating :class:`~music21.midi.base.MidiEvent` objects one at a time rather than storing all tracks in this object. 
+
+        The `time` attribute of each event is set to its position in ticks from the start of its track; the `track` attribute is a :class:`~music21.midi.base.MidiTrack` whose `index` is the track number, but whose `events` list is left empty. The `format` and timing attributes of this object are set from the header before the first event is generated.
+
+        If `trackFilter` is a list of track indices, other tracks are passed over without being parsed. If `includeSysex` or `includeMeta` is False, sysex or meta events are passed over without creating objects. If `useMmap` is True, the file is memory-mapped as in :meth:`~music21.midi.base.MidiFile.read`.
+
+        >>> import os
+        >>> from music21 import *
+        >>> fp = os.path.join(common.getSourceFilePath(), 'midi', 'testPrimitive', 'test01.mid')
+        >>> mf = midi.MidiFile()
+        >>> mf.open(fp)
+        >>> events = list(mf.iterEvents(trackFilter=[1], includeMeta=False))
+        >>> mf.close()
+        >>> mf.ticksPerQuarterNote
+        960
+        >>> events[0]
+        <MidiEvent CONTROLLER_CHANGE, t=0, track=1, channel=1, _parameter1=7, _parameter2=127>
+        >>> events[-1]
+        <MidiEvent NOTE_ON, t=7620, track=1, channel=1, pitch=60, velocity=0>
+        >>> len([e for e in events if e.isNoteOn()])
+        18
+        '''
+        if useMmap and hasattr(self.file, 'fileno'):
+            data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = self.file.read()
+        try:
+            numTracks, pos = self._readHeader(data)
+            for i in range(numTracks): 
+                trk = MidiTrack(i)
+                start, end = trk._readHeader(data, pos)
+                pos = start + trk.length
+                if trackFilter is not None and i not in trackFilter:
+                    continue
+                time = 0
+                for delta_t, e in trk._iterBuffer(data, start, end, 
+                    includeSysex=includeSysex, includeMeta=includeMeta):
+                    time += delta_t.time
+                    e.time = time
+                    yield e
+        finally:
+            if useMmap and hasattr(self.file, 'fileno'):
+                data.close()
 
-        for i in range(numTracks): 
-            trk = MidiTrack(i) # sets the MidiTrack index parameters
-            str = trk.read(str) # pass all the remaining string, reassing
-            self.tracks.append(trk) 
-    
     def write(self): 
         '''
         Write MIDI data as a file.
@@ -1164,6 +1301,112 @@ class MidiFile(object):
 
 
 
+#-------------------------------------------------------------------------------
+# writing from columns of note data
+
+def _appendVariableLengthNumber(data, x):
+    '''Append the variable length encoding of the positive integer `x` to the bytearray `data`.
+    '''
+    if x < 0x80:
+        data.append(x)
+        return
+    post = [x & 0x7F]
+    x >>= 7
+    while x:
+        post.append((x & 0x7F) | 0x80)
+        x >>= 7
+    post.reverse()
+    data.extend(post)
+
+
+def notesToTrackStr(ticks, channels, pitches, velocities, durations):
+    '''
+    Given parallel lists of note start times in ticks, channels (1-16), MIDI pitch numbers, velocities, and durations in ticks, return a complete MIDI track chunk, beginning with `MTrk`, as a string.
+
+    Note-on and note-off messages are encoded directly into a bytearray; no :class:`~music21.midi.base.MidiEvent` or :class:`~music21.midi.base.DeltaTime` objects are created. Where a note-off and a note-on happen at the same time, the note-off is written first. The track ends with an END_OF_TRACK meta event.
+
+    >>> from music21 import *
+    >>> trackStr = midi.notesToTrackStr([0, 1024], [1, 1], [60, 62], [90, 90], [1024, 2048])
+    >>> mt = midi.MidiTrack(1)
+    >>> mt.read(trackStr)
+    ''
+    >>> [e for e in mt.events if not e.isDeltaTime()]
+    [<MidiEvent NOTE_ON, t=None, track=1, channel=1, pitch=60, velocity=90>, <MidiEvent NOTE_OFF, t=None, track=1, channel=1, pitch=60, velocity=0>, <MidiEvent NOTE_ON, t=None, track=1, channel=1, pitch=62, velocity=90>, <MidiEvent NOTE_OFF, t=None, track=1, channel=1, pitch=62, velocity=0>, <MidiEvent END_OF_TRACK, t=None, track=1, channel=None, data=''>]
+    >>> [e.time for e in mt.events if e.isDeltaTime()]
+    [0, 1024, 0, 2048, 0]
+
+    >>> midi.notesToTrackStr([0], [17], [60], [90], [1024])
+    Traceback (most recent call last):
+    MidiException: cannot write channel values outside of 1-16
+    '''
+    count = len(ticks)
+    if not (len(channels) == len(pitches) == len(velocities) == 
+        len(durations) == count):
+        raise MidiException('cannot write note data of unequal lengths')
+    if count > 0:
+        if min(channels) < 1 or max(channels) > 16:
+            raise MidiException('cannot write channel values outside of 1-16')
+        for values in (pitches, velocities):
+            if min(values) < 0 or max(values) > 127:
+                raise MidiException('cannot write pitch or velocity values outside of 0-127')
+        if min(ticks) < 0 or min(durations) < 0:
+            raise MidiException('cannot write negative times')
+
+    # sort keys are (time, order, index); note-offs come before note-ons at 
+    # the same time, unless the note-off ends a note of no duration
+    keys = []
+    for i in xrange(count):
+        t = ticks[i]
+        d = durations[i]
+        keys.append((t, 1, i))
+        if d > 0:
+            keys.append((t + d, 0, i))
+        else:
+            keys.append((t, 2, i))
+    keys.sort()
+
+    data = bytearray()
+    timeLast = 0
+    for t, order, i in keys:
+        _appendVariableLengthNumber(data, t - timeLast)
+        timeLast = t
+        if order == 1:
+            data.append(0x90 + channels[i] - 1)
+            data.append(pitches[i])
+            data.append(velocities[i])
+        else:
+            data.append(0x80 + channels[i] - 1)
+            data.append(pitches[i])
+            data.append(0)
+    # end of track meta event
+    data.extend((0x00, 0xFF, 0x2F, 0x00))
+    return "MTrk" + putNumber(len(data), 4) + str(data)
+
+
+def notesToMidiStr(tracks, ticksPerQuarterNote=1024):
+    '''
+    Given a list of tracks, each a list or tuple of the five parallel lists taken by :func:`~music21.midi.base.notesToTrackStr`, return a complete format 1 MIDI file as a string.
+
+    >>> from music21 import *
+    >>> track = ([0, 512], [1, 1], [60, 64], [100, 100], [512, 512])
+    >>> midiStr = midi.notesToMidiStr([track, track], ticksPerQuarterNote=480)
+    >>> mf = midi.MidiFile()
+    >>> mf.readstr(midiStr)
+    >>> len(mf.tracks), mf.ticksPerQuarterNote
+    (2, 480)
+    '''
+    if ticksPerQuarterNote & 0x8000:
+        raise MidiException('cannot write midi string')
+    post = ["MThd", putNumber(6, 4), putNumber(1, 2), 
+            putNumber(len(tracks), 2), putNumber(ticksPerQuarterNote, 2)]
+    for ticks, channels, pitches, velocities, durations in tracks:
+        post.append(notesToTrackStr(ticks, channels, pitches, velocities, 
+                                    durations))
+    return ''.join(post)
+
+
+
+
 #-------------------------------------------------------------------------------
 class TestExternal(unittest.TestCase):
     '''These are tests that open windows and rely on external software
@@ -1479,6 +1722,69 @@ class Test(unittest.TestCase):
         #    print n, n.quarterLength
         #s.show()
 
+    def testReadMmap(self):
+        dir = common.getPackageDir(relative=False, remapSep=os.sep)
+        for fp in dir:
+            if fp.endswith('midi'):
+                break
+        dirLib = os.path.join(fp, 'testPrimitive')
+        for fn in ['test03.mid', 'test09.mid']:
+            fp = os.path.join(dirLib, fn)
+            mf = MidiFile()
+            mf.open(fp)
+            mf.read()
+            mf.close()
+
+            mfMmap = MidiFile()
+            mfMmap.open(fp)
+            mfMmap.read(useMmap=True)
+            mfMmap.close()
+
+            self.assertEqual(len(mfMmap.tracks), len(mf.tracks))
+            for t1, t2 in zip(mf.tracks, mfMmap.tracks):
+                self.assertEqual(t2.length, t1.length)
+                self.assertEqual([repr(e) for e in t2.events], 
+                                 [repr(e) for e in t1.events])
+            # data of events is copied out of the mmap
+            self.assertEqual(mfMmap.writestr(), mf.writestr())
+
+    def testIterEvents(self):
+        dir = common.getPackageDir(relative=False, remapSep=os.sep)
+        for fp in dir:
+            if fp.endswith('midi'):
+                break
+        fp = os.path.join(fp, 'testPrimitive', 'test09.mid')
+        mf = MidiFile()
+        mf.open(fp)
+        mf.read()
+        mf.close()
+        # get events with the time from the start of the track
+        match = []
+        for t in mf.tracks:
+            time = 0
+            for e in t.events:
+                if e.isDeltaTime():
+                    time += e.time
+                elif not metaEvents.hasattr(e.type):
+                    match.append((t.index, time, e.type, e.channel, 
+                                  e._parameter1, e._parameter2))
+
+        mfIter = MidiFile()
+        mfIter.open(fp)
+        post = [(e.track.index, e.time, e.type, e.channel, 
+                 e._parameter1, e._parameter2) for e in 
+                 mfIter.iterEvents(includeMeta=False)]
+        mfIter.close()
+        self.assertEqual(len(post), 5760)
+        self.assertEqual(post, match)
+
+        mfIter = MidiFile()
+        mfIter.open(fp)
+        post = [e for e in mfIter.iterEvents(trackFilter=[1], useMmap=True)]
+        mfIter.close()
+        self.assertEqual(len(post), len(mf.tracks[1].events) / 2)
+        self.assertEqual(set([e.track.index for e in post]), set([1]))
+
 #-------------------------------------------------------------------------------
 # define presented order in documentation
 _DOC_ORDER = []
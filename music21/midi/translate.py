@@ -1348,31 +1348,22 @@ def midiTrackToStream(mt, ticksPerQuarter=None, quantizePost=True,
     # need to pair note-on with note-off
     notes = [] # store pairs of pairs
     metaEvents = [] # store pairs of abs time, m21 object
-    memo = [] # store already matched note off
+    # for each (channel, pitch), store the index in notes of the note-on 
+    # that waits for its note-off; as in MidiEvent.matchedNoteOff(), the 
+    # next event of the same pitch and channel ends the note, and is not
+    # otherwise processed
+    pending = {}
     for i in range(len(events)):
         #environLocal.printDebug(['midiTrackToStream(): paired events', events[i][0], events[i][1]])
-        if i in memo:
-            continue
         t, e = events[i]
-        # for each note on event, we need to search for a match in all future
-        # events
-        if e.isNoteOn():
-            match = None
-            #environLocal.pd(['midiTrackToStream(): isNoteOn', e])
-            for j in range(i+1, len(events)):
-                if j in memo: 
-                    continue
-                tSub, eSub = events[j]
-                if e.matchedNoteOff(eSub):
-                    memo.append(j)
-                    match = i, j
-                    break
-            if match is not None:
-                i, j = match
-                notes.append([events[i], events[j]])
-            else:
-                pass
-                #environLocal.printDebug(['midiTrackToStream(): cannot find a note off for a note on', e])
+        key = (e.channel, e.pitch)
+        if key in pending:
+            iNote = pending.pop(key)
+            notes[iNote] = [notes[iNote], events[i]]
+        elif e.isNoteOn():
+            # keep notes in the order of their note-on events
+            pending[key] = len(notes)
+            notes.append(events[i])
         else:
             if e.type == 'TIME_SIGNATURE':
                 # time signature should be 4 bytes
@@ -1391,6 +1382,11 @@ def midiTrackToStream(mt, ticksPerQuarter=None, quantizePost=True,
             else:
                 pass
                 #environLocal.printDebug(['unhandled event:', e.type, e.data])
+    if pending:
+        #environLocal.printDebug(['midiTrackToStream(): cannot find a note off for a note on', pending])
+        # remove note-on events without a note-off
+        unmatched = set(pending.values())
+        notes = [notes[i] for i in range(len(notes)) if i not in unmatched]
 
     # first create meta events
     for t, obj in metaEvents:
@@ -1404,7 +1400,7 @@ def midiTrackToStream(mt, ticksPerQuarter=None, quantizePost=True,
     #composite = []
     chordSub = None
     i = 0
-    iGathered = [] # store a lost of indexes of gathered values put into chords
+    iGathered = set() # store the indexes of gathered values put into chords
     voicesRequired = False
     if len(notes) > 1:
         #environLocal.pd(['\nmidiTrackToStream(): notes', notes])
@@ -1442,9 +1438,9 @@ def midiTrackToStream(mt, ticksPerQuarter=None, quantizePost=True,
                         continue
                     if chordSub is None: # start a new one
                         chordSub = [notes[i]]
-                        iGathered.append(i)
+                        iGathered.add(i)
                     chordSub.append(notes[j])
-                    iGathered.append(j)
+                    iGathered.add(j)
                     continue # keep looping through events to see 
                     # if we can add more elements to this chord group
                 else: # no more matches; assuming chordSub tones are contiguous
@@ -1744,6 +1740,98 @@ def streamToMidiFile(inputM21):
 
 
 
+def streamToNoteArrays(inputM21, channel=1):
+    '''
+    Return five parallel lists of note start times in ticks, channels, MIDI pitch numbers, velocities, and durations in ticks for all Notes and Chords in the flattened Stream, sorted by start time. These can be given to :func:`~music21.midi.base.notesToTrackStr`.
+
+    Tied Notes and Chords are joined into one note for each pitch, and notes without duration, such as grace notes, are omitted. Velocities are realized from each Volume without searching for a Dynamic context, and microtones are rounded to the nearest MIDI pitch.
+
+    >>> from music21 import *
+    >>> s = stream.Stream()
+    >>> s.append(note.Note('c4', quarterLength=2))
+    >>> s.append(chord.Chord(['e4', 'g4']))
+    >>> n = note.Note('a4')
+    >>> n.tie = tie.Tie('start')
+    >>> s.append(n)
+    >>> n = note.Note('a4', quarterLength=.5)
+    >>> n.tie = tie.Tie('stop')
+    >>> s.append(n)
+    >>> ticks, channels, pitches, velocities, durations = midi.translate.streamToNoteArrays(s)
+    >>> ticks
+    [0, 2048, 2048, 3072]
+    >>> pitches
+    [60, 64, 67, 69]
+    >>> durations
+    [2048, 1024, 1024, 1536]
+    >>> velocities
+    [90, 90, 90, 90]
+    '''
+    ticks = []
+    pitches = []
+    velocities = []
+    durations = []
+    # for each MIDI pitch, the index of a Note waiting for a tie stop
+    tied = {}
+    for obj in inputM21.flat.notes:
+        d = durationToMidi(obj.duration)
+        if d == 0: # grace notes are not written
+            continue
+        t = offsetToMidi(obj.offset)
+        if obj.tie is None:
+            tieType = None
+        else:
+            tieType = obj.tie.type
+        velocity = None
+        for p in [p.midi for p in obj.pitches]:
+            if tieType in ['stop', 'continue'] and p in tied:
+                # extend the tied note
+                i = tied[p]
+                durations[i] = t + d - ticks[i]
+                if tieType == 'stop':
+                    del tied[p]
+                continue
+            if tieType == 'start':
+                tied[p] = len(ticks)
+            if velocity is None:
+                velocity = int(round(obj.volume.getRealized(
+                               useDynamicContext=False) * 127))
+            ticks.append(t)
+            pitches.append(p)
+            velocities.append(velocity)
+            durations.append(d)
+    channels = [channel] * len(ticks)
+    return ticks, channels, pitches, velocities, durations
+
+
+def streamToMidiStr(inputM21):
+    '''
+    Convert the Notes and Chords of a Stream, or of each Part of a Score, to a complete MIDI file as a string, using :func:`~music21.midi.translate.streamToNoteArrays` and :func:`~music21.midi.base.notesToMidiStr`.
+
+    This is much faster than :func:`~music21.midi.translate.streamToMidiFile`, as no :class:`~music21.midi.base.MidiEvent` objects are created, but only notes are written: tempo, instruments, time and key signatures, and microtones are ignored. Each Part is written to its own track and channel, avoiding the percussion channel 10.
+
+    >>> from music21 import *
+    >>> s = corpus.parse('bach/bwv66.6')
+    >>> mf = midi.MidiFile()
+    >>> mf.readstr(midi.translate.streamToMidiStr(s))
+    >>> len(mf.tracks)
+    4
+    >>> len([e for e in mf.tracks[0].events if e.isNoteOn()])
+    36
+    '''
+    # all but 10
+    allChannels = range(1, 10) + range(11, 17)
+    if inputM21.hasPartLikeStreams():
+        procList = inputM21.getElementsByClass('Stream')
+    else:
+        procList = [inputM21]
+    tracks = []
+    for i, s in enumerate(procList):
+        tracks.append(streamToNoteArrays(s, 
+                      channel=allChannels[i % len(allChannels)]))
+    return midiModule.notesToMidiStr(tracks, 
+                                     ticksPerQuarterNote=defaults.ticksPerQuarter)
+
+
 def midiFileToStream(mf, inputM21=None):
     '''
     Main routine to convert a :class:`~music21.midi.base.MidiFile` object to a 
@@ -2500,6 +2588,71 @@ class Test(unittest.TestCase):
         s = converter.parse(fp)
         #s.show('t')
         self.assertEqual(len(s.flat.getElementsByClass('Chord')), 4)
+
+    def testImportNotePairingA(self):
+        from music21 import midi
+
+        mt = midi.MidiTrack(1)
+        # pairs of abs time, (type, channel, pitch, velocity)
+        data = [(0, ('NOTE_ON', 1, 60, 90)), 
+                (512, ('NOTE_ON', 2, 60, 90)),
+                # a note-on without a note-off is dropped
+                (512, ('NOTE_ON', 1, 72, 90)),
+                (1024, ('NOTE_OFF', 1, 60, 0)), 
+                # the next event of the same pitch and channel ends a note
+                (1024, ('NOTE_ON', 2, 60, 80)), 
+                (2048, ('NOTE_ON', 2, 60, 0)),
+                (2048, ('NOTE_ON', 1, 64, 90)),
+                (3072, ('NOTE_OFF', 1, 64, 0))]
+        tLast = 0
+        for t, (type, channel, pitch, velocity) in data:
+            dt = midi.DeltaTime(mt)
+            dt.time = t - tLast
+            tLast = t
+            me = midi.MidiEvent(mt)
+            me.type = type
+            me.channel = channel
+            me.pitch = pitch
+            me.velocity = velocity
+            mt.events += [dt, me]
+
+        s = midiTrackToStream(mt, ticksPerQuarter=1024)
+        post = [(n.offset, n.quarterLength, n.pitch.midi) for n in 
+                s.flat.getElementsByClass('Note')]
+        self.assertEqual(post, [(0.0, 1.0, 60), (0.5, 0.5, 60), 
+                                (2.0, 1.0, 64)])
+
+    def testStreamToMidiStr(self):
+        from music21 import corpus, midi
+
+        def getNotes(mf):
+            # get tuples of track, start, pitch, and duration
+            post = []
+            for mt in mf.tracks:
+                t = 0
+                starts = {}
+                for e in mt.events:
+                    if e.isDeltaTime():
+                        t += e.time
+                    elif e.isNoteOn():
+                        starts[e.pitch] = t
+                    elif e.isNoteOff() and e.pitch in starts:
+                        start = starts.pop(e.pitch)
+                        post.append((mt.index, start, e.pitch, t - start))
+            return sorted(post)
+
+        s = corpus.parse('bach/bwv66.6')
+        mf = midi.MidiFile()
+        mf.readstr(streamToMidiStr(s))
+        self.assertEqual(len(mf.tracks), 4)
+        self.assertEqual(mf.ticksPerQuarterNote, defaults.ticksPerQuarter)
+        post = getNotes(mf)
+        self.assertEqual(len(post), 163)
+        # the same notes are written as by the complete translation, 
+        # though the complete translation numbers tracks from 1
+        match = [(i - 1, t, p, d) for i, t, p, d in 
+                 getNotes(streamToMidiFile(s))]
+        self.assertEqual(post, match)
         
 
 #-------------------------------------------------------------------------------
@@ -20,6 +20,7 @@ converter module's :func:`~music21.converter.parse` function.
 
 import music21
 import unittest
+import multiprocessing
 
 from music21.musedata import base as museDataModule
 
@@ -320,13 +321,44 @@ def musedataPartToStreamPart(museDataPart, inputM21=None):
     return s
 
 
-def museDataWorkToStreamScore(museDataWork, inputM21=None):
+def _musedataPartToStreamPartWorker(args):
+    '''Translate the source lines of one musedata part in a worker process, returning a serialized Score that contains the translated Part. 
+    '''
+    from music21 import converter
+    from music21 import stream
+
+    src, stage = args
+    mdPart = museDataModule.MuseDataPart(src, stage)
+    mdPart.update()
+    s = musedataPartToStreamPart(mdPart, stream.Score())
+    return converter.freezeStr(s)
+
+
+def _museDataPartsToStreamParts(mdpObjs, processes=2):
+    '''Translate a list of musedata parts in a pool of `processes` worker processes, returning a list of Parts in the same order. 
+    '''
+    from music21 import converter
+
+    jobs = [(mdPart.src, mdPart.stage) for mdPart in mdpObjs]
+    pool = multiprocessing.Pool(processes=processes)
+    try:
+        frozen = pool.map(_musedataPartToStreamPartWorker, jobs)
+    finally:
+        pool.close()
+        pool.join()
+    return [converter.unfreezeStr(data).getElementsByClass('Part')[0] 
+            for data in frozen]
+
+
+def museDataWorkToStreamScore(museDataWork, inputM21=None, processes=None):
     '''Given an museDataWork object, build into a multi-part :class:`~music21.stream.Score` with metadata.
 
     This assumes that this MuseDataHandler defines a single work (with 1 or fewer reference numbers). 
     
     if the optional parameter inputM21 is given a music21 Stream subclass, it will use that object
     as the outermost object.  However, inner parts will always be made :class:`~music21.stream.Part` objects.
+
+    If `processes` is greater than 1, parts are translated in parallel in a pool of worker processes.
     '''
     from music21 import stream
     from music21 import metadata
@@ -341,20 +373,107 @@ def museDataWorkToStreamScore(museDataWork, inputM21=None):
 
     md = metadata.Metadata()
     s.insert(0, md)
+    _museDataPartToMetadata(mdpObjs[0], md)
+
+    if processes is not None and processes > 1 and len(mdpObjs) > 1:
+        for p in _museDataPartsToStreamParts(mdpObjs, processes=processes):
+            s.insert(0, p)
+    else:
+        for mdPart in mdpObjs:
+            musedataPartToStreamPart(mdPart, s)
+    return s
+
+
+
 
-    md.title = mdpObjs[0].getWorkTitle()
-    md.movementNumber = mdpObjs[0].getMovementNumber()
-    md.movementName = mdpObjs[0].getMovementTitle()
+def _museDataPartToMetadata(museDataPart, md):
+    '''Set the attributes of a Metadata object from the header of a MuseDataPart.
+    '''
+    md.title = museDataPart.getWorkTitle()
+    md.movementNumber = museDataPart.getMovementNumber()
+    md.movementName = museDataPart.getMovementTitle()
 
     # not obvious where composer is stored
-    #md.composer = mdpObjs[0].getWorkNumber()
-    #md.localeOfComposition = mdpObjs[0].getWorkNumber()
-    md.number = mdpObjs[0].getWorkNumber()
+    #md.composer = museDataPart.getWorkNumber()
+    #md.localeOfComposition = museDataPart.getWorkNumber()
+    md.number = museDataPart.getWorkNumber()
+
+
+def museDataWorkToRichMetadata(museDataWork):
+    '''Given an museDataWork object, return a :class:`~music21.metadata.RichMetadata` object with metadata and summary values (first time and key signatures, note count, duration, and pitch span) read directly from the records, without building a Score.
+
+    >>> from music21 import *
+    >>> from music21.musedata import testFiles
+    >>> mdw = musedata.MuseDataWork()
+    >>> mdw.addString(testFiles.bach_cantata5_mvmt3)
+    >>> rmd = musedata.translate.museDataWorkToRichMetadata(mdw)
+    >>> rmd.timeSignatureFirst, rmd.keySignatureFirst
+    ('3/4', 'sharps -3, mode None')
+    >>> s = musedata.translate.museDataWorkToStreamScore(mdw)
+    >>> rmd.noteCount == len(s.flat.notesAndRests)
+    True
+    >>> rmd.quarterLength == s.flat.highestTime
+    True
+    '''
+    from music21 import metadata
+    from music21 import pitch
+
+    mdpObjs = museDataWork.getParts()
+
+    rmd = metadata.RichMetadata()
+    _museDataPartToMetadata(mdpObjs[0], rmd)
 
+    noteCount = 0
+    quarterLength = 0.0
+    pitchLowest = None
+    pitchHighest = None
     for mdPart in mdpObjs:
-        musedataPartToStreamPart(mdPart, s)
-    return s
+        partLowest = None
+        partHighest = None
+        qlPart = 0.0
+        for mdm in mdPart.getMeasures():
+            # the length of a measure is the furthest position reached
+            # in any of its voices
+            position = 0.0
+            qlMeasure = 0.0
+            for mdr in mdm.getRecords():
+                if mdr.isBack():
+                    position -= mdr.getQuarterLength()
+                    continue
+                elif mdr.isRest():
+                    noteCount += 1
+                    position += mdr.getQuarterLength()
+                elif mdr.isNote() or mdr.isChord():
+                    p = pitch.Pitch(mdr._getPitchParameters())
+                    if partLowest is None or p.ps < partLowest.ps:
+                        partLowest = p
+                    if partHighest is None or p.ps > partHighest.ps:
+                        partHighest = p
+                    # chord tones share the position of the main note
+                    if mdr.isNote():
+                        noteCount += 1
+                        position += mdr.getQuarterLength()
+                qlMeasure = max(qlMeasure, position)
+            qlPart += qlMeasure
+        quarterLength = max(quarterLength, qlPart)
+
+        # parts are translated to concert pitch
+        tInterval = mdPart.getTranspositionIntervalObject()
+        for p in [partLowest, partHighest]:
+            if p is None:
+                continue
+            if tInterval is not None:
+                p = p.transpose(tInterval)
+            if pitchLowest is None or p.ps < pitchLowest.ps:
+                pitchLowest = p
+            if pitchHighest is None or p.ps > pitchHighest.ps:
+                pitchHighest = p
 
+    rmd.setSummary(timeSignatureFirst=mdpObjs[0].getTimeSignatureObject(), 
+        keySignatureFirst=mdpObjs[0].getKeySignature(), 
+        noteCount=noteCount, quarterLength=quarterLength, 
+        pitchLowest=pitchLowest, pitchHighest=pitchHighest)
+    return rmd
 
 
 
@@ -611,6 +730,21 @@ class Test(unittest.TestCase):
         s = corpus.parse('haydn/opus71no1/movement1.zip')
         self.assertEqual(len(s.flat.getElementsByClass('Note')), 2792)
 
+    def testMuseDataParallel(self):
+        from music21 import musedata
+        from music21.musedata import testFiles
+
+        def getWork():
+            mdw = musedata.MuseDataWork()
+            mdw.addString(testFiles.bachContrapunctus1_part1)
+            mdw.addString(testFiles.bachContrapunctus1_part2)
+            return mdw
+
+        s = museDataWorkToStreamScore(getWork(), processes=2)
+        self.assertEqual(len(s.parts), 2)
+        self.assertEqual(len(s.parts[0].flat.notesAndRests), 291)
+        self.assertEqual(len(s.parts[1].flat.notesAndRests), 293)
+
 
 #-------------------------------------------------------------------------------
 # define presented order in documentation
@@ -14,11 +14,8 @@
 import sys
 
 # in order for sax parsing to properly handle unicode strings w/ unicode chars
-# stored in StringIO.StringIO, this update is necessary
-# http://stackoverflow.com/questions/857597/setting-the-encoding-for-sax-parser-in-python
-
-reload(sys)
-sys.setdefaultencoding('utf-8')
+# stored in StringIO.StringIO, the default encoding must be utf-8; this is 
+# set when the music21 package is imported, in music21/__init__.py
 
 import os, copy
 import unittest, doctest
@@ -2947,9 +2944,12 @@ class SystemMargins(MusicXMLElement):
 #-------------------------------------------------------------------------------
 #-------------------------------------------------------------------------------
 class Handler(xml.sax.ContentHandler):
-    '''The SAX handler reads the MusicXML file and builds a corresponding MusicXMLElement object structure.'''
+    '''The SAX handler reads the MusicXML file and builds a corresponding MusicXMLElement object structure.
+
+    If `parts` is provided, it is a list of part ids, part names, or integer part indices (counting from zero in the order of the part-list); only these parts are loaded. If `measures` is provided, it is a pair of start and end measure numbers (inclusive); measures outside this range are skipped at the SAX event level, though attributes (divisions, key, time, clef) found in skipped measures are carried forward into the first loaded measure of each part.
+    '''
    
-    def __init__(self, tagLib=None):
+    def __init__(self, tagLib=None, parts=None, measures=None):
         if tagLib == None:
             self.t = TagLib()
         else:
@@ -2979,6 +2979,21 @@ class Handler(xml.sax.ContentHandler):
         self._divisionsLast = None
         self._timeObjLast = None
 
+        # selective loading: parts and measure ranges to keep
+        self._partsKeep = parts
+        self._partIdsKeep = [] # ids of score-parts found to match
+        self._scorePartCount = 0 # index of score-parts in the part-list
+        self._measuresKeep = measures
+        # count of open, skipped elements; when greater than zero, all
+        # events are ignored
+        self._skipDepth = 0
+        # True when in a measure before the requested range; only
+        # attributes are read from such measures
+        self._measureSkipped = False
+        self._measureCount = 0 # ordinal measure index w/n the current part
+        # attributes accumulated from skipped measures
+        self._attributesCarry = None
+
     def setDocumentLocator(self, locator):
         '''A locator object can be used to get line numbers from the XML document.'''
         self._locator = locator
@@ -2999,6 +3014,89 @@ class Handler(xml.sax.ContentHandler):
         return ''.join(msg)
 
 
+    #---------------------------------------------------------------------------
+    # selective loading
+
+    def _isPartKept(self, partId):
+        '''Return True if a part, given by the id of its score-part, is to be loaded.
+        '''
+        if self._partsKeep is None:
+            return True
+        return partId in self._partIdsKeep
+
+    def _scorePartMatches(self, mxScorePart, index):
+        '''Return True if a ScorePart object, found at `index` in the part-list, matches any of the requested parts.
+        '''
+        for p in self._partsKeep:
+            if common.isNum(p):
+                if p == index:
+                    return True
+            elif p == mxScorePart.get('id'):
+                return True
+            elif (mxScorePart.get('partName') is not None and 
+                p.lower() == mxScorePart.get('partName').lower()):
+                return True
+        return False
+
+    def _measurePosition(self, number):
+        '''Given the number attribute of a measure, return -1 if this measure comes before the requested range, 0 if it is within the range, and 1 if it comes after the range. 
+
+        Measure numbers that cannot be read as integers use the ordinal position of the measure in the part, counting from 1.
+
+        >>> from music21 import *
+        >>> h = musicxml.Handler(measures=(3, 4))
+        >>> h._measurePosition('2'), h._measurePosition('3'), h._measurePosition('4a'), h._measurePosition('5')
+        (-1, 0, 0, 1)
+        '''
+        if self._measuresKeep is None:
+            return 0
+        start, end = self._measuresKeep
+        numStr, junk = common.getNumFromStr(number or '')
+        if numStr != '':
+            n = int(numStr)
+        else:
+            n = self._measureCount
+        if start is not None and n < start:
+            return -1
+        elif end is not None and n > end:
+            return 1
+        return 0
+
+    def _updateAttributesCarry(self, mxAttributes):
+        '''Update the attributes carried forward from skipped measures with the values of a newly found Attributes object; later values replace earlier ones, with clefs replaced by staff number.
+        '''
+        if self._attributesCarry is None:
+            self._attributesCarry = Attributes()
+        carry = self._attributesCarry
+        if mxAttributes.divisions is not None:
+            carry.divisions = mxAttributes.divisions
+        if mxAttributes.staves is not None:
+            carry.staves = mxAttributes.staves
+        if mxAttributes.keyList != []:
+            carry.keyList = mxAttributes.keyList
+        if mxAttributes.timeList != []:
+            carry.timeList = mxAttributes.timeList
+        if mxAttributes.transposeObj is not None:
+            carry.transposeObj = mxAttributes.transposeObj
+        for mxClef in mxAttributes.clefList:
+            clefList = []
+            for mxClefCarry in carry.clefList:
+                if mxClefCarry.get('number') != mxClef.get('number'):
+                    clefList.append(mxClefCarry)
+            clefList.append(mxClef)
+            carry.clefList = clefList
+
+    def _applyAttributesCarry(self, mxMeasure):
+        '''Place carried-forward attributes into the first loaded measure of a part, letting the measure's own attributes take precedence.
+        '''
+        for mxAttributes in mxMeasure._attributesObjList:
+            self._updateAttributesCarry(mxAttributes)
+        mxMeasure._attributesObjList = [self._attributesCarry]
+        mxMeasure.attributesObj = self._attributesCarry
+        mxMeasure.external['attributes'] = self._attributesCarry
+        self._attributesCarry = None
+
+
     def characters(self, charData):
         '''Because each _Handler sub-class defines its own _tags, 
         and because each Tag knows whether it is to receive character data or not, 
@@ -3016,6 +3114,8 @@ class Handler(xml.sax.ContentHandler):
         # Note: must manually pass char data from the Tag to the object in the
         # handler. see 'words' for an example
         #environLocal.printDebug(['got charData', repr(charData), self._currentTag.tag])
+        if self._skipDepth > 0:
+            return
         if self._currentTag.status:
             self.t[self._currentTag.tag].charData += charData
             #environLocal.printDebug(['added charData', self._currentTag.tag])
@@ -3028,6 +3128,30 @@ class Handler(xml.sax.ContentHandler):
         '''
         #environLocal.printDebug([self._debugTagStr('start', name, attrs)])
 
+        # when selectively loading, skip entire subtrees of unneeded elements
+        if self._skipDepth > 0:
+            self._skipDepth += 1
+            return
+        if self._partsKeep is not None or self._measuresKeep is not None:
+            if name == 'part':
+                self._measureCount = 0
+                self._attributesCarry = None
+                if not self._isPartKept(attrs.get('id')):
+                    self._skipDepth = 1
+                    return
+            elif name == 'measure':
+                self._measureCount += 1
+                position = self._measurePosition(attrs.get('number'))
+                if position > 0:
+                    self._skipDepth = 1
+                    return
+                self._measureSkipped = (position < 0)
+            # in measures before the range, only read attributes
+            elif (self._measureSkipped and name != 'attributes' and 
+                not self.t['attributes'].status):
+                self._skipDepth = 1
+                return
+
         #if name in self.t.tagsAll:
         try:
             self._currentTag = self.t[name]
@@ -3096,6 +3220,10 @@ class Handler(xml.sax.ContentHandler):
         '''
         #environLocal.printDebug([self._debugTagStr('end', name)])
 
+        if self._skipDepth > 0:
+            self._skipDepth -= 1
+            return
+
         # do not reset self._currentTag; set in startElement
         try: # just test to return if not handling
             self.t[name]
@@ -3155,10 +3283,18 @@ class Handler(xml.sax.ContentHandler):
             self._mxObjs['note'].restObj = self._mxObjs['rest']
 
         elif name == 'measure': # in endElement
-            # measures need to be stored in order; numbers may have odd values
-            # update note start times w/ measure utility method
-            self._mxObjs['measure'].update()
-            self._mxObjs['part'].componentList.append(self._mxObjs['measure'])
+            if self._measureSkipped:
+                # only keep attributes found in measures before the range
+                for mxAttributes in self._mxObjs['measure']._attributesObjList:
+                    self._updateAttributesCarry(mxAttributes)
+                self._measureSkipped = False
+            else:
+                if self._attributesCarry is not None:
+                    self._applyAttributesCarry(self._mxObjs['measure'])
+                # measures need to be stored in order; numbers may have odd values
+                # update note start times w/ measure utility method
+                self._mxObjs['measure'].update()
+                self._mxObjs['part'].componentList.append(self._mxObjs['measure'])
 
         elif name == 'slur': 
             self._mxObjs['notations'].componentList.append(self._mxObjs['slur'])
@@ -3644,8 +3780,16 @@ class Handler(xml.sax.ContentHandler):
             self._mxObjs['score-instrument'].instrumentAbbreviation = self._currentTag.charData
 
         elif name == 'score-part':
-            self._mxObjs['part-list'].componentList.append(
-                self._mxObjs['score-part'])
+            if self._partsKeep is None:
+                self._mxObjs['part-list'].componentList.append(
+                    self._mxObjs['score-part'])
+            else:
+                if self._scorePartMatches(self._mxObjs['score-part'], 
+                    self._scorePartCount):
+                    self._partIdsKeep.append(self._mxObjs['score-part'].get('id'))
+                    self._mxObjs['part-list'].componentList.append(
+                        self._mxObjs['score-part'])
+                self._scorePartCount += 1
 
         elif name == 'part-name':
             # copy completed character data and clear
@@ -3808,6 +3952,169 @@ class Handler(xml.sax.ContentHandler):
 
 
 
+#-------------------------------------------------------------------------------
+# pitch classes of step names, for finding the span of pitches
+_STEP_PITCH_CLASSES = {'C': 0, 'D': 2, 'E': 4, 'F': 5, 'G': 7, 'A': 9, 'B': 11}
+
+class SummaryHandler(Handler):
+    '''A SAX handler that builds MusicXMLElement objects only for the score header (work, identification, and part-list), skipping all parts; from the parts it gathers summary values in the `summary` dictionary instead:
+
+    `timeSignatureFirst` and `keySignatureFirst`: the first time (beats, beat-type) and key (fifths, mode) found, or None; `noteCount`: the count of notes, rests, chords, and chord symbols; `quarterLength`: the latest end of a note or rest in any part; `pitchLowest` and `pitchHighest`: (step, alter, octave) tuples, or None.
+
+    Measures are placed as when translating a Part: incomplete measures, other than the first, are given the duration of the time signature, and empty measures are counted as holding a rest.
+
+    >>> from music21 import *
+    >>> from music21.musicxml import testPrimitive
+    >>> d = musicxml.Document()
+    >>> summary = d.readSummary(testPrimitive.pitches01a)
+    >>> summary['noteCount'], summary['quarterLength']
+    (102, 102.0)
+    >>> summary['pitchLowest'], summary['pitchHighest']
+    ((u'G', -1.0, 2), (u'C', 1.0, 7))
+    '''
+    def __init__(self, tagLib=None):
+        # an empty list of parts loads only the score header
+        Handler.__init__(self, tagLib, parts=[])
+        self.summary = {'timeSignatureFirst': None, 'keySignatureFirst': None,
+                        'noteCount': 0, 'quarterLength': 0.0, 
+                        'pitchLowest': None, 'pitchHighest': None}
+        self._summaryTags = [] # names of open elements within parts
+        self._summaryText = ''
+        self._inPart = False
+        self._divisions = 1.0
+        self._barDuration = 4.0
+        self._measureOffset = 0.0 # in quarter lengths
+        self._measureNoteCount = 0
+        self._measureHighest = 0.0
+        self._position = 0.0 # in quarter lengths, within the measure
+        self._noteValues = {}
+        self._timeValues = {}
+        self._keyValues = {}
+        self._lowestPs = None
+        self._highestPs = None
+
+    def _notePitch(self):
+        values = self._noteValues
+        if 'step' not in values or 'octave' not in values:
+            return
+        step = values['step'].strip().upper()
+        alter = float(values.get('alter', '0').strip() or 0)
+        octave = int(values['octave'].strip())
+        ps = (octave + 1) * 12 + _STEP_PITCH_CLASSES.get(step, 0) + alter
+        if self._lowestPs is None or ps < self._lowestPs:
+            self._lowestPs = ps
+            self.summary['pitchLowest'] = (step, alter, octave)
+        if self._highestPs is None or ps > self._highestPs:
+            self._highestPs = ps
+            self.summary['pitchHighest'] = (step, alter, octave)
+
+    def _advance(self, duration, isNote=True):
+        self._position += float(duration.strip()) / self._divisions
+        # only the end of a note or rest extends the measure
+        if isNote and self._position > self._measureHighest:
+            self._measureHighest = self._position
+
+    def _endMeasure(self):
+        highest = self._measureHighest
+        if highest >= self._barDuration:
+            shift = highest
+        elif highest == 0.0 and self._measureNoteCount == 0:
+            # an empty measure is given a rest
+            self.summary['noteCount'] += 1
+            shift = highest = self._barDuration
+        elif self._measureOffset == 0.0: # a pickup
+            shift = highest
+        else:
+            shift = self._barDuration
+        end = self._measureOffset + highest
+        if end > self.summary['quarterLength']:
+            self.summary['quarterLength'] = end
+        self._measureOffset += shift
+
+    def characters(self, charData):
+        if self._inPart:
+            self._summaryText += charData
+        Handler.characters(self, charData)
+
+    def startElement(self, name, attrs):
+        if name == 'part':
+            self._inPart = True
+            self._divisions = 1.0
+            self._barDuration = 4.0
+            self._measureOffset = 0.0
+        elif self._inPart:
+            self._summaryTags.append(name)
+            self._summaryText = ''
+            if name == 'measure':
+                self._position = 0.0
+                self._measureHighest = 0.0
+                self._measureNoteCount = 0
+            elif name == 'note':
+                self._noteValues = {}
+            elif name == 'time':
+                self._timeValues = {}
+            elif name == 'key':
+                self._keyValues = {}
+        Handler.startElement(self, name, attrs)
+
+    def endElement(self, name):
+        if name == 'part':
+            self._inPart = False
+        elif self._inPart:
+            self._summaryTags.pop()
+            parent = None
+            if len(self._summaryTags) > 0:
+                parent = self._summaryTags[-1]
+            text = self._summaryText
+            self._summaryText = ''
+
+            if parent == 'note' or parent == 'pitch':
+                if name in ['chord', 'grace', 'rest']:
+                    self._noteValues[name] = True
+                else:
+                    self._noteValues[name] = text
+            elif name == 'note':
+                values = self._noteValues
+                self._notePitch()
+                if 'chord' not in values:
+                    self.summary['noteCount'] += 1
+                    self._measureNoteCount += 1
+                    if 'duration' in values and 'grace' not in values:
+                        self._advance(values['duration'])
+            elif name == 'harmony': # a chord symbol
+                self.summary['noteCount'] += 1
+                self._measureNoteCount += 1
+            elif name == 'measure':
+                self._endMeasure()
+            elif name == 'duration' and parent == 'backup':
+                self._position -= float(text.strip()) / self._divisions
+            elif name == 'duration' and parent == 'forward':
+                self._advance(text, isNote=False)
+            elif name == 'divisions':
+                self._divisions = float(text.strip())
+            elif parent == 'time':
+                self._timeValues[name] = text.strip()
+            elif parent == 'key':
+                self._keyValues[name] = text.strip()
+            elif name == 'time' and 'beats' in self._timeValues:
+                beats = self._timeValues['beats']
+                beatType = self._timeValues.get('beat-type', '4')
+                try:
+                    self._barDuration = (sum([int(b) for b in 
+                        beats.split('+')]) * 4.0 / int(beatType))
+                except ValueError:
+                    pass
+                if self.summary['timeSignatureFirst'] is None:
+                    self.summary['timeSignatureFirst'] = (beats, beatType)
+            elif (name == 'key' and self.summary['keySignatureFirst'] is None
+                and 'fifths' in self._keyValues):
+                self.summary['keySignatureFirst'] = (
+                    int(self._keyValues['fifths']), 
+                    self._keyValues.get('mode', None))
+        Handler.endElement(self, name)
+
+
+
 #-------------------------------------------------------------------------------
 class Document(object):
     '''Represent a MusicXML document, 
@@ -3828,17 +4135,23 @@ class Document(object):
         saxparser.setFeature(xml.sax.handler.feature_namespaces, 0)   
         return saxparser
 
-    def _load(self, fileLike, file=True, audit=False):
+    def _load(self, fileLike, file=True, audit=False, parts=None, 
+        measures=None, handler=None):
         saxparser = self._getParser()
         #t = common.Timer()
         #t.start()
         # call the handler with tagLib
-        h = Handler(self.tagLib) 
+        if handler is None:
+            h = Handler(self.tagLib, parts=parts, measures=measures) 
+        else:
+            h = handler
         saxparser.setContentHandler(h)
 
         if not file:
             # StringIO.StringIO is supposed to handle unicode
             fileLikeOpen = StringIO.StringIO(fileLike)
+        elif hasattr(fileLike, 'read'): # an already open file-like object
+            fileLikeOpen = fileLike
 
         else: # TODO: should this be codecs.open()?
             fileLikeOpen = open(fileLike)
@@ -3867,13 +4180,40 @@ class Document(object):
             self.tagLib.statClear()
 
 
-    def read(self, xmlString, audit=False):
+    def read(self, xmlString, audit=False, parts=None, measures=None):
         '''Load MusicXML from a string, instead of from a file.
+
+        The `parts` and `measures` arguments permit loading only an excerpt; see :class:`~music21.musicxml.base.Handler`.
+
+        >>> from music21 import *
+        >>> from music21.musicxml import testPrimitive
+        >>> d = musicxml.Document()
+        >>> d.read(testPrimitive.clefs12a, measures=(3, 4))
+        >>> [m.get('number') for m in d.score.componentList[0]]
+        [u'3', u'4']
+
+        Attributes from skipped measures are carried forward:
+
+        >>> d.score.componentList[0][0].attributesObj.divisions
+        u'1'
+        
         '''
-        self._load(xmlString, False, audit)
+        self._load(xmlString, False, audit, parts=parts, measures=measures)
+
+    def open(self, fp, audit=False, parts=None, measures=None):
+        self._load(fp, True, audit, parts=parts, measures=measures)
 
-    def open(self, fp, audit=False):
-        self._load(fp, True, audit)
+    def readSummary(self, fileLike, file=False):
+        '''Load only the score header of MusicXML data, given as a string or, if `file` is True, as a file path or open file-like object, and return a dictionary of summary values gathered from the parts; see :class:`~music21.musicxml.base.SummaryHandler`. The score header is stored as usual in `score`, though the score has no parts.
+        '''
+        h = SummaryHandler(self.tagLib)
+        self._load(fileLike, file, handler=h)
+        return h.summary
+
+    def readFile(self, fileLike, audit=False, parts=None, measures=None):
+        '''Load MusicXML from an open file-like object, such as a member of a zip archive, reading it incrementally. The object is closed when parsing is complete.
+        '''
+        self._load(fileLike, True, audit, parts=parts, measures=measures)
 
     #---------------------------------------------------------------------------        
     # convenience routines to get meta-data
@@ -15,6 +15,7 @@
 
 import unittest
 import copy
+import multiprocessing
 
 import music21
 from music21 import musicxml as musicxmlMod
@@ -3450,8 +3451,33 @@ def measureToMusicXML(m):
 # Streams
 
 
+def _measureStreamToMxMeasures(part, measureStream, instStream, 
+    spannerBundle):
+    '''Generator of musicxml Measure objects for each Measure in `measureStream`, translated only as requested.
+    '''
+    # for each measure, call .mx to get the musicxml representation
+    for obj in measureStream:
+        # get instrument for every measure position
+        moStart = obj.getOffsetBySite(measureStream)
+        instSubStream = instStream.getElementsByOffset(moStart, 
+                         moStart+obj.duration.quarterLength, 
+                         includeEndBoundary=False)
+        mxTranspose = None   
+        if len(instSubStream) > 0:
+            instSubObj = instSubStream[0]
+            if part.atSoundingPitch in [False]:
+                # if not at sounding pitch, encode transposition from instrument
+                if instSubObj.transposition is not None:
+                    mxTranspose = intervalToMXTranspose(
+                                    instSubObj.transposition)
+                    #raise TranslateException('cannot get transposition for a part that is not at sounding pitch.')
+        yield measureToMx(obj, spannerBundle=spannerBundle, 
+                 mxTranspose=mxTranspose)
+
+
 def streamPartToMx(part, instStream=None, meterStream=None,
-                   refStreamOrTimeRange=None, spannerBundle=None):
+                   refStreamOrTimeRange=None, spannerBundle=None, 
+                   lazyMeasures=False, setIdLocals=True):
     '''
     If there are Measures within this stream, use them to create and
     return an MX Part and ScorePart. 
@@ -3460,6 +3486,10 @@ def streamPartToMx(part, instStream=None, meterStream=None,
     from this Stream in order to configure id and midi-channel values. 
 
     The `meterStream`, if given, provides a template of meters. 
+
+    If `lazyMeasures` is True, the components of the returned MX Part are a generator that translates each Measure only when it is requested; such a Part can be iterated over only once, as when writing with :meth:`~music21.xmlnode.XMLNode.xmlWrite`.
+
+    If `setIdLocals` is False, the id locals of Spanners in the `spannerBundle` are assumed to be already set, and are not renumbered.
     '''
     from music21 import spanner
     from music21 import stream
@@ -3542,33 +3572,97 @@ def streamPartToMx(part, instStream=None, meterStream=None,
             spannerBundle = spanner.SpannerBundle(measureStream.flat)
 
     # make sure that all instances of the same class have unique ids
-    spannerBundle.setIdLocals()
+    if setIdLocals:
+        spannerBundle.setIdLocals()
 
-    # for each measure, call .mx to get the musicxml representation
-    for obj in measureStream:
-        # get instrument for every measure position
-        moStart = obj.getOffsetBySite(measureStream)
-        instSubStream = instStream.getElementsByOffset(moStart, 
-                         moStart+obj.duration.quarterLength, 
-                         includeEndBoundary=False)
-        mxTranspose = None   
-        if len(instSubStream) > 0:
-            instSubObj = instSubStream[0]
-            if part.atSoundingPitch in [False]:
-                # if not at sounding pitch, encode transposition from instrument
-                if instSubObj.transposition is not None:
-                    mxTranspose = intervalToMXTranspose(
-                                    instSubObj.transposition)
-                    #raise TranslateException('cannot get transposition for a part that is not at sounding pitch.')
-        mxPart.append(measureToMx(obj, spannerBundle=spannerBundle, 
-                 mxTranspose=mxTranspose))
+    mxMeasures = _measureStreamToMxMeasures(part, measureStream, instStream,
+                 spannerBundle)
+    if lazyMeasures:
+        mxPart.componentList = mxMeasures
+    else:
+        for mxMeasure in mxMeasures:
+            mxPart.append(mxMeasure)
     # might to post processing after adding all measures to the Stream
     # TODO: need to find all MetricModulations and updateByContext
     # mxScorePart contains mxInstrument
     return mxScorePart, mxPart
 
 
-def streamToMx(s, spannerBundle=None):
+def _streamPartToMxWorker(args):
+    '''Translate one serialized part into an mxScorePart and an mxPart; called in a worker process by :func:`~music21.musicxml.translate.streamToMx`.
+    '''
+    from music21 import converter
+    from music21 import spanner
+
+    containerData, refStreamOrTimeRange = args
+    container = converter.unfreezeStr(containerData)
+    part = container.getElementById('part')
+    instStream = container.getElementById('instStream')
+    meterStream = container.getElementById('meterStream')
+    # the container holds the part and any score-level spanners of the part
+    spannerBundle = spanner.SpannerBundle(part.flat)
+    for sp in container.getElementsByClass('Spanner'):
+        spannerBundle.append(sp)
+    # cached component ids refer to objects in the parent process
+    for sp in spannerBundle:
+        sp._cache = {}
+    # id locals were set for the complete score before serialization
+    return streamPartToMx(part, instStream=instStream, 
+                        meterStream=meterStream, 
+                        refStreamOrTimeRange=refStreamOrTimeRange, 
+                        spannerBundle=spannerBundle, setIdLocals=False)
+
+
+def _streamPartsToMxParallel(partJobs, meterStream, refStreamOrTimeRange, 
+    spannerBundle, processes):
+    '''Given a list of (part, instStream) pairs, translate each part in a pool of `processes` worker processes, returning a list of (mxScorePart, mxPart) pairs in the same order. 
+
+    Each part is serialized with copies of its instruments and of the `meterStream`, and with those score-level Spanners that refer to its elements.
+    '''
+    from music21 import converter
+    from music21 import stream
+
+    # set id locals once for the complete score, as done in each call 
+    # to streamPartToMx() when translating sequentially
+    spannerBundle.setIdLocals()
+
+    jobs = []
+    for part, instStream in partJobs:
+        container = stream.Stream()
+        # parts are identified by id in the worker; restore after freezing
+        partIdOriginal = part.id
+        part.id = 'part'
+        container.insert(0, part)
+        for streamId, src in [('instStream', instStream), 
+                              ('meterStream', meterStream)]:
+            dst = stream.Stream()
+            dst.id = streamId
+            for e in src:
+                dst.insert(e.getOffsetBySite(src), copy.deepcopy(e))
+            container.insert(0, dst)
+
+        flatIds = set([id(e) for e in part.flat])
+        for sp in spannerBundle:
+            # spanners in the part are serialized with the part
+            if id(sp) in flatIds:
+                continue
+            for c in sp.getComponents():
+                if id(c) in flatIds:
+                    container.insert(0, sp)
+                    break
+        jobs.append((converter.freezeStr(container), refStreamOrTimeRange))
+        part.id = partIdOriginal
+
+    pool = multiprocessing.Pool(processes=processes)
+    try:
+        post = pool.map(_streamPartToMxWorker, jobs)
+    finally:
+        pool.close()
+        pool.join()
+    return post
+
+
+def streamToMx(s, spannerBundle=None, lazyMeasures=False, processes=None):
     '''
     Create and return a musicxml Score object from a Stream or Score
 
@@ -3576,6 +3670,15 @@ def streamToMx(s, spannerBundle=None):
     conversion of a Stream to MusicXML. This method is 
     called on Stream from the musicxml property. 
 
+    If `lazyMeasures` is True, Measures are translated only when the 
+    returned Score is written; see :func:`~music21.musicxml.translate.streamToMusicXMLFile`.
+
+    If `processes` is greater than 1, the parts of a multi-part Stream are 
+    translated in parallel in a pool of worker processes. Parts are 
+    serialized to and from the workers; the Stream is not altered by 
+    translation in this mode. `lazyMeasures` is ignored when translating 
+    in parallel.
+
 
     >>> from music21 import *
     >>> n1 = note.Note()
@@ -3601,7 +3704,8 @@ def streamToMx(s, spannerBundle=None):
         md = metadata.Metadata(title='This Page Intentionally Left Blank')
         out.insert(0, md)
         # recursive call to this non-empty stream
-        return streamToMx(out)
+        return streamToMx(out, lazyMeasures=lazyMeasures, 
+                          processes=processes)
 
     #environLocal.printDebug('calling Stream._getMX')
     # stores pairs of mxScorePart and mxScore
@@ -3651,6 +3755,9 @@ def streamToMx(s, spannerBundle=None):
 
         count = 0
         midiChannelList = []
+        partJobs = [] # store parts and instruments for parallel translation
+        parallel = (processes is not None and processes > 1 and 
+                    len(streamOfStreams) > 1)
         for obj in streamOfStreams:
             count += 1
             if count > len(streamOfStreams):
@@ -3674,16 +3781,29 @@ def streamToMx(s, spannerBundle=None):
             # add to list for checking on next round
             instList.append(inst)
 
+            if parallel:
+                # part ids must be unique before parts are separated
+                if inst.partId == None:
+                    inst.partIdRandomize()
+                partJobs.append((obj, instStream))
+                continue
             # force this instrument into this part
             # meterStream is only used here if there are no measures
             # defined in this part
             mxScorePart, mxPart = streamPartToMx(obj, instStream=instStream, 
                         meterStream=meterStream, 
                         refStreamOrTimeRange=refStreamOrTimeRange, 
-                        spannerBundle=spannerBundle)
+                        spannerBundle=spannerBundle, 
+                        lazyMeasures=lazyMeasures)
             mxComponents.append([mxScorePart, mxPart, obj])
             #mxComponents.append(obj._getMXPart(inst, meterStream, refStreamOrTimeRange))
 
+        if parallel:
+            post = _streamPartsToMxParallel(partJobs, meterStream, 
+                   refStreamOrTimeRange, spannerBundle, processes)
+            for i, (mxScorePart, mxPart) in enumerate(post):
+                mxComponents.append([mxScorePart, mxPart, partJobs[i][0]])
+
     else: # assume this is the only part
         #environLocal.printDebug('Stream._getMX(): handling single-part Stream')
         # if no instrument is provided it will be obtained through s
@@ -3696,7 +3816,8 @@ def streamToMx(s, spannerBundle=None):
             spannerBundle = s.spannerBundle
             #environLocal.printDebug(['streamToMx(): loaded spannerBundle of size:', len(spannerBundle), 'id(spannerBundle)', id(spannerBundle)])
         mxScorePart, mxPart = streamPartToMx(s, meterStream=meterStream, 
-                              spannerBundle=spannerBundle)
+                              spannerBundle=spannerBundle,
+                              lazyMeasures=lazyMeasures)
         mxComponents.append([mxScorePart, mxPart, s])
         #environLocal.pd(['mxComponents', mxComponents])
 
@@ -3763,6 +3884,28 @@ def streamToMx(s, spannerBundle=None):
     mxScore.set('partList', mxPartList)
     return mxScore
 
+
+def streamToMusicXMLFile(s, fileLike):
+    '''Write a complete MusicXML representation of a Stream or Score to an open file-like object. 
+
+    Unlike the `musicxml` property of Stream, no DOM or complete output string is built: each Measure is translated as it is written, and can then be discarded. The output is identical to that of the `musicxml` property.
+
+    As with the `musicxml` property, the Stream may be altered in translation; pass a copy if the Stream needs to be preserved.
+
+    >>> from music21 import *
+    >>> import StringIO
+    >>> s = stream.Stream()
+    >>> s.repeatAppend(note.Note('g4'), 8)
+    >>> fileLike = StringIO.StringIO()
+    >>> musicxml.translate.streamToMusicXMLFile(copy.deepcopy(s), fileLike)
+    >>> fileLike.getvalue().splitlines()[-3:]
+    ['    </measure>', '  </part>', '</score-partwise>']
+    >>> len(fileLike.getvalue()) == len(s.musicxml) # ids are random
+    True
+    '''
+    mxScore = streamToMx(s, lazyMeasures=True)
+    mxScore.xmlWrite(fileLike)
+
 def _getUniqueStaffKeys(staffReferenceList):
     '''Given a list of staffReference dictionaries, collect and return a list of all unique keys except None
     '''
@@ -4000,10 +4143,142 @@ def mxToStreamPart(mxScore, partId, spannerBundle=None, inputM21=None):
     else:
         return streamPart
 
-def mxToStream(mxScore, spannerBundle=None, inputM21=None):
+def _mxToStreamPartWorker(args):
+    '''Translate one part of an mxScore in a worker process, returning a serialized Score that contains the translated Part (or PartStaffs). Spanners left incomplete in this part are stored in the last Part, with a completeStatus of False.
+    '''
+    from music21 import converter
+    from music21 import spanner
+    from music21 import stream
+
+    mxScore, partId = args
+    spannerBundle = spanner.SpannerBundle()
+    s = stream.Score()
+    try:
+        mxToStreamPart(mxScore, partId=partId, 
+                       spannerBundle=spannerBundle, inputM21=s)
+    except TranslateException as strerror:
+        raise TranslateException('cannot translate part %s: %s' % (partId, strerror))
+    # complete spanners have already been inserted into the part; 
+    # incomplete spanners cannot be serialized in the Score
+    part = s.getElementsByClass('Part')[-1]
+    for sp in spannerBundle:
+        part._insertCore(0, sp)
+    part._elementsChanged()
+    return converter.freezeStr(s)
+
+
+# classes of spanners that, when translated sequentially, are continued 
+# across parts: an open spanner receives the notes of the next spanner of
+# the same class and number in the next part
+_CROSS_PART_SPANNER_CLASSES = ['Slur', 'TrillExtension', 'Tremolo', 
+    'Glissando']
+
+def _getCrossPartSpannerKey(sp):
+    for className in _CROSS_PART_SPANNER_CLASSES:
+        if className in sp.classes:
+            return (className, sp.idLocal)
+    return None
+
+def _mergeCrossPartSpanners(openSpanners, parts, incomplete, spannerBundle):
+    '''Merge spanners left open by earlier parts with the spanners translated in a worker process for the next part, as :func:`~music21.musicxml.translate.mxToStream` does when translating parts sequentially with one spanner bundle.
+
+    `openSpanners` is a dictionary of (class name, number) and the open spanner of earlier parts, `parts` the Parts (or PartStaffs) of the next part, which contain its complete spanners, and `incomplete` a list of its incomplete spanners. For each open spanner, the first spanner of the same class and number in the next part (by the position of its first note) is merged into it: its notes are added to the open spanner, and its complete status is taken. A merged spanner that is complete is moved from `spannerBundle` into the Part, as it would have been completed there. `openSpanners` and `incomplete` are updated.
+    '''
+    # the position of each note, in order of translation
+    positions = {}
+    for i, p in enumerate(parts):
+        for j, n in enumerate(p.flat.notesAndRests):
+            positions[id(n)] = (i, j)
+    candidates = [(sp, None) for sp in incomplete]
+    for p in parts:
+        candidates += [(sp, p) for sp in p.getElementsByClass('Spanner')]
+
+    first = {}
+    for sp, container in candidates:
+        key = _getCrossPartSpannerKey(sp)
+        if key is None or key not in openSpanners:
+            continue
+        position = min([positions.get(id(c), (len(parts), 0)) 
+                        for c in sp.getComponents()] + [(len(parts), 0)])
+        if key not in first or position < first[key][0]:
+            first[key] = (position, sp, container)
+
+    for key in first.keys():
+        position, sp, container = first[key]
+        spOpen = openSpanners.pop(key)
+        spOpen.addComponents(sp.getComponents())
+        spOpen.completeStatus = sp.completeStatus
+        if container is None:
+            incomplete.remove(sp)
+        else:
+            container.remove(sp)
+        if spOpen.completeStatus:
+            spannerBundle.remove(spOpen)
+            if container is None:
+                container = parts[-1]
+            container._insertCore(0, spOpen)
+            container._elementsChanged()
+        else:
+            openSpanners[key] = spOpen
+
+    for sp in incomplete:
+        key = _getCrossPartSpannerKey(sp)
+        if key is not None and key not in openSpanners:
+            openSpanners[key] = sp
+
+
+def _mxToStreamPartsParallel(mxScore, partIds, spannerBundle, inputM21, 
+    processes):
+    '''Translate the parts of an mxScore, given by `partIds`, in a pool of `processes` worker processes. Translated parts are inserted into `inputM21` in the order of `partIds`, and spanners left incomplete in any part are gathered into `spannerBundle`. 
+
+    Slurs, trill extensions, tremolos, and glissandi left open in a part are then merged with those of the next part with :func:`~music21.musicxml.translate._mergeCrossPartSpanners`, giving the spanners of sequential translation. Other spanners, such as wedges and brackets, are completed only within their part: in sequential translation, a stop in a later part could complete one left open in an earlier part, and a wedge or bracket that ends after the last note of a part takes the first note of the next part as its last component; here, it keeps only the notes of its own part.
+
+    Returns a dictionary of part id and the last Part created for that id.
+    '''
+    from music21 import converter
+
+    jobs = []
+    for partId in partIds:
+        # only send the part-list and the needed part to each worker
+        mxScorePart = musicxmlMod.Score()
+        mxScorePart.partListObj = mxScore.partListObj
+        mxScorePart.componentList = [mxScore.getPart(partId)]
+        jobs.append((mxScorePart, partId))
+
+    pool = multiprocessing.Pool(processes=processes)
+    try:
+        post = pool.map(_mxToStreamPartWorker, jobs)
+    finally:
+        pool.close()
+        pool.join()
+
+    partDictionary = {}
+    openSpanners = {}
+    for partId, data in zip(partIds, post):
+        sPart = converter.unfreezeStr(data)
+        parts = sPart.getElementsByClass('Part')
+        for p in parts:
+            inputM21._insertCore(0, p)
+        partDictionary[partId] = parts[-1]
+        incomplete = []
+        for p in parts:
+            for sp in p.getElementsByClass('Spanner'):
+                if not sp.completeStatus:
+                    p.remove(sp)
+                    incomplete.append(sp)
+        _mergeCrossPartSpanners(openSpanners, parts, incomplete, 
+            spannerBundle)
+        for sp in incomplete:
+            spannerBundle.append(sp)
+    return partDictionary
+
+
+def mxToStream(mxScore, spannerBundle=None, inputM21=None, processes=None):
     '''Translate an mxScore into a music21 Score object.
 
     All spannerBundles accumulated at all lower levels are inserted here.
+
+    If `processes` is greater than 1, parts are translated in parallel in a pool of worker processes, and then merged into the Score.
     '''
     # TODO: may not want to wait to this leve to insert spanners; may want to 
     # insert in lower positions if it makes sense
@@ -4025,16 +4300,20 @@ def mxToStream(mxScore, spannerBundle=None, inputM21=None):
     # values are part names
     partNameIds = partIdDictionary.keys()
     partNameIds.sort()
-    for partId in partNameIds: # part names are part ids
-        # NOTE: setting partId not partId: might change
-        # return the part; however, it is still already attached to the Score
-        try:
-            part = mxToStreamPart(mxScore, partId=partId, 
+    if processes is not None and processes > 1 and len(partNameIds) > 1:
+        partIdDictionary.update(_mxToStreamPartsParallel(mxScore, 
+            partNameIds, spannerBundle, s, processes))
+    else:
+        for partId in partNameIds: # part names are part ids
+            # NOTE: setting partId not partId: might change
+            # return the part; however, it is still already attached to the Score
+            try:
+                part = mxToStreamPart(mxScore, partId=partId, 
                                   spannerBundle=spannerBundle, inputM21=s)
-        except TranslateException as strerror:
-            raise TranslateException('cannot translate part %s: %s' % (partId, strerror))
-        # update dictionary to store music21 part
-        partIdDictionary[partId] = part
+            except TranslateException as strerror:
+                raise TranslateException('cannot translate part %s: %s' % (partId, strerror))
+            # update dictionary to store music21 part
+            partIdDictionary[partId] = part
 
     # get part/staff groups
     #environLocal.printDebug(['partgroups:', mxScore.getPartGroupData()])
@@ -5419,6 +5698,103 @@ spirit</words>
         #Raising the BarException       
         mxBarline.set('barStyle', 'wunderbar')
         self.assertRaises( bar.BarException, mxToRepeat, mxBarline)
+
+
+    def testStreamToMusicXMLFile(self):
+        import re
+        import StringIO
+        from music21 import corpus, converter
+        from music21.musicxml import testPrimitive
+
+        # part and instrument ids may be random
+        def normalize(xmlStr):
+            return re.sub(r'"[IP][0-9a-f]{32}"', '"ID"', xmlStr)
+
+        for s in [corpus.parse('bach/bwv66.6'), 
+                  converter.parse(testPrimitive.pianoStaff43a),
+                  converter.parse(testPrimitive.spanners33a)]:
+            fileLike = StringIO.StringIO()
+            streamToMusicXMLFile(copy.deepcopy(s), fileLike)
+            self.assertEqual(normalize(fileLike.getvalue()), 
+                             normalize(s.musicxml))
+
+    def testParallelPartTranslation(self):
+        import re
+        from music21 import corpus
+        from music21 import musicxml
+
+        def normalize(xmlStr):
+            return re.sub(r'"[IP][0-9a-f]{32}"', '"ID"', xmlStr)
+
+        s = corpus.parse('bach/bwv66.6')
+        # export
+        xmlStr = streamToMx(copy.deepcopy(s)).xmlStr()
+        xmlStrParallel = streamToMx(copy.deepcopy(s), processes=2).xmlStr()
+        self.assertEqual(normalize(xmlStrParallel), normalize(xmlStr))
+        # import
+        d = musicxml.Document()
+        d.read(xmlStr)
+        post = mxToStream(d.score)
+        d = musicxml.Document()
+        d.read(xmlStr)
+        postParallel = mxToStream(d.score, processes=2)
+        self.assertEqual(len(postParallel.parts), 4)
+        self.assertEqual([p.id for p in postParallel.parts], 
+                         [p.id for p in post.parts])
+        self.assertEqual(normalize(postParallel.musicxml), 
+                         normalize(post.musicxml))
+
+    def testParallelPartTranslationSpanners(self):
+        from music21 import converter, corpus
+        from music21 import musicxml
+
+        def getSpanners(s):
+            post = []
+            for p in s.parts:
+                for sp in p.flat.getElementsByClass('Spanner'):
+                    post.append((p.id, sp.classes[0], sp.completeStatus, 
+                        [(c.measureNumber, c.offset, str(c)) for c in 
+                        sp.getComponents()]))
+            return sorted(post)
+
+        def getPart(partId, notes):
+            msg = []
+            for step, slurs in notes:
+                msg.append('<note><pitch><step>%s</step><octave>4</octave></pitch><duration>1</duration><type>quarter</type><notations>%s</notations></note>' % (step, ''.join(['<slur type="%s" number="%s"/>' % x for x in slurs])))
+            return '<part id="%s"><measure number="1"><attributes><divisions>1</divisions><time><beats>4</beats><beat-type>4</beat-type></time><clef><sign>G</sign><line>2</line></clef></attributes>%s</measure></part>' % (partId, ''.join(msg))
+
+        # slurs left open in one part are continued in the next part
+        xmlStr = ('<?xml version="1.0" encoding="UTF-8"?><score-partwise version="2.0"><part-list><score-part id="P1"><part-name>A</part-name></score-part><score-part id="P2"><part-name>B</part-name></score-part><score-part id="P3"><part-name>C</part-name></score-part></part-list>' + 
+            getPart('P1', [('C', []), ('D', []), ('E', [('start', 1)])]) +
+            getPart('P2', [('C', [('stop', 1)]), ('D', [('start', 1)]), 
+                           ('E', [('stop', 1)]), ('F', [('start', 2)])]) +
+            getPart('P3', [('C', [('stop', 2)]), ('D', [('start', 1)])]) +
+            '</score-partwise>')
+        d = musicxml.Document()
+        d.read(xmlStr)
+        post = mxToStream(d.score)
+        d = musicxml.Document()
+        d.read(xmlStr)
+        postParallel = mxToStream(d.score, processes=2)
+        spanners = getSpanners(post)
+        self.assertEqual(len(spanners), 3)
+        self.assertEqual([x[2] for x in spanners], [True, True, True])
+        self.assertEqual(getSpanners(postParallel), spanners)
+        # the incomplete slur of the last part is in neither Score
+        self.assertEqual(len(postParallel.flat.getElementsByClass('Slur')), 
+                         len(post.flat.getElementsByClass('Slur')))
+
+        fp = corpus.getWork('beethoven/opus59no2/movement3')
+        data = converter.ArchiveManager(fp).getData()
+        d = musicxml.Document()
+        d.read(data)
+        post = mxToStream(d.score)
+        d = musicxml.Document()
+        d.read(data)
+        postParallel = mxToStream(d.score, processes=2)
+        spanners = getSpanners(post)
+        self.assertEqual(len(spanners) > 100, True)
+        self.assertEqual(getSpanners(postParallel), spanners)
         
         
         
@@ -5428,7 +5804,7 @@ spirit</words>
 
 #-------------------------------------------------------------------------------
 # define presented order in documentation
-_DOC_ORDER = [mxToStream, streamToMx]
+_DOC_ORDER = [mxToStream, streamToMx, streamToMusicXMLFile]
 
 if __name__ == "__main__":
     # sys.arg test options will be used in mainTest()
@@ -8094,17 +8094,6 @@ class Stream(music21.Music21Object):
         # this presently is not trying to avoid overlaps that
         # result from quantization; this may be necessary
 
-        def bestMatch(target, divisors):
-            found = []
-            for div in divisors:
-                match, error = common.nearestMultiple(target, (1.0/div))
-                found.append((error, match)) # reverse for sorting
-            # get first, and leave out the error
-            return sorted(found)[0][1]
-
-        # if we have a min of .25 (sixteenth)
-        quarterLengthMin = quarterLengthDivisors[0]
-
         if inPlace is False:
             returnStream = copy.deepcopy(self)
         else:
@@ -8117,18 +8106,22 @@ class Stream(music21.Music21Object):
                     useStreams.append(obj)
                 
         for useStream in useStreams:
-            for e in useStream._elements:
-                if processOffsets:
-                    o = e.getOffsetBySite(useStream)
-                    oNew = bestMatch(o, quarterLengthDivisors)
-                    #oNew = common.nearestMultiple(o, quarterLengthMin)
+            # quantize all values of each Stream together
+            if processOffsets:
+                elements = useStream._elements
+                offsets = common.nearestMultiples(
+                    [e.getOffsetBySite(useStream) for e in elements], 
+                    quarterLengthDivisors)
+                for e, oNew in zip(elements, offsets):
                     e.setOffsetBySite(useStream, oNew)
-                if processDurations:
-                    if e.duration != None:
-                        ql = e.duration.quarterLength
-                        qlNew = bestMatch(ql, quarterLengthDivisors)
-                        #qlNew = common.nearestMultiple(ql, quarterLengthMin)
-                        e.duration.quarterLength = qlNew
+            if processDurations:
+                elements = [e for e in useStream._elements 
+                            if e.duration != None]
+                durations = common.nearestMultiples(
+                    [e.duration.quarterLength for e in elements], 
+                    quarterLengthDivisors)
+                for e, qlNew in zip(elements, durations):
+                    e.duration.quarterLength = qlNew
 
         if inPlace is False:
             return returnStream
@@ -8638,6 +8631,15 @@ class Stream(music21.Music21Object):
         doc = '''Return a complete MusicXML reprsentation as a string. 
         ''')
 
+    def _writeMusicXML(self, fileLike):
+        '''Write a complete MusicXML representation to an open file-like object. Measures are translated and written one at a time; the output is identical to the `musicxml` property.
+        '''
+        # as with the musicxml property, always process a deepcopy
+        post = copy.deepcopy(self)
+        post.makeImmutable()
+        musicxmlTranslate.streamToMusicXMLFile(post, fileLike)
+        del post
+
 
 
     #---------------------------------------------------------------------------
@@ -11584,6 +11586,11 @@ class Measure(Stream):
 
     musicxml = property(_getMusicXML)
 
+    def _writeMusicXML(self, fileLike):
+        '''Write a complete MusicXML representation of the measure to an open file-like object.
+        '''
+        fileLike.write(self.musicxml)
+
    
 class Part(Stream):
     '''A Stream subclass for designating music that is
@@ -16,6 +16,7 @@ This file is not run with the standard test battery presently.
 
 
 import doctest, unittest
+import os
 
 import music21
 from music21 import common, corpus
@@ -191,6 +192,19 @@ class Test(unittest.TestCase):
 
 
 
+    def runTokenizeEssenFolksong(self):
+        '''Tokenizing and processing all essenFolksong abc files
+        '''
+        from music21 import corpus
+        from music21.abc import base as abcBase
+
+        for fp in corpus.getPaths('abc'):
+            if 'essenFolksong' not in fp:
+                continue
+            ah = abcBase.ABCHandler()
+            ah.process(open(fp).read())
+
+
     def runGetElementsByContext(self):
         '''Test getting elements by context from a Stream
         '''
@@ -256,6 +270,27 @@ class Test(unittest.TestCase):
 
 
 
+    def _runColdImport(self, statement):
+        # a new interpreter is needed, as modules are imported only once
+        import subprocess, sys
+        fpRoot = os.path.dirname(os.path.abspath(music21.__path__[0]))
+        proc = subprocess.Popen([sys.executable, '-c', statement], 
+            cwd=fpRoot, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        proc.communicate()
+        self.assertEqual(proc.returncode, 0)
+
+    def runImportMusic21(self):
+        '''Cold start: import music21 in a new interpreter
+        '''
+        self._runColdImport('import music21')
+
+    def runImportNote(self):
+        '''Cold start: from music21 import note in a new interpreter
+        '''
+        self._runColdImport('from music21 import note')
+
+
+
     #---------------------------------------------------------------------------
     def testTimingTolerance(self):
         '''Test the performance of methods defined above, comparing the resulting time to the time obtained in past runs. 
@@ -266,6 +301,23 @@ class Test(unittest.TestCase):
         # provide work and expected min/max in seconds
         for testMethod, best in [
 
+            (self.runImportMusic21, 
+                {
+                 '2026.10.18': 0.836, 
+                 '2026.10.19': 0.071, 
+                }),
+
+            (self.runImportNote, 
+                {
+                 '2026.10.18': 0.834, 
+                 '2026.10.19': 0.208, 
+                }),
+
+            (self.runTokenizeEssenFolksong, 
+                {
+                 '2026.10.18': 8.84, 
+                }),
+
             (self.runGetElementsByPrevious, 
                 {
                  '2011.11.29': 4.69, 
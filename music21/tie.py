@@ -13,7 +13,6 @@
 import unittest, doctest
 
 import music21
-from music21.musicxml import translate as musicxmlTranslate
 
 
 
@@ -60,11 +59,14 @@ class Tie(object):
     def _getMX(self):
         '''Return a MusicXML object representation. 
         '''
+        # imported here, as tie is imported by music21.base
+        from music21.musicxml import translate as musicxmlTranslate
         return musicxmlTranslate.tieToMx(self)
 
     def _setMX(self, mxNote):
         '''Load a MusicXML object representation. 
         '''
+        from music21.musicxml import translate as musicxmlTranslate
         musicxmlTranslate.mxToTie(mxNote, self)
 
     mx = property(_getMX, _setMX)
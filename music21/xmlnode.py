@@ -15,6 +15,7 @@ as object representations.  Used by the musicxml converter, obviously, but
 also by environment.py.
 '''
 
+import codecs
 import copy
 import xml.sax
 from xml.sax import saxutils
@@ -541,6 +542,148 @@ class XMLNode(object):
         return self.toxml(None, None, 1)
 
 
+    #---------------------------------------------------------------------------
+    # streaming output, without a DOM
+
+    def _iterChildNodes(self):
+        '''Yield, in order, the children of this node as they are written by :meth:`~music21.xmlnode.XMLNode.toxml`: a string for character data, an XMLNode for sub nodes, or a (tag, content) pair for simple elements, where content is None for elements without text.
+
+        Components are requested from `_getComponents()` only as they are needed; this permits components to be provided by a generator.
+        '''
+        # if self.charData is defined, this is a text component of this tag
+        if self.charData != None:
+            try:
+                yield str(self.charData)
+            except UnicodeEncodeError:                
+                yield self.charData
+
+        for component in self._getComponents():
+            if component == None: continue
+            # its a simple element
+            elif isinstance(component, tuple): 
+                tag, content = component
+                if content == None: continue
+                # some elements are treated as boolean values; presence 
+                # of element, w/o text, is true
+                if type(content) == bool and content == False: 
+                    continue 
+                if type(content) == bool and content == True:
+                    yield (tag, None)
+                else:
+                    try:
+                        entry = unicode(content, errors='replace')
+                    except TypeError:
+                        entry = u"%s" % content
+                    yield (tag, entry)
+            elif isinstance(component, XMLNode): # its a XMLNode subclass
+                yield component
+            elif isinstance(component, list):
+                print(['cannot process component object', component])
+            else:
+                raise XMLNodeException(
+                    'cannot process component object: %s' % component)
+
+    def _writeXmlChild(self, writer, child, indent, addIndent, newl):
+        '''Write a child, as provided by _iterChildNodes(), to the writer.
+        '''
+        if isinstance(child, XMLNode):
+            child.writeXml(writer, indent, addIndent, newl)
+        elif isinstance(child, tuple):
+            tag, content = child
+            if content is None:
+                writer.write("%s<%s/>%s" % (indent, tag, newl))
+            else:
+                writer.write("%s<%s>" % (indent, tag))
+                xml.dom.minidom._write_data(writer, content)
+                writer.write("</%s>%s" % (tag, newl))
+        else: # character data
+            xml.dom.minidom._write_data(writer, "%s%s%s" % (indent, child, newl))
+
+    def writeXml(self, writer, indent=u'', addIndent=u'  ', newl=u'\n'):
+        '''Write this node, and all sub nodes, directly to `writer`, an open file-like object. No DOM is built: sub nodes are written as they are found and can then be discarded. 
+
+        The output is formatted identically to the pretty-printed output of :meth:`~music21.xmlnode.XMLNode.toxml`.
+
+        >>> from music21 import *
+        >>> import StringIO
+        >>> a = musicxml.Pitch()
+        >>> a.setDefaults()
+        >>> writer = StringIO.StringIO()
+        >>> a.writeXml(writer)
+        >>> print(writer.getvalue())
+        <pitch>
+          <step>C</step>
+          <octave>4</octave>
+        </pitch>
+        <BLANKLINE>
+        '''
+        writer.write(indent + "<" + self._tag)
+
+        attrs = {}
+        for name, value in self._getAttributes():
+            if value in [None, '']: continue
+            attrs[name] = str(value)
+        names = attrs.keys()
+        names.sort()
+        for name in names:
+            writer.write(" %s=\"" % name)
+            xml.dom.minidom._write_data(writer, attrs[name])
+            writer.write("\"")
+
+        # only the first two children need to be examined to select a format
+        children = self._iterChildNodes()
+        try:
+            first = children.next()
+        except StopIteration:
+            writer.write("/>%s" % newl)
+            return
+        try:
+            second = children.next()
+        except StopIteration:
+            second = None
+            
+        if second is None and common.isStr(first):
+            writer.write(">")
+            xml.dom.minidom._write_data(writer, first)
+            writer.write("</%s>%s" % (self._tag, newl))
+            return
+
+        writer.write(">%s" % newl)
+        subIndent = indent + addIndent
+        self._writeXmlChild(writer, first, subIndent, addIndent, newl)
+        if second is not None:
+            self._writeXmlChild(writer, second, subIndent, addIndent, newl)
+            for child in children:
+                self._writeXmlChild(writer, child, subIndent, addIndent, newl)
+        writer.write("%s</%s>%s" % (indent, self._tag, newl))
+
+    def xmlWrite(self, fileLike):
+        '''Write a complete, utf-8 encoded XML document to an open file-like object. The output is identical to that returned by :meth:`~music21.xmlnode.XMLNode.xmlStr`, but is written incrementally, without building a DOM or an output string.
+
+        >>> from music21 import *
+        >>> import StringIO
+        >>> a = musicxml.Score()
+        >>> a.setDefaults()
+        >>> fileLike = StringIO.StringIO()
+        >>> a.xmlWrite(fileLike)
+        >>> fileLike.getvalue() == a.xmlStr()
+        True
+        '''
+        newl = u'\n'
+        writer = codecs.lookup('utf-8')[3](fileLike)
+        writer.write('<?xml version="1.0" encoding="utf-8"?>%s' % newl)
+        if self._doctypeName != None:
+            writer.write("<!DOCTYPE ")
+            writer.write(self._doctypeName)
+            if self._doctypePublic:
+                writer.write("%s  PUBLIC '%s'%s  '%s'" % (newl, 
+                    self._doctypePublic, newl, self._doctypeSystem))
+            elif self._doctypeSystem:
+                writer.write("%s  SYSTEM '%s'" % (newl, self._doctypeSystem))
+            writer.write(">" + newl)
+        self.writeXml(writer, u'', u'  ', newl)
+
+
 
 class XMLNodeList(XMLNode):
     '''